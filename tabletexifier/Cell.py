@@ -5,38 +5,144 @@ Returns:
     _type_: _description_
 """
 
+from .formatting import format_LaTeX_number, format_text
+
+# Shared by all cells that never had a design property changed
+_DEFAULT_DESIGN_PROPERTIES = {
+    "color": None,
+    "fmt_type": "normal",
+    "left_border": False,
+    "right_border": False,
+}
+
 
 class Cell:
-    def __init__(self, content, origin, n_rows=1, n_cols=1, is_blank=False):
+    __slots__ = (
+        "origin",
+        "_content",
+        "dimension",
+        "_is_blank",
+        "_decimal_places",
+        "_design_properties",
+        "_responsible_for_borders",
+        "_store",
+        "_text",
+        "_LaTeX",
+        "_cache_key",
+    )
+
+    def __init__(
+        self, content, origin, n_rows=1, n_cols=1, is_blank=False, store=None
+    ):
         # Starting coordinates, in the upper-left corner of the cell
         self.origin = origin
-        self.content = content
+        self._content = content
         self.dimension = [n_rows, n_cols]
 
-        self.next_col = None
-        self.previous_col = None
-        self.next_row = None
-        self.previous_row = None
-        self.is_blank = is_blank
-        self._decimal_places = 2
+        self._is_blank = is_blank
+        # None follows the decimal places of the column, see decimal_places
+        self._decimal_places = None
         # number of cells
 
-        self._design_properties = {
-            "color": None,
-            "fmt_type": "normal",
-            "left_border": False,
-            "right_border": False,
-        }
+        # Only allocated once a property is changed, see set_property
+        self._design_properties = None
         self._responsible_for_borders = False
 
+        # Storage that holds this cell; used to find the neighbouring cells
+        self._store = store
+
+        # Cached outputs of generate_text and generate_LaTeX
+        self._text = None
+        self._LaTeX = None
+        self._cache_key = None
+
+    @property
+    def content(self):
+        return self._content
+
+    @content.setter
+    def content(self, value):
+        self._content = value
+        self._changed()
+
+    @property
+    def is_blank(self) -> bool:
+        return self._is_blank
+
+    @is_blank.setter
+    def is_blank(self, value: bool):
+        self._is_blank = value
+        self._changed()
+
+    def _neighbour(self, row_offset, col_offset):
+        if self._store is None:
+            return None
+        return self._store.neighbour(self.origin, row_offset, col_offset)
+
+    @property
+    def next_col(self):
+        return self._neighbour(0, 1)
+
+    @property
+    def previous_col(self):
+        return self._neighbour(0, -1)
+
+    @property
+    def next_row(self):
+        return self._neighbour(1, 0)
+
+    @property
+    def previous_row(self):
+        return self._neighbour(-1, 0)
+
+    @property
+    def decimal_places(self) -> int:
+        """Decimal places of this cell: its own, if they were set, otherwise the
+        ones of its column in the storage"""
+        if self._decimal_places is not None:
+            return self._decimal_places
+        if self._store is not None:
+            return self._store.decimal_places[self.origin[1]]
+        return 2
+
+    @property
+    def column_format(self):
+        """ColumnFormat of the column of this cell in the storage, if any"""
+        if self._store is None:
+            return None
+        return self._store.column_formats[self.origin[1]]
+
+    def _clear_cache(self):
+        self._text = None
+        self._LaTeX = None
+
+    def _cache_for(self, decimal_places: int, column_format):
+        """Drop the cached representations if they used other decimal places or
+        format (those of the column change without the cells being told)"""
+        key = (decimal_places, column_format)
+        if key != self._cache_key:
+            self._clear_cache()
+            self._cache_key = key
+
+    def _changed(self):
+        """Drop the cached representations of this cell and let the storage know
+        that they changed"""
+        self._clear_cache()
+        if self._store is not None:
+            self._store.cell_changed(*self.origin)
+
     def update_size(self, nrows=None, ncols=None):
         if nrows is not None:
             self.dimension[0] = nrows
         if ncols is not None:
             self.dimension[1] = ncols
+        self._changed()
 
     def set_decimal_places(self, value):
         self._decimal_places = value
+        if self._store is not None:
+            self._store.set_cell_decimal_places(*self.origin, value)
+        self._changed()
 
     def get_content(self, fmt: str = "text") -> str:
         if fmt == "text":
@@ -45,11 +151,21 @@ class Cell:
 
     @property
     def row_number(self) -> int:
-        return self.origin[0]
+        return self._position()[0]
 
     @property
     def col_number(self) -> int:
-        return self.origin[1]
+        return self._position()[1]
+
+    def _position(self) -> tuple:
+        """Position of the cell in its table: the origin is kept in the coordinates
+        of the storage, which is only a chunk of the table after Table.concat"""
+        row, col = self.origin
+        chunk_of = getattr(self._store, "chunk_of", None)
+        if chunk_of is not None:
+            _, row_shift, col_shift = chunk_of
+            row, col = row + row_shift, col + col_shift
+        return row, col
 
     @property
     def is_multirow(self) -> bool:
@@ -60,12 +176,18 @@ class Cell:
         return self.dimension[1] > 1
 
     def generate_text(self) -> str:
-        if self.is_blank:
-            return ""
-        val = self.content
-        if isinstance(val, (float, int)) and self._decimal_places is not None:
-            return "{:.{}f}".format(val, self._decimal_places)
-        return str(val)
+        decimal_places, column_format = self.decimal_places, self.column_format
+        self._cache_for(decimal_places, column_format)
+        text = self._text
+        if text is None:
+            if self._is_blank:
+                text = ""
+            elif column_format is not None:
+                text = column_format.text(self._content, decimal_places)
+            else:
+                text = format_text(self._content, decimal_places)
+            self._text = text
+        return text
 
     def generate_LaTeX(self) -> str:
         """Generate the LaTeX representation of this cell
@@ -74,24 +196,35 @@ class Cell:
             str: _description_
         """
 
-        if (
-            self.is_blank
-            and self.previous_row is not None
-            and self.previous_row.is_multirow
-            and self.previous_row.is_multicol
-        ):
-            return r"\multicolumn{" + str(self.previous_row.dimension[1]) + r"}{c}{}"
-
         if self.is_blank:
+            spans = None if self._store is None else self._store.spans
+            span = None if spans is None else spans.owner(*self.origin)
+            # The rows below the first one of a span over rows and columns need an
+            # empty multicolumn of the same width
+            if (
+                span is not None
+                and span.ncols > 1
+                and span.row < self.origin[0]
+                and span.col == self.origin[1]
+            ):
+                return r"\multicolumn{" + str(span.ncols) + r"}{c}{}"
             return ""
 
+        # Blank cells depend on their neighbours, so only the others are cached
+        decimal_places, column_format = self.decimal_places, self.column_format
+        self._cache_for(decimal_places, column_format)
+        if self._LaTeX is not None:
+            return self._LaTeX
+
         val = self.content
 
-        if isinstance(val, float):
-            val = round(val, self._decimal_places)
+        if column_format is not None:
+            val = column_format.LaTeX(val, decimal_places)
+        elif isinstance(val, float):
+            val = format_LaTeX_number(val, decimal_places)
 
-        if self._design_properties["color"] is not None:
-            val = "\textcolor{}{}".format(self._design_properties["color"], val)
+        if self.get_property("color") is not None:
+            val = "\textcolor{}{}".format(self.get_property("color"), val)
 
         if self.is_multirow:
             val = r"\multirow{" + str(self.dimension[0]) + r"}{*}{" + f"{val}" + "}"
@@ -99,13 +232,19 @@ class Cell:
         if self.is_multicol:
             val = r"\multicolumn{" + str(self.dimension[1]) + r"}{c}{" + f"{val}" + "}"
 
-        return str(val)
+        self._LaTeX = str(val)
+        return self._LaTeX
 
     def set_property(self, param, new_value):
+        if self._design_properties is None:
+            self._design_properties = dict(_DEFAULT_DESIGN_PROPERTIES)
         self._design_properties[param] = new_value
+        self._changed()
 
     def get_property(self, param):
-        pass
+        if self._design_properties is None:
+            return _DEFAULT_DESIGN_PROPERTIES[param]
+        return self._design_properties[param]
 
     def update_origin(self, new_origin):
         self.origin = new_origin
@@ -114,6 +253,45 @@ class Cell:
         return f"Cell with {self.content=}; {self.is_multicol=}, {self.is_multirow=}"
 
 
+class CellView(Cell):
+    """Cell that is created on demand from the contents of a compact storage.
+
+    The changes made through the view (its content, is_blank, size, decimal places
+    and design properties) are written back into the storage.
+    """
+
+    __slots__ = ()
+
+    @Cell.content.setter
+    def content(self, value):
+        self._content = value
+        self._clear_cache()
+        self._store.set_content(*self.origin, value)
+
+    @Cell.is_blank.setter
+    def is_blank(self, value: bool):
+        self._is_blank = value
+        self._clear_cache()
+        self._store.set_blank(*self.origin, value)
+
+    # The storage notifies the changes it is told about, so the view only clears
+    # its own cache
+    def update_size(self, nrows=None, ncols=None):
+        if nrows is not None:
+            self.dimension[0] = nrows
+        if ncols is not None:
+            self.dimension[1] = ncols
+        self._clear_cache()
+        self._store.update_size(*self.origin, nrows=nrows, ncols=ncols)
+
+    def set_property(self, param, new_value):
+        if self._design_properties is None:
+            self._design_properties = dict(_DEFAULT_DESIGN_PROPERTIES)
+        self._design_properties[param] = new_value
+        self._clear_cache()
+        self._store.set_property(*self.origin, param, new_value)
+
+
 if __name__ == "__main__":
     cell = Cell(ID=0, origin=[1, 1], n_cols=3, n_rows=3)
     print(cell)
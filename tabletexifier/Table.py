@@ -1,7 +1,46 @@
-from typing import List, Iterable
+from bisect import bisect_left
+from collections import Counter
+from contextlib import ExitStack, nullcontext
+from functools import lru_cache
+from tempfile import SpooledTemporaryFile
+from typing import Any, Callable, Dict, List, Iterable, Iterator, Tuple
 from tabletexifier.table_styles import Tlines, Alines, MNRAS, NoLines, AA
+from .backends import LaTeXBackend, TextBackend, export, get_backend
 from .Cell import Cell
 from .exceptions import CellNotFound, ColumnDoesNotExist, RowDoesNotExist
+from .formatting import ColumnFormat
+from .storage import ChunkedStore, ColumnStore, GridStore, MovedStore, cell_texts
+from .parallel import render_rows_in_parallel
+from .profiling import RenderStats
+from .readers import (
+    csv_column_kinds,
+    iter_csv_columns,
+    iter_numpy_columns,
+    numpy_columns,
+    read_csv_rows,
+    require_numpy,
+)
+from .snapshot import load as load_snapshot, restore, save as save_snapshot, snapshot
+from .writers import TableWriter
+
+
+def _merge_lines(positions: List[List[int]]) -> List[int]:
+    """Lines of the joined tables: where lines of different tables meet (e.g. at the
+    boundary between two of them), the most lines of any of them are kept"""
+    counts = Counter()
+    for locations in positions:
+        for loc, count in Counter(locations).items():
+            counts[loc] = max(counts[loc], count)
+    return sorted(counts.elements())
+
+
+@lru_cache(maxsize=32)
+def _plain_row_format(text_sizes: Tuple[int, ...]) -> Tuple[str, str]:
+    """Template of a text row without vertical lines, with each entry centered in
+    its column, and the matching horizontal line"""
+    template = " " + " ".join(f"{{:^{size}}}" for size in text_sizes) + " "
+    rule = "-" * (sum(text_sizes) + len(text_sizes))
+    return template, rule
 
 
 class Table:
@@ -12,13 +51,26 @@ class Table:
         - A&A --  Follows the format of the A&A journal
         - T -- vertical line after the first col and horizontal line after first row
         - NoLines --  No lines
+
+    With compact=True the contents are stored per column in typed arrays and the
+    Cell objects are only created when they are requested (e.g. by get_line or by
+    the renderers), which greatly reduces the memory used by large tables.
     """
 
     def __init__(
         self,
         header: Iterable[str],
         table_style: str = "A&A",
+        compact: bool = False,
     ):
+        self.ncols = len(header)
+        self._init_state(self._create_store(compact), table_style)
+        self._store.on_change = self._cell_changed
+        self.add_row(header)
+
+    def _init_state(self, store, table_style: str):
+        """Set up the style, cached outputs and column widths of a table around its
+        storage; shared by the tables and their views"""
         self.style_map = {
             "T": Tlines,
             "A": Alines,
@@ -27,20 +79,409 @@ class Table:
             "A&A": AA,
         }
 
+        self._table_style_name = table_style
         self._table_style = self.style_map[table_style]()
 
-        self._largest_entry = [len(str(head)) for head in header]
+        # Rendered outputs of get_pretty_print, keyed by
+        # (fmt, ignore_rows, table style, decimal places of the columns). The rendered rows are
+        # also kept, so that a table that only had new rows appended only needs to
+        # render its tail; see _generate_lines
+        self._render_cache = {}
+        self._row_cache = {}
+        # Increased whenever the cached outputs are dropped, so that the views of
+        # the table know when to drop theirs; see views.TableView
+        self._version = 0
 
-        # Number of decimal places in the numbers
-        self._decimal_places = 2
+        # Timings of the renderers; only recorded when enabled, see
+        # enable_render_stats
+        self.render_stats: RenderStats = None
 
-        self._tableCells = []
-        self.nrows = 0
-        self.ncols = len(header)
-        self.add_row(header)
+        self.ncols = store.ncols
+        self._store = store
+        self._table_style.spans = store.spans
+
+        # Length of the largest text entry of each column, kept up to date as the
+        # table changes. The columns in _stale_widths must be measured again
+        self._largest_entry = [0] * self.ncols
+        self._stale_widths = set(range(self.ncols)) if store.nrows else set()
+
+    def _create_store(self, compact: bool):
+        """Storage of a new table, with its number of columns already set"""
+        return ColumnStore(self.ncols) if compact else GridStore(self.ncols)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Iterable[Any]],
+        header: Iterable[str] = None,
+        table_style: str = "A&A",
+        compact: bool = False,
+    ) -> "Table":
+        """Build a table from a 2-D iterable, in a single pass
+
+        Args:
+            rows (Iterable[Iterable[Any]]): Rows, in the order of the header
+            header (Iterable[str], optional): Header of the table. If None, the first
+                row is used as the header. Defaults to None.
+            table_style (str, optional): Style of the table. Defaults to "A&A".
+            compact (bool, optional): Use the compact storage. Defaults to False.
+
+        Raises:
+            ValueError: If no header is given and there are no rows
+
+        Returns:
+            Table: The new table
+        """
+        rows = iter(rows)
+        if header is None:
+            header = next(rows, None)
+            if header is None:
+                raise ValueError("Can't build a Table without a header")
+        table = cls(list(header), table_style=table_style, compact=compact)
+        table._extend_rows(rows)
+        return table
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Dict[str, Iterable[Any]],
+        table_style: str = "A&A",
+        compact: bool = False,
+    ) -> "Table":
+        """Build a table from a dictionary of columns, in a single pass
+
+        Args:
+            columns (Dict[str, Iterable[Any]]): Maps the name of each column (used as
+                header) to its values. All columns must have the same length.
+            table_style (str, optional): Style of the table. Defaults to "A&A".
+            compact (bool, optional): Use the compact storage. Defaults to False.
+
+        Returns:
+            Table: The new table
+        """
+        table = cls(list(columns), table_style=table_style, compact=compact)
+        table._extend_columns([list(values) for values in columns.values()])
+        return table
+
+    @classmethod
+    def from_numpy(
+        cls,
+        data,
+        header: Iterable[str] = None,
+        table_style: str = "A&A",
+        compact: bool = False,
+        chunksize: int = 100_000,
+    ) -> "Table":
+        """Build a table from a 2-D numpy array or from a 1-D structured array
+
+        With compact=True the numeric columns are not copied: the table keeps a
+        reference to (a view of) the array, which must not be changed afterwards.
+
+        Args:
+            data (numpy.ndarray): The data of the table
+            header (Iterable[str], optional): Header of the table. If None, uses the
+                field names of a structured array. Defaults to None.
+            table_style (str, optional): Style of the table. Defaults to "A&A".
+            compact (bool, optional): Use the compact storage. Defaults to False.
+            chunksize (int, optional): Number of rows converted at once into Cells,
+                if compact is False. Defaults to 100_000.
+
+        Raises:
+            ValueError: If the array does not have the right shape, or if there is
+                no header
+
+        Returns:
+            Table: The new table
+        """
+        names = data.dtype.names
+        if names is not None:
+            if data.ndim != 1:
+                raise ValueError("Structured arrays must be one-dimensional")
+            ncols = len(names)
+        elif data.ndim == 2:
+            ncols = data.shape[1]
+        else:
+            raise ValueError(f"Expected a 2-D array, got {data.ndim} dimensions")
+
+        if header is None:
+            if names is None:
+                raise ValueError("A header is needed for non-structured arrays")
+            header = names
+        header = list(header)
+        if len(header) != ncols:
+            raise ValueError(
+                f"The header has {len(header)} entries, but there are "
+                f"{ncols} columns"
+            )
+
+        table = cls(header, table_style=table_style, compact=compact)
+        if compact:
+            table._extend_columns(numpy_columns(data))
+            return table
+        for columns in iter_numpy_columns(data, chunksize):
+            # tolist converts the numpy scalars into the python types
+            table._extend_columns([values.tolist() for values in columns])
+        return table
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        dataframe,
+        index: bool = False,
+        table_style: str = "A&A",
+        compact: bool = False,
+    ) -> "Table":
+        """Build a table from a pandas DataFrame, using its columns as header
+
+        Args:
+            dataframe (pandas.DataFrame): The data of the table
+            index (bool, optional): Add the index of the DataFrame as the first
+                column. Defaults to False.
+            table_style (str, optional): Style of the table. Defaults to "A&A".
+            compact (bool, optional): Use the compact storage. Defaults to False.
+
+        Returns:
+            Table: The new table
+        """
+        header = [str(name) for name in dataframe.columns]
+        columns = [
+            dataframe.iloc[:, col].tolist() for col in range(dataframe.shape[1])
+        ]
+        if index:
+            name = dataframe.index.name
+            header.insert(0, "" if name is None else str(name))
+            columns.insert(0, dataframe.index.tolist())
+
+        table = cls(header, table_style=table_style, compact=compact)
+        table._extend_columns(columns)
+        return table
+
+    @classmethod
+    def from_csv(
+        cls,
+        path,
+        header=None,
+        chunksize: int = 10_000,
+        parse_numbers: bool = True,
+        table_style: str = "A&A",
+        compact: bool = True,
+        **fmtparams,
+    ) -> "Table":
+        """Build a table from a CSV file, read in chunks of rows
+
+        Each chunk is converted into columns and added to the (by default, compact)
+        storage at once. To find which columns hold numbers, the file is read twice:
+        a column is only parsed as numbers if all of its entries are numbers.
+
+        Args:
+            path: Path of the file
+            header (optional): Header of the table. True uses the first row of the
+                file; a list of names is used for a file without header row. Defaults
+                to None, to detect if the first row is a header (with csv.Sniffer).
+            chunksize (int, optional): Number of rows read at once. Defaults to 10_000.
+            parse_numbers (bool, optional): Convert the columns where all entries
+                (of the whole file) are numbers into int/float. Defaults to True.
+            table_style (str, optional): Style of the table. Defaults to "A&A".
+            compact (bool, optional): Use the compact storage. Defaults to True.
+            **fmtparams: Passed to csv.reader
+
+        Returns:
+            Table: The new table
+        """
+        with open(path, newline="") as file:
+            names, rows = read_csv_rows(file, header, **fmtparams)
+            table = cls(names, table_style=table_style, compact=compact)
+            kinds = None
+            if parse_numbers:
+                # The type of each column is found over the whole file first, so
+                # that it does not depend on the chunks
+                kinds = csv_column_kinds(rows, chunksize, table.ncols)
+                file.seek(0)
+                _, rows = read_csv_rows(file, header, **fmtparams)
+            for columns in iter_csv_columns(rows, chunksize, table.ncols, kinds):
+                table._extend_columns(columns)
+        return table
+
+    @classmethod
+    def from_npy(
+        cls,
+        path,
+        header: Iterable[str] = None,
+        mmap: bool = True,
+        chunksize: int = 100_000,
+        table_style: str = "A&A",
+        compact: bool = True,
+    ) -> "Table":
+        """Build a table from a .npy file with a 2-D or structured array (needs numpy)
+
+        With the (default) compact storage, the table references the columns of the
+        memory-mapped file, so the data is only read once it is rendered.
+
+        Args:
+            path: Path of the file
+            header (Iterable[str], optional): Header of the table. If None, uses the
+                field names of a structured array. Defaults to None.
+            mmap (bool, optional): Memory-map the file instead of loading it. Defaults to True.
+            chunksize (int, optional): Number of rows converted at once, if compact
+                is False. Defaults to 100_000.
+            table_style (str, optional): Style of the table. Defaults to "A&A".
+            compact (bool, optional): Use the compact storage. Defaults to True.
+
+        Raises:
+            ValueError: If the array does not have the right shape, or if there is
+                no header
+
+        Returns:
+            Table: The new table
+        """
+        np = require_numpy()
+        data = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+        return cls.from_numpy(
+            data,
+            header=header,
+            table_style=table_style,
+            compact=compact,
+            chunksize=chunksize,
+        )
+
+    @classmethod
+    def concat(cls, tables: Iterable["Table"], axis: int = 0) -> "Table":
+        """Join tables along their rows (axis=0) or their columns (axis=1)
+
+        The storages of the tables become the chunks of the new table, so no cell is
+        copied and the time grows with the number of tables (and of their spans),
+        not with the number of cells. The tables are moved into the new one: using
+        them afterwards raises a TypeError.
+
+        The header (for axis=0), style, caption, label, decimal places and formats
+        of the columns come from the first table. The lines added to each table are
+        kept; the ones that meet at the boundary between two tables are merged.
+
+        Args:
+            tables (Iterable[Table]): The tables, all compact or all non-compact
+            axis (int, optional): 0 to stack the rows of the tables (which need the
+                same number of columns), 1 to place their columns side by side
+                (which needs the same number of rows). Defaults to 0.
+
+        Raises:
+            ValueError: If the tables can't be joined along the axis
+            TypeError: If one of the tables is a view or a rolling table, or was
+                already moved into another table
+
+        Returns:
+            Table: The new table
+        """
+        if axis not in (0, 1):
+            raise ValueError(f"Unknown axis: {axis}")
+        tables = list(tables)
+        if not tables:
+            raise ValueError("Need at least one table to concatenate")
+
+        chunks = []
+        seen = set()
+        for table in tables:
+            store = table._store
+            if isinstance(store, MovedStore):
+                raise TypeError(store.message)
+            if not isinstance(store, (GridStore, ColumnStore, ChunkedStore)):
+                raise TypeError("Views and rolling tables can't be concatenated")
+            if id(store) in seen:
+                raise ValueError("A table can only be concatenated once")
+            seen.add(id(store))
+            if axis == 0 and table.ncols != tables[0].ncols:
+                raise ValueError("All tables need the same number of columns")
+            if axis == 1 and table.nrows != tables[0].nrows:
+                raise ValueError("All tables need the same number of rows")
+
+            # The coordinates of a table are those of its first chunk
+            spans = list(store.spans)
+            if isinstance(store, ChunkedStore):
+                if store.axis != axis:
+                    store.consolidate()
+                stores = store.chunks
+            else:
+                stores = [store]
+            chunks.append((stores[0], spans))
+            chunks.extend((store, []) for store in stores[1:])
+
+        if len({type(store) for store, _ in chunks}) > 1:
+            raise ValueError("Can't concatenate compact and non-compact tables")
+
+        first = tables[0]
+        if axis == 0:
+            header = [cell.content for cell in first._store.get_row(0)]
+        else:
+            header = [
+                cell.content for table in tables for cell in table._store.get_row(0)
+            ]
+        joined = cls(header, table_style=first._table_style_name)
+        joined._use_store(ChunkedStore(chunks, axis))
+
+        hlines, vlines = [], []
+        start = 0
+        for index, table in enumerate(tables):
+            style = table._table_style
+            if axis == 0:
+                # The header of the tables after the first one is left out
+                shift = start - (0 if index == 0 else 1)
+                hlines.append([max(loc + shift, start) for loc in style.extra_hline])
+                vlines.append(list(style.extra_vline))
+                start += table.nrows - (0 if index == 0 else 1)
+            else:
+                hlines.append(list(style.extra_hline))
+                vlines.append([loc + start for loc in style.extra_vline])
+                start += table.ncols
+
+        style = joined._table_style
+        style.table_properties = dict(first._table_style.table_properties)
+        style.extra_hline = _merge_lines(hlines)
+        style.extra_vline = _merge_lines(vlines)
+
+        # The cells now belong to the new table, so the tables must not change them
+        moved = MovedStore(
+            "This table was moved into another one by Table.concat, use that one"
+        )
+        for table in tables:
+            table._store = moved
+            table._invalidate_render_cache()
+        return joined
+
+    def _use_store(self, store):
+        """Replace the storage of the table (with the same number of columns)"""
+        self._store = store
+        self._store.on_change = self._cell_changed
+        self._table_style.spans = self._store.spans
+        self._stale_widths.update(range(self.ncols))
+        self._invalidate_render_cache()
+
+    def _extend_rows(self, rows: Iterable[Iterable[Any]]):
+        self._store.extend_rows(rows)
+        self._stale_widths.update(range(self.ncols))
+        self._render_cache.clear()
+        self._version += 1
+
+    def _extend_columns(self, columns: List[List[Any]]):
+        self._store.extend_columns(columns)
+        self._stale_widths.update(range(self.ncols))
+        self._render_cache.clear()
+        self._version += 1
+
+    def _cell_changed(self, row: int, col: int):
+        """Called by the storage whenever the representation of a cell changes"""
+        self._stale_widths.add(col)
+        self._invalidate_render_cache()
+
+    def _invalidate_render_cache(self):
+        """Drop all cached outputs, including the rendered rows"""
+        self._render_cache.clear()
+        self._row_cache.clear()
+        self._version += 1
 
     def update_table_style(self, new_style):
         self._table_style = self.style_map[new_style]()
+        self._table_style_name = new_style
+        self._table_style.spans = self._store.spans
+        self._invalidate_render_cache()
 
     def add_table_caption(self, caption: str):
         self._table_style.set_LaTeX_property("caption", caption)
@@ -50,36 +491,145 @@ class Table:
 
     def add_vline(self, loc):
         self._table_style.add_vline(loc)
+        self._invalidate_render_cache()
 
     def add_hline(self, loc):
         self._table_style.add_hline(loc)
+        self._invalidate_render_cache()
 
     def add_row(self, row, multirow=None, multicol=None):
         """
         Adds a new row to the table; Assumes that the order is the same as the one given in the header
         """
-        previous = None
-        for index, val in enumerate(row):
-            new_cell = Cell(content=val, origin=[self.nrows, index])
-            new_cell.previous_col = previous
-            previous = new_cell
-            self._tableCells.append(new_cell)
-
-        newly_added_cells = self._tableCells[-len(row) :]
-        # Make the links for the next column
-        for index, cell in enumerate(
-            newly_added_cells[:-1]
-        ):  # the last col does not have a "next_col"
-            cell.next_col = newly_added_cells[index + 1]
-
-        if self.nrows > 0:
-            # Make the links for the previous row
-            prev_row = self.get_line(self.nrows - 1)
-            for upper, lower in zip(prev_row, newly_added_cells):
-                upper.next_row = lower
-                lower.previous_row = upper
-
-        self.nrows += 1
+        self._store.append_row(row)
+        self._render_cache.clear()
+        self._version += 1
+
+        largest = self._largest_entry
+        new_cells = self._store.get_row(self.nrows - 1)[: self.ncols]
+        for col, cell in enumerate(new_cells):
+            largest[col] = max(largest[col], len(cell.generate_text()))
+
+    def insert_rows(self, index: int, rows: Iterable[Iterable[Any]]):
+        """Insert rows before the row with the given (zero-indexed, counting the
+        header) index
+
+        Spans that include the row above the new ones grow over them, and the
+        horizontal lines stay below the same rows.
+
+        Args:
+            index (int): Position of the first new row, between 1 and nrows
+            rows (Iterable[Iterable[Any]]): The new rows
+
+        Raises:
+            RowDoesNotExist: If the index is outside the table
+            ValueError: If a row does not have one entry per column
+        """
+        if not isinstance(index, int) or not 1 <= index <= self.nrows:
+            raise RowDoesNotExist(f"Can't insert rows on row {index}")
+        rows = [list(values) for values in rows]
+        for values in rows:
+            if len(values) != self.ncols:
+                raise ValueError(
+                    f"Expected a row with {self.ncols} entries, got {len(values)}"
+                )
+        if not rows:
+            return
+
+        n_rows = len(rows)
+        mapping = [row if row < index else row + n_rows for row in range(self.nrows)]
+        spans, released = self._store.spans.remap_rows(mapping, stretch=True)
+        self._store.insert_rows(index, rows)
+        self._rows_moved(spans, released)
+        self._table_style.move_hlines(lambda loc: loc + n_rows if loc > index else loc)
+
+    def delete_rows(self, rows: Iterable[int]):
+        """Remove rows from the table
+
+        Spans lose the rows that are removed (and are removed with the row of their
+        first cell), and the horizontal lines move up with the rows above them.
+
+        Args:
+            rows (Iterable[int]): Zero-indexed rows (counting the header) to remove
+
+        Raises:
+            RowDoesNotExist: If one of the rows does not exist
+            ValueError: If the header is one of the rows
+        """
+        rows = set(rows)
+        for row in rows:
+            if not isinstance(row, int) or not 0 <= row < self.nrows:
+                raise RowDoesNotExist(f"Row {row} does not exist")
+        if 0 in rows:
+            raise ValueError("The header can't be removed")
+        self._take_rows([row for row in range(self.nrows) if row not in rows])
+
+    def filter(self, predicate: Callable[[List[Any]], bool]):
+        """Keep only the rows for which the predicate is True; see delete_rows
+
+        Args:
+            predicate (Callable[[List[Any]], bool]): Called with the contents of
+                each row (without the header)
+        """
+        columns = [self._store.get_values(col) for col in range(self.ncols)]
+        self._take_rows(
+            [0]
+            + [
+                row
+                for row, values in enumerate(zip(*columns), start=1)
+                if predicate(list(values))
+            ]
+        )
+
+    def sort_by(self, column: int, key: Callable = None, reverse: bool = False):
+        """Sort the rows (without the header) by the contents of one column. The sort
+        is stable, and the horizontal lines keep their position
+
+        Args:
+            column (int): Zero-indexed column
+            key (Callable, optional): Applied to the contents before they are
+                compared. Defaults to None.
+            reverse (bool, optional): Sort in descending order. Defaults to False.
+
+        Raises:
+            ColumnDoesNotExist: If the column does not exist
+            ValueError: If the rows of a span would be separated
+        """
+        (column,) = self._check_columns([column])
+        values = self._store.get_values(column)
+        if key is not None:
+            values = [key(value) for value in values]
+        order = sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+        self._take_rows([0] + [row + 1 for row in order], move_hlines=False)
+
+    def _take_rows(self, order: List[int], move_hlines: bool = True):
+        """Keep only the rows in order, in that order (the header must be first)"""
+        mapping = [None] * self.nrows
+        for new, old in enumerate(order):
+            mapping[old] = new
+        # Checked before anything changes
+        spans, released = self._store.spans.remap_rows(mapping)
+
+        self._store.take_rows(order)
+        self._rows_moved(spans, released)
+        if move_hlines:
+            # Number of rows that are kept above each line
+            self._table_style.move_hlines(lambda loc: bisect_left(order, loc))
+
+    def _rows_moved(self, spans, released):
+        """Update the spans, widths and caches after the rows were moved"""
+        self._store.spans.reset(spans)
+        for row, col in released:
+            self._store.set_blank(row, col, is_blank=False)
+        for span in spans:
+            for row, col in span.cells():
+                if (row, col) != (span.row, span.col):
+                    self._store.set_blank(row, col)
+            self._store.update_size(
+                span.row, span.col, nrows=span.nrows, ncols=span.ncols
+            )
+        self._stale_widths.update(range(self.ncols))
+        self._invalidate_render_cache()
 
     def get_line(self, line_number) -> List[Cell]:
         """
@@ -90,17 +640,7 @@ class Table:
         line_number: int
             Line number to print; Zero-indexed; Does not count the header!!!
         """
-        line = []
-        first_cell = self._tableCells[0]
-        while first_cell.row_number != line_number:
-            first_cell = first_cell.next_row
-            if first_cell is None:
-                raise RowDoesNotExist(f"Row {line_number} does not exist")
-
-        while first_cell is not None:
-            line.append(first_cell)
-            first_cell = first_cell.next_col
-        return line
+        return list(self._store.get_row(line_number))
 
     def get_column(self, column_number: int) -> List[Cell]:
         """Get a column through a zero-indexed index
@@ -114,30 +654,22 @@ class Table:
         Returns:
             List[Cell]: List with Cell objects
         """
-        col = []
-
-        first_cell = self._tableCells[0]
-        while first_cell.col_number != column_number:
-            first_cell = first_cell.next_col
-            if first_cell is None:
-                raise ColumnDoesNotExist(f"Column {column_number} does not exist")
+        return self._store.get_column(column_number)
 
-        while first_cell is not None:
-            col.append(first_cell)
-            first_cell = first_cell.next_row
-        return col
-
-    def compute_max_text_size_of_cols(self) -> List[int]:
+    def compute_max_text_size_of_cols(self, widths: List[int] = None) -> List[int]:
         """Find the maximum text size that we will need for each column to esure formatted outputs in the terminal
 
+        Args:
+            widths (List[int], optional): Length of the largest entry of each column.
+                Defaults to None, to use the contents of the table.
+
         Returns:
             List[int]: List with max size of each column
         """
+        if widths is None:
+            widths = self.get_column_widths()
         text_sizes = []
-        for col_number in range(self.N_columns):
-            col = self.get_column(col_number)
-            col_size = [len(i.generate_text()) for i in col]
-            max_size = max(col_size)
+        for max_size in widths:
             if not max_size % 2 == 0:
                 max_size += 1
 
@@ -145,182 +677,667 @@ class Table:
             text_sizes.append(max_size)
         return text_sizes
 
+    def get_column_widths(self) -> List[int]:
+        """Length of the largest text entry in each column
+
+        The widths are tracked as the table changes, so this only measures the
+        columns that changed in some other way (e.g. new decimal places)
+
+        Returns:
+            List[int]: Largest text length of each column
+        """
+        for col in self._stale_widths:
+            self._largest_entry[col] = self._store.column_width(col)
+        self._stale_widths.clear()
+        return list(self._largest_entry)
+
     def get_cell_with_pos(self, row_number, col_number) -> Cell:
-        row = self.get_line(row_number)
-        found = False
-        for entry in row:
-            if entry.col_number == col_number:
-                found = True
-                break
-        if not found:
-            raise CellNotFound(f"Did not found a cell on {row_number=}, {col_number=}")
-        return entry
+        return self._store.get_cell(row_number, col_number)
 
-    def set_cell_as_multi_row(self, start_row, start_col, number_of_rows):
-        """Set one cell as multi-row
+    def view(self, rows=None, cols: Iterable[int] = None, table_style: str = None):
+        """Read-only view of some rows and columns of the table
+
+        The view shares the cells of this table (nothing is copied, so it is cheap
+        to create) and renders through the same text and LaTeX paths. It shows the
+        current contents of the table, but has a style of its own, starting as a
+        copy of the style of this table.
 
         Args:
-            start_row (_type_): _description_
-            start_col (_type_): _description_
-            number_of_rows (_type_): _description_
+            rows (optional): Zero-indexed rows, as a slice or an iterable. The header
+                (row 0) is always the first row of the view. Defaults to None, for
+                all rows.
+            cols (Iterable[int], optional): Zero-indexed columns, in the order they
+                are shown. Defaults to None, for all columns.
+            table_style (str, optional): Style of the view. Defaults to None, to use
+                the style of this table.
+
+        Raises:
+            RowDoesNotExist: If one of the rows does not exist
+            ColumnDoesNotExist: If one of the columns does not exist
+            ValueError: If the view shows only part of a multi-row/multi-column cell
+
+        Returns:
+            TableView: The view
         """
-        cell = self.get_cell_with_pos(start_row, start_col)
-        next_cell = cell.next_row
+        from .views import TableView
 
-        for _ in range(number_of_rows):
-            next_cell.is_blank = True
-            next_cell = next_cell.next_row
+        return TableView(self, rows=rows, cols=cols, table_style=table_style)
 
-        cell.update_size(nrows=1 + number_of_rows)
+    def _without_columns(self, ignore_cols: Iterable[int]) -> "Table":
+        if not ignore_cols:
+            return self
+        ignore_cols = set(self._check_columns(ignore_cols))
+        return self.view(cols=[c for c in range(self.ncols) if c not in ignore_cols])
 
-    def set_cell_as_multi_col(self, start_row, start_col, number_of_cols):
+    def set_cell_as_multi_row(self, start_row, start_col, number_of_rows):
         """Set one cell as multi-row
 
         Args:
-            start_row (_type_): _description_
-            start_col (_type_): _description_
-            number_of_rows (_type_): _description_
+            start_row (int): Row of the cell
+            start_col (int): Column of the cell
+            number_of_rows (int): Number of rows below the cell that it also covers
+
+        Raises:
+            CellNotFound: If the span goes beyond the table
+            OverlappingSpans: If the span covers a cell of another span
         """
-        cell = self.get_cell_with_pos(start_row, start_col)
-        next_cell = cell.next_col
+        span = self._store.spans.owner(start_row, start_col)
+        ncols = span.ncols if span is not None else 1
+        self._add_span(start_row, start_col, 1 + number_of_rows, ncols)
+
+    def set_cell_as_multi_col(self, start_row, start_col, number_of_cols):
+        """Set one cell as multi-column
+
+        Args:
+            start_row (int): Row of the cell
+            start_col (int): Column of the cell
+            number_of_cols (int): Number of columns to the right of the cell that it
+                also covers
 
-        for _ in range(number_of_cols):
-            next_cell.is_blank = True
-            next_cell = next_cell.next_col
+        Raises:
+            CellNotFound: If the span goes beyond the table
+            OverlappingSpans: If the span covers a cell of another span
+        """
+        span = self._store.spans.owner(start_row, start_col)
+        nrows = span.nrows if span is not None else 1
+        self._add_span(start_row, start_col, nrows, 1 + number_of_cols)
 
-        cell.update_size(ncols=1 + number_of_cols)
+    def _add_span(self, row: int, col: int, nrows: int, ncols: int):
+        """Make the cell cover a rectangle of nrows x ncols cells; the other cells of
+        the rectangle become blank. Calling this on a cell that already has a span
+        resizes it (e.g. to span over both rows and columns)"""
+        if not (
+            0 <= row
+            and row + nrows <= self.nrows
+            and 0 <= col
+            and col + ncols <= self.ncols
+        ):
+            raise CellNotFound(
+                f"A span of {nrows}x{ncols} cells on {row=}, {col=} goes beyond the "
+                f"table, with {self.nrows} rows and {self.ncols} columns"
+            )
+        covered, released = self._store.spans.add(row, col, nrows, ncols)
+        for cell in covered:
+            self._store.set_blank(*cell)
+        for cell in released:
+            self._store.set_blank(*cell, is_blank=False)
+        self._store.update_size(row, col, nrows=nrows, ncols=ncols)
 
-    def get_pretty_print(self, ignore_rows, fmt="text") -> List[str]:
+    def get_pretty_print(self, ignore_rows, fmt="text", workers: int = None) -> str:
         """Generate the textual representation of the table, under a given format
 
         Args:
-            ignore_cols (_type_): _description_
+            ignore_rows (int): Number of rows, from the top, that are not shown
+            fmt (str, optional): Which format to use, between text and LaTeX. Defaults to "text".
+            workers (int, optional): Render the rows in a pool with this number of workers. Defaults to None.
+
+        Returns:
+            str: The lines of the table
+        """
+        self._check_render_arguments(fmt, ignore_rows)
+        if self.render_stats is None:
+            return self._get_pretty_print(ignore_rows, fmt, workers)
+        with self.render_stats.phase("get_pretty_print"):
+            return self._get_pretty_print(ignore_rows, fmt, workers)
+
+    def _get_pretty_print(self, ignore_rows, fmt: str, workers: int) -> str:
+        stats = self.render_stats
+        key = (
+            fmt,
+            int(ignore_rows),
+            self._table_style_name,
+            tuple(self._store.decimal_places),
+        )
+        output = self._render_cache.get(key)
+        if stats is not None:
+            stats.count("render_cache_hits" if output else "render_cache_misses")
+        if output is not None:
+            return output
+
+        # The parallel renderer does not go through the cache of rendered rows
+        row_cache = None if workers else self._row_cache.setdefault(key, {})
+        lines = self._generate_lines(
+            fmt, ignore_rows, row_cache=row_cache, workers=workers
+        )
+        if stats is None:
+            output = "\n".join(lines)
+        else:
+            # The rows can only be instrumented when they are rendered in here
+            with (
+                stats.phase("rows")
+                if workers
+                else stats.instrument(self, self.nrows - int(ignore_rows))
+            ):
+                lines = list(lines)
+            with stats.phase("join"):
+                output = "\n".join(lines)
+        self._render_cache[key] = output
+        return output
+
+    def _phase(self, name: str):
+        """Context manager that times a phase of the renderers, if enabled"""
+        if self.render_stats is None:
+            return nullcontext()
+        return self.render_stats.phase(name)
+
+    def enable_render_stats(self) -> RenderStats:
+        """Start recording the time and number of calls of each phase of the
+        renderers (get_pretty_print and build_latex)
+
+        Returns:
+            RenderStats: The object where the timings are stored
+        """
+        if self.render_stats is None:
+            self.render_stats = RenderStats()
+        return self.render_stats
+
+    def disable_render_stats(self):
+        """Stop recording the timings of the renderers"""
+        self.render_stats = None
+
+    def iter_lines(
+        self,
+        fmt: str = "text",
+        ignore_rows: int = 0,
+        workers: int = None,
+        widths: List[int] = None,
+    ) -> Iterator[str]:
+        """Generate the lines of the table one at a time (row separators and contents)
+
+        Joining the lines with a newline gives the output of get_pretty_print, but
+        the full output never has to be held in memory.
+
+        Args:
             fmt (str, optional): Which format to use, between text and LaTeX. Defaults to "text".
+            ignore_rows (int, optional): Number of rows, from the top, that are not shown. Defaults to 0.
+            workers (int, optional): Render the rows in a pool with this number of workers. Defaults to None.
+            widths (List[int], optional): Length of the largest entry of each column. Defaults to None,
+                to use the contents of the table.
+
+        Raises:
+            ValueError: If the format is unknown or there are not enough rows
 
         Returns:
-            List[str]: _description_
+            Iterator[str]: The lines, without the trailing newline
         """
+        self._check_render_arguments(fmt, ignore_rows)
+        return self._generate_lines(fmt, ignore_rows, workers=workers, widths=widths)
+
+    def _check_render_arguments(self, fmt: str, ignore_rows: int):
+        if fmt not in ("text", "LaTeX"):
+            raise ValueError(f"Unknown format: {fmt}")
         if ignore_rows > self.nrows:
             raise ValueError("Can't ignore more than the available rows")
 
-        text_sizes = self.compute_max_text_size_of_cols()
-        lines = []
-        self._table_style.set_size(rows=self.nrows - ignore_rows, cols=self.N_columns)
-        for row_index in range(self.nrows):
-            if row_index < ignore_rows:
-                continue
-            if fmt == "text":
-                row = [i.generate_text() for i in self.get_line(row_index)]
-            elif fmt == "LaTeX":
-                row = [i.generate_LaTeX() for i in self.get_line(row_index)]
-
-            line = ""
-            row_separator = ""
-            for col_index, col_value in enumerate(row):
-                cell = self.get_cell_with_pos(
-                    row_number=row_index, col_number=col_index
-                )
-                max_size = text_sizes[col_index]
-                padding = " " * (int((max_size - len(col_value)) / 2))
+    def _generate_lines(
+        self,
+        fmt: str,
+        ignore_rows: int,
+        row_cache: dict = None,
+        workers: int = None,
+        widths: List[int] = None,
+    ) -> Iterator[str]:
+        """Generate the lines of the table
 
-                entry = f"{padding}{col_value}"
-                entry += " " * (max_size - len(entry))
-                col_sep = self._table_style.get_col_separation(
-                    row_number=row_index, col_number=col_index, cell=cell, fmt=fmt
-                )
-                row_sep = self._table_style.get_row_separation(
-                    row_number=row_index,
-                    col_number=col_index,
-                    col_size=max_size,
-                    cell=cell,
-                    fmt=fmt,
-                )
+        If a row_cache is given, the rendered rows are stored in (and re-used from)
+        it. A rendered row stays valid while the column widths and vertical lines
+        are the same, and while its horizontal lines did not move (e.g. the rule
+        at the bottom of the table, once new rows are added).
+
+        With more than one worker, the rows are rendered by render_rows_in_parallel
+        and the row_cache is not used.
+        """
+        with self._phase("widths"):
+            text_sizes = self.compute_max_text_size_of_cols(widths)
+        with self._phase("layout"):
+            self._table_style.set_size(
+                rows=self.nrows - ignore_rows, cols=self.N_columns
+            )
+            self._table_style.compile_layout()
+
+        if workers is not None and workers > 1:
+            rendered_rows = render_rows_in_parallel(
+                self, fmt, ignore_rows, text_sizes, workers
+            )
+        else:
+            rendered_rows = self._iter_rendered_rows(
+                fmt, ignore_rows, text_sizes, row_cache
+            )
+        for lines in rendered_rows:
+            for line in lines:
+                if line:
+                    yield line
 
-                line = f"{line}{col_sep}{entry}"
-                row_separator = f"{row_separator}{row_sep}"
-            col_sep = self._table_style.get_col_separation(
-                row_number=row_index, col_number=self.ncols, cell=cell, fmt=fmt
+        if ignore_rows < self.nrows:
+            # grab the last line of the table
+            line = self._render_closing_line(text_sizes, fmt)
+            if line:
+                yield line
+
+    def _iter_rendered_rows(
+        self, fmt: str, ignore_rows: int, text_sizes: List[int], row_cache: dict
+    ) -> Iterator[List[str]]:
+        """Render the rows of the table one at a time, see _generate_lines"""
+        if row_cache is None:
+            for row_index in range(ignore_rows, self.nrows):
+                yield self._render_row(row_index, text_sizes, fmt)
+            return
+
+        style = self._table_style
+        layout = (tuple(text_sizes), style.vline_set)
+        if row_cache.get("layout") != layout:
+            row_cache.clear()
+            row_cache["layout"] = layout
+        rendered_rows = row_cache.setdefault("rows", {})
+        hline_counts = style.hline_counts
+
+        for row_index in range(ignore_rows, self.nrows):
+            row_key = (
+                hline_counts.get(row_index, 0),
+                hline_counts.get(row_index + 1, 0),
+                row_index == style.nrows,
             )
-            line = f"{line}{col_sep}"
-            dup, n_times = self._table_style.check_if_duplicate_row(row_index)
-            if not dup:
-                n_times = 1
-            for _ in range(n_times):
-                lines.append(row_separator)
-
-            lines.append(line)
-        # grab the last line of the table
+            cached = rendered_rows.get(row_index)
+            if cached is None or cached[0] != row_key:
+                cached = (row_key, self._render_row(row_index, text_sizes, fmt))
+                rendered_rows[row_index] = cached
+            yield cached[1]
+
+    def _render_row(
+        self,
+        row_index: int,
+        text_sizes: List[int],
+        fmt: str,
+        cells: List[Cell] = None,
+        style=None,
+    ) -> List[str]:
+        """Render one row: the row separators above it, followed by its contents
+
+        The cells of the row and the (sized) style are taken from the table, unless
+        they are given, e.g. by the backends
+        """
+        if style is None:
+            style = self._table_style
+        if fmt == "text" and not style.vline_set:
+            return self._render_plain_row(row_index, text_sizes, cells, style)
+
+        row = self._row_texts(row_index, fmt, cells)
+
+        line = ""
         row_separator = ""
+        cell = None
         for col_index, col_value in enumerate(row):
-            row_sep = self._table_style.get_row_separation(
+            if cells is not None:
+                cell = cells[col_index]
+            max_size = text_sizes[col_index]
+            padding = " " * (int((max_size - len(col_value)) / 2))
+
+            entry = f"{padding}{col_value}"
+            entry += " " * (max_size - len(entry))
+            col_sep = style.get_col_separation(
+                row_number=row_index, col_number=col_index, cell=cell, fmt=fmt
+            )
+            row_sep = style.get_row_separation(
+                row_number=row_index,
+                col_number=col_index,
+                col_size=max_size,
+                cell=cell,
+                fmt=fmt,
+            )
+
+            line = f"{line}{col_sep}{entry}"
+            row_separator = f"{row_separator}{row_sep}"
+        col_sep = style.get_col_separation(
+            row_number=row_index, col_number=self.ncols, cell=cell, fmt=fmt
+        )
+        line = f"{line}{col_sep}"
+        dup, n_times = style.check_if_duplicate_row(row_index)
+        if not dup:
+            n_times = 1
+        return [row_separator] * n_times + [line]
+
+    def _render_plain_row(
+        self,
+        row_index: int,
+        text_sizes: List[int],
+        cells: List[Cell] = None,
+        style=None,
+    ) -> List[str]:
+        """Text rendering of a row without vertical lines (e.g. the NoLines, MNRAS
+        and A&A styles), where every separator is known in advance: the row is
+        filled into a template and the horizontal lines are plain dashes. Gives the
+        same output as the general renderer"""
+        if style is None:
+            style = self._table_style
+        template, rule = _plain_row_format(tuple(text_sizes))
+        line = template.format(*self._row_texts(row_index, "text", cells))
+        n_hlines = style.hline_counts.get(row_index, 0)
+        if not n_hlines:
+            return ["", line]
+        return [rule] * n_hlines + [line]
+
+    def _row_texts(
+        self, row_index: int, fmt: str, cells: List[Cell] = None
+    ) -> List[str]:
+        """Representation of the cells of a row; the storage formats them (e.g. from
+        its columns, for a compact table), unless the cells are given"""
+        if cells is None:
+            return self._store.row_texts(row_index, fmt)
+        return cell_texts(cells, fmt)
+
+    def _render_closing_line(self, text_sizes: List[int], fmt: str, style=None) -> str:
+        """Render the row separator below the last row of the table"""
+        if style is None:
+            style = self._table_style
+        if fmt == "text" and not style.vline_set:
+            if self.nrows in style.hline_counts:
+                return _plain_row_format(tuple(text_sizes))[1]
+            return ""
+
+        row_separator = ""
+        for col_index in range(self.ncols):
+            row_sep = style.get_row_separation(
                 row_number=self.nrows,
                 col_number=col_index,
                 col_size=text_sizes[col_index],
                 fmt=fmt,
-                cell=self.get_cell_with_pos(row_number=row_index, col_number=col_index),
+                cell=None,
             )
             row_separator = f"{row_separator}{row_sep}"
-        lines.append(row_separator)
-        return "\n".join((i for i in lines if i))
+        return row_separator
 
-    def build_latex(self, ignore_cols=None) -> List[str]:
+    def build_latex(
+        self,
+        ignore_cols=None,
+        workers: int = None,
+        mode: str = "table",
+        chunk_rows: int = 50,
+        widths: List[int] = None,
+    ) -> str:
         """Generate the LaTeX representation of the table
 
         Args:
-            ignore_cols (_type_, optional): _description_. Defaults to None.
+            ignore_cols (Iterable[int], optional): Zero-indexed columns that are not shown. Defaults to None.
+            workers (int, optional): Render the rows in a pool with this number of workers. Defaults to None.
+            mode (str, optional): Environment of the output, see iter_latex. Defaults to "table".
+            chunk_rows (int, optional): Number of rows of each table, in the "split" mode. Defaults to 50.
+            widths (List[int], optional): Length of the largest entry of each column. Defaults to None,
+                to use the contents of the table.
+
+        Returns:
+            str: The LaTeX code of the table
+        """
+        if ignore_cols:
+            return self._without_columns(ignore_cols).build_latex(
+                workers=workers, mode=mode, chunk_rows=chunk_rows, widths=widths
+            )
+        with self._phase("build_latex"):
+            if mode != "table" or widths is not None:
+                lines = self.iter_latex(workers, mode, chunk_rows, widths=widths)
+                return "\n".join(lines)
+            main_text = self.get_pretty_print(False, "LaTeX", workers=workers)
+            head = self._table_style.get_TeX_header()
+            foot = self._table_style.get_TeX_footer()
+            return f"\n{head}\n{main_text}\n{foot}"
+
+    def iter_latex(
+        self,
+        workers: int = None,
+        mode: str = "table",
+        chunk_rows: int = 50,
+        widths: List[int] = None,
+    ) -> Iterator[str]:
+        """Generate the LaTeX representation of the table one line at a time
+
+        Joining the lines with a newline gives the output of build_latex. The rows
+        are rendered as the lines are consumed, so even the largest tables can be
+        streamed to a file.
+
+        Modes:
+            - table -- a single table + tabular environment
+            - longtable -- a longtable environment (from the longtable package), which
+              LaTeX breaks across pages, repeating the header row on each one
+            - split -- a sequence of tables with (at most) chunk_rows rows each,
+              all starting with the header row
+
+        Args:
+            workers (int, optional): Render the rows in a pool with this number of workers. Defaults to None.
+            mode (str, optional): Environment of the output. Defaults to "table".
+            chunk_rows (int, optional): Number of rows of each table, in the "split" mode. Defaults to 50.
+            widths (List[int], optional): Length of the largest entry of each column. Defaults to None,
+                to use the contents of the table.
+
+        Raises:
+            ValueError: If the mode is unknown or chunk_rows is not positive
 
         Returns:
-            List[str]: _description_
+            Iterator[str]: The lines, without the trailing newline
         """
-        main_text = self.get_pretty_print(False, "LaTeX")
-        head = self._table_style.get_TeX_header()
-        foot = self._table_style.get_TeX_footer()
-        return f"\n{head}\n{main_text}\n{foot}"
+        backend = LaTeXBackend(mode=mode, chunk_rows=chunk_rows)
+        lines = self.iter_lines(
+            fmt="LaTeX", ignore_rows=False, workers=workers, widths=widths
+        )
+        return backend.frame(lines, self._table_style)
 
-    def set_decimal_places(self, value: int):
+    def set_decimal_places(self, value: int, columns: Iterable[int] = None):
         """Set the number of decimal places for the representation
 
-        Warning: this is only applied to the entries that exist whenever
-        this function was called
+        The decimal places are stored per column, so they also apply to the rows
+        that are added afterwards. Replaces the decimal places that were set on
+        individual cells of those columns.
 
         Args:
             value (int): Number of decimal places
+            columns (Iterable[int], optional): Zero-indexed columns to change.
+                Defaults to None, for all columns.
 
         Raises:
             ValueError: If the value is below zero
+            ColumnDoesNotExist: If one of the columns does not exist
         """
         if value < 0:
             raise ValueError(
                 f"The number of decimal places must be positive. Got {value}"
             )
+        columns = self._check_columns(columns)
+        self._store.set_decimal_places(value, columns)
+        self._stale_widths.update(columns)
+        self._invalidate_render_cache()
+
+    def set_column_format(
+        self, column_format: ColumnFormat, columns: Iterable[int] = None
+    ):
+        """Set the format of the numbers in some columns, used by both the text and
+        the LaTeX outputs (e.g. scientific notation, value ± error, siunitx)
+
+        Args:
+            column_format (ColumnFormat): The format. None goes back to the default
+                format, with the decimal places of the column
+            columns (Iterable[int], optional): Zero-indexed columns to change.
+                Defaults to None, for all columns.
+
+        Raises:
+            ColumnDoesNotExist: If one of the columns does not exist
+        """
+        columns = self._check_columns(columns)
+        for col in columns:
+            self._store.column_formats[col] = column_format
+        self._stale_widths.update(columns)
+        self._invalidate_render_cache()
 
-        self._decimal_places = value
-        for c in self._tableCells:
-            c.set_decimal_places(value)
+    def _check_columns(self, columns: Iterable[int]) -> List[int]:
+        if columns is None:
+            return list(range(self.ncols))
+        columns = list(columns)
+        for col in columns:
+            if not isinstance(col, int) or not 0 <= col < self.ncols:
+                raise ColumnDoesNotExist(f"Column {col} does not exist")
+        return columns
 
     def write_to_file(
-        self, path, mode="a", write_table=True, write_LaTeX=False, ignore_cols=None
+        self,
+        path,
+        mode="a",
+        write_table=True,
+        write_LaTeX=False,
+        ignore_cols=None,
+        workers: int = None,
+        latex_mode: str = "table",
+        chunk_rows: int = 50,
     ):
+        table = self._without_columns(ignore_cols)
         skip = 1 if mode == "a" else 0
         with open(path, mode=mode) as file:
+            if write_table and write_LaTeX and not (workers and workers > 1):
+                table._write_text_and_latex(file, skip, latex_mode, chunk_rows)
+                return
+            # The lines are written as they are generated, so that the full
+            # representation of the table is never held in memory
             if write_table:
-                lines = self.get_pretty_print(fmt="text", ignore_rows=skip)
-                file.write("".join(lines) + "\n")
+                for line in table.iter_lines(
+                    fmt="text", ignore_rows=skip, workers=workers
+                ):
+                    file.write(f"{line}\n")
             if write_LaTeX:
                 if write_table:
                     file.write("\n")
-                lines = self.build_latex()
-                file.write(lines)
+                lines = table.iter_latex(
+                    workers=workers, mode=latex_mode, chunk_rows=chunk_rows
+                )
+                file.write(next(lines))
+                for line in lines:
+                    file.write(f"\n{line}")
+
+    def _write_text_and_latex(self, file, skip: int, latex_mode: str, chunk_rows: int):
+        """Write the text and LaTeX representations in a single pass over the rows.
+        The LaTeX lines go through a temporary file (only kept in memory while it
+        is small), as they are written after the text"""
+        latex_backend = LaTeXBackend(mode=latex_mode, chunk_rows=chunk_rows)
+        with SpooledTemporaryFile(max_size=1 << 20, mode="w+") as latex:
+            text_backend = TextBackend(ignore_rows=skip)
+            export(self, [(text_backend, file), (latex_backend, latex)])
+            file.write("\n")
+            latex.seek(0)
+            # Same layout as the other writers: no newline after the last line
+            previous = None
+            for line in latex:
+                if previous is not None:
+                    file.write(previous)
+                previous = line
+            if previous is not None:
+                file.write(previous[:-1])
+
+    def export(self, targets: Dict[Any, Any], mode: str = "w"):
+        """Write the table in several formats (e.g. text, LaTeX, Markdown, HTML and
+        CSV), walking over its rows only once; see backends.export
+
+        Args:
+            targets (Dict[Any, Any]): Maps each format (a name from
+                backends.BACKENDS, or a Backend with its own options) to the path
+                of its output file, or to an open text file
+            mode (str, optional): Mode used to open the paths. Defaults to "w".
+
+        Raises:
+            ValueError: If one of the formats is unknown
+        """
+        with ExitStack() as stack:
+            sinks = []
+            for fmt, target in targets.items():
+                backend = get_backend(fmt)
+                if not hasattr(target, "write"):
+                    target = stack.enter_context(open(target, mode=mode))
+                sinks.append((backend, target))
+            export(self, sinks)
+
+    def open_writer(self, path, mode: str = "w", widths: List[int] = None):
+        """Open a writer that appends the rows of this table to a text file, as
+        they are added to the table
+
+        Args:
+            path: Path of the output file
+            mode (str, optional): Mode used to open the file. Defaults to "w".
+            widths (List[int], optional): Length of the largest entry of each column.
+                Defaults to None, to freeze the widths of the table on the first flush.
+
+        Returns:
+            TableWriter: The writer; call flush() to write the new rows and close()
+            to write the end of the table
+        """
+        return TableWriter(self, path, mode=mode, widths=widths)
 
     @property
     def N_columns(self) -> int:
         """Return the number of columns in the table"""
-        return len(self.get_line(0))
+        return self.ncols
+
+    @property
+    def nrows(self) -> int:
+        """Return the number of rows in the table, including the header"""
+        return self._store.nrows
 
     @property
     def N_lines(self) -> int:
         """Return the number of lines in the table"""
         return self.nrows
 
+    def __reduce__(self):
+        # Pickled as a flat snapshot of the columns and of the cells that differ
+        # from the defaults, instead of going through every Cell
+        return restore, (snapshot(self), type(self))
+
+    def save(self, path):
+        """Save the table into a binary file, which Table.load reads back
+
+        The numeric columns are written as raw binary arrays, and everything else
+        (header, text columns, formats, spans, style) as JSON metadata.
+
+        Args:
+            path: Path of the file
+
+        Raises:
+            TypeError: If the table holds contents other than numbers, strings,
+                booleans, None and tuples of those
+        """
+        save_snapshot(self, path)
+
+    @classmethod
+    def load(cls, path, mmap: bool = True) -> "Table":
+        """Load a table saved with Table.save
+
+        Args:
+            path: Path of the file
+            mmap (bool, optional): Memory-map the file, so that the numeric columns
+                of a compact table are only read once they are used. Defaults to
+                True.
+
+        Raises:
+            ValueError: If the file was not written by Table.save
+
+        Returns:
+            Table: The new table, with the same storage (compact or not) as the
+                saved one
+        """
+        return load_snapshot(path, cls, mmap=mmap)
+
     def __str__(self):
         return "".join(self.get_pretty_print(ignore_rows=0, fmt="text"))
@@ -1 +1,4 @@
-from .Table import Table
\ No newline at end of file
+from .Table import Table
+from .formatting import ColumnFormat
+from .lazy import LazyTable
+from .rolling import RollingTable
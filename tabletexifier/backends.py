@@ -0,0 +1,320 @@
+"""Output formats of the Tables
+
+Each backend renders a table one row at a time, so that a single walk over the
+table can feed any number of them (see export):
+
+    - text -- the representation printed in the terminal
+    - LaTeX -- table, longtable or split tables, see Table.iter_latex
+    - markdown -- GitHub-flavoured Markdown table
+    - html -- HTML table, with the multi-row/multi-column cells as row/col spans
+    - csv -- one line per row, with the formatted (or the raw) contents
+
+The text and LaTeX backends go through the renderers of the Table, and give the
+same output as iter_lines and iter_latex.
+"""
+
+import csv
+import html
+import io
+from copy import copy
+from typing import IO, Any, Iterable, Iterator, List, Tuple, Union
+
+from .Cell import Cell
+
+
+class Backend:
+    """Output format of a Table, rendered one row at a time
+
+    begin is called before the first row, render_row with the cells of each row
+    (starting with the header) and end after the last row. All of them return the
+    lines of the output, without the trailing newline.
+    """
+
+    name = ""
+
+    def __init__(self):
+        self.table = None
+
+    def begin(self, table) -> List[str]:
+        self.table = table
+        return []
+
+    def render_row(self, row_index: int, cells: List[Cell]) -> List[str]:
+        raise NotImplementedError
+
+    def end(self) -> List[str]:
+        return []
+
+
+class TextBackend(Backend):
+    """Text representation, as printed in the terminal
+
+    Args:
+        ignore_rows (int, optional): Number of rows, from the top, that are not
+            shown. Defaults to 0.
+        widths (List[int], optional): Length of the largest entry of each column.
+            Defaults to None, to use the contents of the table.
+    """
+
+    name = "text"
+
+    def __init__(self, ignore_rows: int = 0, widths: List[int] = None):
+        super().__init__()
+        self.ignore_rows = int(ignore_rows)
+        self.widths = widths
+        self.style = None
+        self.text_sizes = None
+
+    def begin(self, table) -> List[str]:
+        super().begin(table)
+        table._check_render_arguments("text", self.ignore_rows)
+        self.text_sizes = table.compute_max_text_size_of_cols(self.widths)
+        # Each backend sizes a copy of the style, so that several of them can
+        # render the same table at once
+        self.style = copy(table._table_style)
+        self.style.set_size(rows=table.nrows - self.ignore_rows, cols=table.ncols)
+        self.style.compile_layout()
+        return []
+
+    def render_row(self, row_index: int, cells: List[Cell]) -> List[str]:
+        if row_index < self.ignore_rows:
+            return []
+        lines = self.table._render_row(
+            row_index, self.text_sizes, self.name, cells=cells, style=self.style
+        )
+        return [line for line in lines if line]
+
+    def end(self) -> List[str]:
+        if self.ignore_rows >= self.table.nrows:
+            return []
+        line = self.table._render_closing_line(
+            self.text_sizes, self.name, style=self.style
+        )
+        return [line] if line else []
+
+
+class LaTeXBackend(TextBackend):
+    """LaTeX code of the table, in one of the modes of Table.iter_latex
+
+    Args:
+        mode (str, optional): Environment of the output. Defaults to "table".
+        chunk_rows (int, optional): Number of rows of each table, in the "split"
+            mode. Defaults to 50.
+
+    Raises:
+        ValueError: If the mode is unknown or chunk_rows is not positive
+    """
+
+    name = "LaTeX"
+
+    def __init__(self, mode: str = "table", chunk_rows: int = 50):
+        if mode not in ("table", "longtable", "split"):
+            raise ValueError(f"Unknown LaTeX mode: {mode}")
+        if chunk_rows < 1:
+            raise ValueError(f"Each table needs at least one row. Got {chunk_rows}")
+        super().__init__()
+        self.mode = mode
+        self.chunk_rows = chunk_rows
+        self._header_row = None
+        self._rows_in_table = 0
+
+    def begin(self, table) -> List[str]:
+        self._header_row = None
+        return super().begin(table)
+
+    def render_row(self, row_index: int, cells: List[Cell]) -> List[str]:
+        lines = []
+        # Each row is a single line in LaTeX
+        for line in super().render_row(row_index, cells):
+            lines.extend(self._place(line))
+        return lines
+
+    def end(self) -> List[str]:
+        lines = []
+        for line in super().end():
+            lines.extend(self._place(line))
+        return lines + self._close()
+
+    def frame(self, lines: Iterable[str], style) -> Iterator[str]:
+        """Wrap the rendered rows (starting with the header row) in the environments
+        of the mode
+
+        Args:
+            lines (Iterable[str]): LaTeX lines of the rows, e.g. from iter_lines
+            style (Style): Style used to render the rows; it must be sized once the
+                first line is rendered
+        """
+        self.style = style
+        self._header_row = None
+        for line in lines:
+            yield from self._place(line)
+        yield from self._close()
+
+    def _place(self, line: str) -> List[str]:
+        style = self.style
+        if self._header_row is None:
+            self._header_row = line
+            self._rows_in_table = 0
+            if self.mode == "longtable":
+                return ["", style.get_longtable_header(line)]
+            return ["", style.get_TeX_header(), line]
+
+        lines = []
+        if self.mode == "split" and self._rows_in_table == self.chunk_rows:
+            page_rules = style.get_TeX_page_rules()
+            if page_rules:
+                lines.append(page_rules)
+            lines += [
+                style.get_TeX_footer(),
+                style.get_TeX_header(continued=True),
+                self._header_row,
+            ]
+            self._rows_in_table = 0
+        self._rows_in_table += 1
+        lines.append(line)
+        return lines
+
+    def _close(self) -> List[str]:
+        if self._header_row is None:
+            return []
+        if self.mode == "longtable":
+            return [self.style.get_longtable_footer()]
+        return [self.style.get_TeX_footer()]
+
+
+class MarkdownBackend(Backend):
+    """GitHub-flavoured Markdown table. The lines and spans of the style are not
+    drawn, and the columns follow the alignment of the LaTeX columns"""
+
+    name = "markdown"
+
+    _ALIGNMENTS = {"l": ":---", "c": ":---:", "r": "---:"}
+
+    def render_row(self, row_index: int, cells: List[Cell]) -> List[str]:
+        texts = [_escape_markdown(cell.generate_text()) for cell in cells]
+        lines = ["| " + " | ".join(texts) + " |"]
+        if row_index == 0:
+            alignment = self.table._table_style.table_properties["column_alignement"]
+            rule = self._ALIGNMENTS.get(alignment, "---")
+            lines.append("|" + "|".join([rule] * len(cells)) + "|")
+        return lines
+
+
+def _escape_markdown(text: str) -> str:
+    return text.replace("|", r"\|").replace("\n", " ")
+
+
+class HTMLBackend(Backend):
+    """HTML table, with the caption and label (as id) of the style"""
+
+    name = "html"
+
+    def begin(self, table) -> List[str]:
+        super().begin(table)
+        properties = table._table_style.table_properties
+        label = properties["label"]
+        lines = ["<table>" if not label else f'<table id="{html.escape(label)}">']
+        if properties["caption"]:
+            lines.append(f"  <caption>{html.escape(properties['caption'])}</caption>")
+        lines.append("  <thead>")
+        return lines
+
+    def render_row(self, row_index: int, cells: List[Cell]) -> List[str]:
+        spans = self.table._store.spans
+        tag = "th" if row_index == 0 else "td"
+        entries = []
+        for col, cell in enumerate(cells):
+            if spans.is_covered(row_index, col):
+                continue
+            nrows, ncols = cell.dimension
+            attributes = f' rowspan="{nrows}"' if nrows > 1 else ""
+            if ncols > 1:
+                attributes += f' colspan="{ncols}"'
+            text = html.escape(cell.generate_text())
+            entries.append(f"<{tag}{attributes}>{text}</{tag}>")
+
+        lines = ["    <tr>" + "".join(entries) + "</tr>"]
+        if row_index == 0:
+            lines += ["  </thead>", "  <tbody>"]
+        return lines
+
+    def end(self) -> List[str]:
+        return ["  </tbody>", "</table>"]
+
+
+class CSVBackend(Backend):
+    """Comma-separated values, one line per row
+
+    Args:
+        raw (bool, optional): Write the contents of the cells instead of their text
+            representation. Defaults to False.
+        **fmtparams: Passed to csv.writer
+    """
+
+    name = "csv"
+
+    def __init__(self, raw: bool = False, **fmtparams):
+        super().__init__()
+        self.raw = raw
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="", **fmtparams)
+
+    def render_row(self, row_index: int, cells: List[Cell]) -> List[str]:
+        if self.raw:
+            values = ["" if cell.is_blank else cell.content for cell in cells]
+        else:
+            values = [cell.generate_text() for cell in cells]
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._writer.writerow(values)
+        return [self._buffer.getvalue()]
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (TextBackend, LaTeXBackend, MarkdownBackend, HTMLBackend, CSVBackend)
+}
+
+
+def get_backend(fmt: Union[str, Backend]) -> Backend:
+    """Backend for a format name (with the default options), or the backend itself
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if isinstance(fmt, Backend):
+        return fmt
+    try:
+        return BACKENDS[fmt]()
+    except KeyError:
+        raise ValueError(f"Unknown format: {fmt}") from None
+
+
+def export(table, sinks: Iterable[Tuple[Union[str, Backend], IO[str]]]):
+    """Write a table in several formats, walking over its rows only once
+
+    The cells of each row are fetched once and handed to every backend, so the text
+    of a cell is only formatted once, and the widths of the columns are only
+    measured once.
+
+    Args:
+        table (Table): The table
+        sinks (Iterable[Tuple[Union[str, Backend], IO[str]]]): Pairs of format (name
+            or backend) and open text file, where the lines of that format are
+            written (each followed by a newline)
+    """
+    sinks = [(get_backend(fmt), file) for fmt, file in sinks]
+    for backend, file in sinks:
+        _write_lines(file, backend.begin(table))
+    store = table._store
+    for row_index in range(table.nrows):
+        cells = store.get_row(row_index)
+        for backend, file in sinks:
+            _write_lines(file, backend.render_row(row_index, cells))
+    for backend, file in sinks:
+        _write_lines(file, backend.end())
+
+
+def _write_lines(file: IO[str], lines: List[Any]):
+    for line in lines:
+        file.write(f"{line}\n")
@@ -5,3 +5,6 @@ class ColumnDoesNotExist(Exception): ...
 
 
 class CellNotFound(Exception): ...
+
+
+class OverlappingSpans(Exception): ...
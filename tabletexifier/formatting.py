@@ -0,0 +1,286 @@
+"""Conversion of the cell contents into text
+
+The functions in here are shared by the cells, which format one value at a time,
+and by the storages, which format entire columns at once (e.g. to find the width
+of a column).
+"""
+
+from array import array
+from functools import lru_cache
+from math import isfinite
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+
+# Tables tend to repeat the same values over and over, so the formatted numbers are
+# memoized: repeated values share a single string instead of one copy per cell
+_CACHE_SIZE = 2**16
+
+
+@lru_cache(maxsize=_CACHE_SIZE, typed=True)
+def _cached_text(value, decimal_places: int) -> str:
+    return "{:.{}f}".format(value, decimal_places)
+
+
+@lru_cache(maxsize=_CACHE_SIZE, typed=True)
+def _cached_LaTeX(value, decimal_places: int) -> str:
+    return str(round(value, decimal_places))
+
+
+# NaN (the usual marker of missing data) is never equal to itself, so it can't be a
+# key of the caches; it is written the same way with any number of decimal places,
+# so all the NaN cells share this string instead
+_NAN = "nan"
+
+
+def _is_cacheable(value) -> bool:
+    # 0.0 == -0.0 even though they are formatted differently, so they can't be
+    # used as a key
+    return value != 0
+
+
+def format_text(value: Any, decimal_places: int) -> str:
+    """Textual representation of one value, used for the terminal output"""
+    if isinstance(value, (float, int)) and decimal_places is not None:
+        if value != value:
+            return _NAN
+        if _is_cacheable(value):
+            return _cached_text(value, decimal_places)
+        return "{:.{}f}".format(value, decimal_places)
+    return str(value)
+
+
+def format_LaTeX_number(value: float, decimal_places: int) -> str:
+    """LaTeX representation of a float, rounded to the number of decimal places"""
+    if value != value:
+        return _NAN
+    if _is_cacheable(value):
+        return _cached_LaTeX(value, decimal_places)
+    return str(round(value, decimal_places))
+
+
+def format_cache_info():
+    """Statistics (hits, misses, ...) of the caches of formatted numbers"""
+    return _cached_text.cache_info(), _cached_LaTeX.cache_info()
+
+
+def is_numeric_column(values: Sequence[Any]) -> bool:
+    """Check if the values are stored in a numeric array (typed array, memoryview or
+    numpy)"""
+    if isinstance(values, array):
+        return values.typecode in "bBhHiIlLqQfd"
+    if isinstance(values, memoryview):
+        return len(values.format) == 1 and values.format in "bBhHiIlLqQfd"
+    if np is not None and isinstance(values, np.ndarray):
+        return values.dtype.kind in "iuf"
+    return False
+
+
+def format_numbers(
+    values: Sequence[Any], decimal_places: int, notation: str = "f"
+) -> List[str]:
+    """Format a whole numeric column with a fixed number of decimal places
+
+    Uses numpy to format the entire column in one call, if it is available.
+
+    Args:
+        values (Sequence[Any]): The numbers
+        decimal_places (int): Number of decimal places
+        notation (str, optional): "f" (fixed) or "e" (scientific). Defaults to "f".
+    """
+    if decimal_places is None:
+        return [str(value) for value in values]
+    template = f"%.{decimal_places}{notation}"
+    if np is not None and len(values) > 0:
+        return np.char.mod(template, np.asarray(values)).tolist()
+    return [template % value for value in values]
+
+
+def format_column(
+    values: Sequence[Any], decimal_places: int, column_format: "ColumnFormat" = None
+) -> List[str]:
+    """Textual representation of an entire column"""
+    if column_format is not None:
+        return column_format.format_column(values, decimal_places)
+    if is_numeric_column(values):
+        return format_numbers(values, decimal_places)
+    return [format_text(value, decimal_places) for value in values]
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (float, int))
+
+
+def _is_pair(value) -> bool:
+    return (
+        isinstance(value, tuple)
+        and len(value) == 2
+        and _is_number(value[0])
+        and _is_number(value[1])
+    )
+
+
+_NOTATIONS = {"fixed": "f", "scientific": "e"}
+
+
+class ColumnFormat:
+    """Format of the numbers in one column of a Table
+
+    The format is compiled, once for each number of decimal places, into a pair of
+    functions (text, LaTeX) that convert one entry; whole columns are formatted in
+    a single batch by format_column. Entries that are not numbers (or pairs of
+    numbers, with uncertainty=True) are shown as they are.
+
+    Args:
+        precision (int, optional): Number of decimal places (of the mantissa, in
+            scientific notation). Defaults to None, to use the decimal places of
+            the column.
+        notation (str, optional): "fixed" or "scientific". Defaults to "fixed".
+        uncertainty (bool, optional): The entries are (value, error) pairs, shown
+            as value ± error. Defaults to False.
+        siunitx (bool, optional): Write the LaTeX numbers with the \\num command of
+            the siunitx package. Defaults to False.
+
+    Raises:
+        ValueError: If the notation is unknown or the precision is below zero
+    """
+
+    def __init__(
+        self,
+        precision: int = None,
+        notation: str = "fixed",
+        uncertainty: bool = False,
+        siunitx: bool = False,
+    ):
+        if notation not in _NOTATIONS:
+            raise ValueError(
+                f"Unknown notation: {notation}. Use one of {list(_NOTATIONS)}"
+            )
+        if precision is not None and precision < 0:
+            raise ValueError(f"The precision must be positive. Got {precision}")
+        self.precision = precision
+        self.notation = notation
+        self.uncertainty = uncertainty
+        self.siunitx = siunitx
+
+        self._compiled: Dict[int, Tuple[Callable, Callable]] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnFormat(precision={self.precision}, notation={self.notation!r}, "
+            f"uncertainty={self.uncertainty}, siunitx={self.siunitx})"
+        )
+
+    def _precision(self, decimal_places: int) -> int:
+        return decimal_places if self.precision is None else self.precision
+
+    def _template(self, decimal_places: int) -> str:
+        return f"%.{self._precision(decimal_places)}{_NOTATIONS[self.notation]}"
+
+    def compile(self, decimal_places: int) -> Tuple[Callable, Callable]:
+        """Functions that convert one entry into its text and LaTeX representation
+
+        Args:
+            decimal_places (int): Decimal places of the column, only used if the
+                format has no precision of its own
+
+        Returns:
+            Tuple[Callable, Callable]: The text and the LaTeX formatters
+        """
+        key = self._precision(decimal_places)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._build(self._template(decimal_places))
+            self._compiled[key] = compiled
+        return compiled
+
+    def _build(self, template: str) -> Tuple[Callable, Callable]:
+        fixed_template = template[:-1] + "f"
+
+        def split(value, error=0.0):
+            """Mantissa of the value and error, and the (shared) exponent"""
+            mantissa, exponent = (template % value).split("e")
+            exponent = int(exponent)
+            return mantissa, fixed_template % (error / 10**exponent), exponent
+
+        siunitx = self.siunitx
+        if self.notation == "fixed" and not self.uncertainty:
+
+            def text(value):
+                return template % value if _is_number(value) else str(value)
+
+            def LaTeX(value):
+                if not _is_number(value):
+                    return value
+                number = template % value
+                return r"\num{" + number + "}" if siunitx else number
+
+        elif self.notation == "fixed":
+
+            def text(value):
+                if not _is_pair(value):
+                    return str(value)
+                return f"{template % value[0]} ± {template % value[1]}"
+
+            def LaTeX(value):
+                if not _is_pair(value):
+                    return value
+                number, error = template % value[0], template % value[1]
+                if siunitx:
+                    return r"\num{" + f"{number} +- {error}" + "}"
+                return f"${number} \\pm {error}$"
+
+        elif not self.uncertainty:
+
+            def text(value):
+                return template % value if _is_number(value) else str(value)
+
+            def LaTeX(value):
+                if not _is_number(value):
+                    return value
+                if not isfinite(value):
+                    return template % value
+                mantissa, _, exponent = split(value)
+                if siunitx:
+                    return r"\num{" + f"{mantissa}e{exponent}" + "}"
+                return f"${mantissa} \\times 10^{{{exponent}}}$"
+
+        else:
+
+            def text(value):
+                if not _is_pair(value):
+                    return str(value)
+                if not isfinite(value[0]):
+                    return f"{template % value[0]} ± {template % value[1]}"
+                mantissa, error, exponent = split(*value)
+                return f"({mantissa} ± {error})e{exponent:+03d}"
+
+            def LaTeX(value):
+                if not _is_pair(value):
+                    return value
+                if not isfinite(value[0]):
+                    return f"${template % value[0]} \\pm {template % value[1]}$"
+                mantissa, error, exponent = split(*value)
+                if siunitx:
+                    return r"\num{" + f"{mantissa} +- {error} e{exponent}" + "}"
+                return f"$({mantissa} \\pm {error}) \\times 10^{{{exponent}}}$"
+
+        return text, LaTeX
+
+    def text(self, value, decimal_places: int) -> str:
+        return self.compile(decimal_places)[0](value)
+
+    def LaTeX(self, value, decimal_places: int):
+        return self.compile(decimal_places)[1](value)
+
+    def format_column(self, values: Sequence[Any], decimal_places: int) -> List[str]:
+        """Textual representation of an entire column, in a single batch"""
+        if not self.uncertainty and is_numeric_column(values):
+            notation = _NOTATIONS[self.notation]
+            return format_numbers(values, self._precision(decimal_places), notation)
+        text = self.compile(decimal_places)[0]
+        return [text(value) for value in values]
@@ -0,0 +1,234 @@
+"""Tables whose rows are only read from their source when they are rendered"""
+
+import csv
+from collections import deque
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, List
+
+from .Table import Table
+from .formatting import format_text
+
+
+class CSVRows:
+    """Re-iterable source that reads the rows of a CSV file on each iteration
+
+    Args:
+        path: Path of the file
+        skip_rows (int, optional): Number of rows at the top of the file that are not
+            returned (e.g. the header). Defaults to 0.
+        **fmtparams: Passed to csv.reader
+    """
+
+    def __init__(self, path, skip_rows: int = 0, **fmtparams):
+        self.path = path
+        self.skip_rows = skip_rows
+        self.fmtparams = fmtparams
+
+    def __iter__(self) -> Iterator[List[str]]:
+        with open(self.path, newline="") as file:
+            yield from islice(csv.reader(file, **self.fmtparams), self.skip_rows, None)
+
+
+class LazyTable:
+    """Table backed by a row source, of which only a window is ever rendered.
+
+    Supported sources:
+        - a sequence (anything with __len__ and __getitem__) -- random access
+        - a callable, which returns the row with a given index, together with the
+          number of rows (n_rows) -- random access
+        - any other iterable (e.g. a csv.reader, or CSVRows) -- scanned from the
+          start. The rows that a one-shot iterator gives for the sample are kept,
+          so they can be rendered any number of times, but the rest of it can only
+          be read once
+
+    The Cells are only created for the rows that are rendered. The column widths
+    are the largest of: the declared widths (or, if there are none, the widths of the
+    first sample_rows rows) and the widths of the rendered window.
+
+    Args:
+        header (Iterable[str]): Header of the table
+        source: Source of the rows (without the header)
+        n_rows (int, optional): Number of rows, needed for callable sources. Defaults
+            to None.
+        widths (List[int], optional): Length of the largest entry of each column.
+            Defaults to None, to measure the sample.
+        sample_rows (int, optional): Number of rows used to measure the widths.
+            Defaults to 100.
+        table_style (str, optional): Style of the table. Defaults to "A&A".
+        decimal_places (int, optional): Number of decimal places. Defaults to 2.
+    """
+
+    def __init__(
+        self,
+        header: Iterable[str],
+        source,
+        n_rows: int = None,
+        widths: List[int] = None,
+        sample_rows: int = 100,
+        table_style: str = "A&A",
+        decimal_places: int = 2,
+    ):
+        self.header = list(header)
+        self.table_style = table_style
+        self.decimal_places = decimal_places
+
+        self._source = source
+        self._random_access = callable(source) or (
+            hasattr(source, "__len__") and hasattr(source, "__getitem__")
+        )
+        if callable(source) and n_rows is None:
+            raise ValueError("The number of rows is needed for callable sources")
+        self._n_rows = n_rows
+
+        # Rows already taken from a one-shot iterator, which come before the rest of
+        # the iterator. Once that rest was read (_consumed), only the buffer can be
+        # rendered again, unless it holds all the rows (_complete)
+        self._buffer = []
+        self._one_shot = not self._random_access and iter(source) is source
+        self._consumed = self._complete = False
+
+        if widths is None:
+            if self._one_shot:
+                self._buffer = list(islice(source, sample_rows))
+                self._complete = len(self._buffer) < sample_rows
+                sample = self._buffer
+            else:
+                sample = self._rows(0, sample_rows)
+            widths = self._measure(self.header)
+            for row in sample:
+                widths = [max(a, b) for a, b in zip(widths, self._measure(row))]
+        elif len(widths) != len(self.header):
+            raise ValueError("There must be one width per column")
+        self.widths = list(widths)
+
+    @classmethod
+    def from_csv(cls, path, header: Iterable[str] = None, **kwargs) -> "LazyTable":
+        """Lazy table over a CSV file, which is read again for each render
+
+        Args:
+            path: Path of the file
+            header (Iterable[str], optional): Header of the table. If None, the first
+                row of the file is used as the header. Defaults to None.
+            **kwargs: Passed to LazyTable
+
+        Returns:
+            LazyTable: The table
+        """
+        if header is None:
+            header = next(iter(CSVRows(path)), [])
+            source = CSVRows(path, skip_rows=1)
+        else:
+            source = CSVRows(path)
+        return cls(header, source, **kwargs)
+
+    @property
+    def n_rows(self) -> int:
+        """Number of rows (without the header), if known"""
+        if self._n_rows is None and self._random_access:
+            return len(self._source)
+        return self._n_rows
+
+    def _measure(self, row) -> List[int]:
+        return [len(format_text(value, self.decimal_places)) for value in row]
+
+    def _get_row(self, index: int):
+        if callable(self._source):
+            return self._source(index)
+        return self._source[index]
+
+    def _scan(self, stop: int = None) -> Iterator[Any]:
+        """Iterate over the rows of a source without random access, up to stop (or
+        to the end, if it is None)
+
+        Raises:
+            ValueError: If the rows are past the buffer of a one-shot iterator, which
+                was already read
+        """
+        if not self._one_shot:
+            return iter(self._source)
+        if self._complete or (stop is not None and stop <= len(self._buffer)):
+            return iter(self._buffer)
+        if self._consumed:
+            raise ValueError(
+                "The rows of this one-shot iterator were already read; use a "
+                "sequence, a callable or a re-iterable source (e.g. CSVRows) to "
+                "render them more than once"
+            )
+        self._consumed = True
+        return chain(self._buffer, self._source)
+
+    def _rows(self, start: int, stop: int = None) -> Iterator[Any]:
+        """Rows with index in [start, stop); stop=None goes to the end"""
+        if self._random_access:
+            n_rows = self.n_rows
+            stop = n_rows if stop is None else min(stop, n_rows)
+            return (self._get_row(index) for index in range(start, stop))
+        return islice(self._scan(stop), start, stop)
+
+    def _tail_rows(self, n: int) -> List[Any]:
+        if self._random_access:
+            return list(self._rows(max(self.n_rows - n, 0)))
+        # Only the last n rows are kept while scanning the source
+        return list(deque(self._scan(), maxlen=n))
+
+    def _render(self, rows: Iterable[Any], fmt: str) -> str:
+        window = Table.from_rows(rows, header=self.header, table_style=self.table_style)
+        window.set_decimal_places(self.decimal_places)
+        widths = [max(a, b) for a, b in zip(self.widths, window.get_column_widths())]
+        if fmt == "LaTeX":
+            return window.build_latex(widths=widths)
+        return "\n".join(window.iter_lines(fmt=fmt, widths=widths))
+
+    def head(self, n: int = 10, fmt: str = "text") -> str:
+        """Render the first n rows
+
+        Args:
+            n (int, optional): Number of rows. Defaults to 10.
+            fmt (str, optional): Which format to use, between text and LaTeX. Defaults to "text".
+
+        Raises:
+            ValueError: If the rows are past the sample of a one-shot iterator that
+                was already read
+
+        Returns:
+            str: The rendered table
+        """
+        return self._render(self._rows(0, n), fmt)
+
+    def tail(self, n: int = 10, fmt: str = "text") -> str:
+        """Render the last n rows
+
+        Args:
+            n (int, optional): Number of rows. Defaults to 10.
+            fmt (str, optional): Which format to use, between text and LaTeX. Defaults to "text".
+
+        Raises:
+            ValueError: If the rows are past the sample of a one-shot iterator that
+                was already read
+
+        Returns:
+            str: The rendered table
+        """
+        return self._render(self._tail_rows(n), fmt)
+
+    def page(self, start: int, stop: int, fmt: str = "text") -> str:
+        """Render the rows with index in [start, stop)
+
+        Args:
+            start (int): First row (zero-indexed, without counting the header)
+            stop (int): Row after the last one
+            fmt (str, optional): Which format to use, between text and LaTeX. Defaults to "text".
+
+        Raises:
+            ValueError: If the page is invalid, or if its rows are past the sample of
+                a one-shot iterator that was already read
+
+        Returns:
+            str: The rendered table
+        """
+        if start < 0 or stop < start:
+            raise ValueError(f"Invalid page: [{start}, {stop})")
+        return self._render(self._rows(start, stop), fmt)
+
+    def __str__(self):
+        return self.head()
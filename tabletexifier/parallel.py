@@ -0,0 +1,85 @@
+"""Rendering of the rows of a Table in a pool of workers
+
+Once the column widths and the layout of the style are known, the rows can be
+rendered independently of each other. The rows are split into chunks, which are
+rendered by a process pool (or by a thread pool, on free-threaded builds of python)
+and then joined back in order.
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterator, List
+
+# Number of chunks given to each worker; more chunks balance the load better
+CHUNKS_PER_WORKER = 4
+
+# Copy of the table that is rendered by each worker process
+_worker_table = None
+
+
+def _is_free_threaded() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _init_worker(table, ignore_rows: int):
+    global _worker_table
+    _worker_table = table
+    table._table_style.set_size(rows=table.nrows - ignore_rows, cols=table.ncols)
+
+
+def _render_chunk(start: int, stop: int, fmt: str, text_sizes: List[int], table=None):
+    if table is None:
+        table = _worker_table
+    return [
+        line
+        for row_index in range(start, stop)
+        for line in table._render_row(row_index, text_sizes, fmt)
+        if line
+    ]
+
+
+def render_rows_in_parallel(
+    table, fmt: str, ignore_rows: int, text_sizes: List[int], workers: int
+) -> Iterator[List[str]]:
+    """Render the rows of the table (without the closing line) in a pool of workers
+
+    The style of the table must already have its size set for this render.
+
+    Args:
+        table (Table): The table to render
+        fmt (str): Which format to use, between text and LaTeX
+        ignore_rows (int): Number of rows, from the top, that are not shown
+        text_sizes (List[int]): Size of each column
+        workers (int): Number of workers
+
+    Returns:
+        Iterator[List[str]]: The lines of each chunk of rows, in order
+    """
+    n_chunks = workers * CHUNKS_PER_WORKER
+    chunk_rows = max(1, -(-(table.nrows - ignore_rows) // n_chunks))
+    starts = range(ignore_rows, table.nrows, chunk_rows)
+    stops = [min(start + chunk_rows, table.nrows) for start in starts]
+    n_tasks = len(starts)
+
+    if _is_free_threaded():
+        # The layout plan is compiled before the threads can race to do it
+        table._table_style.compile_layout()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(
+                _render_chunk,
+                starts,
+                stops,
+                [fmt] * n_tasks,
+                [text_sizes] * n_tasks,
+                [table] * n_tasks,
+            )
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(table, ignore_rows),
+        ) as executor:
+            yield from executor.map(
+                _render_chunk, starts, stops, [fmt] * n_tasks, [text_sizes] * n_tasks
+            )
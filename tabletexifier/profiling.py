@@ -0,0 +1,118 @@
+"""Timing instrumentation of the renderers of a Table
+
+A Table only records anything once a RenderStats object is attached to it (see
+Table.enable_render_stats); otherwise the renderers run exactly as before.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict
+
+from .formatting import format_cache_info
+
+# Methods of the table style that are timed under the "separators" phase
+_STYLE_METHODS = ("get_col_separation", "get_row_separation", "check_if_duplicate_row")
+
+
+class RenderStats:
+    """Time spent and number of calls of each phase of the renderers
+
+    Phases:
+        - get_pretty_print / build_latex -- complete calls
+        - widths -- computation of the column widths
+        - layout -- sizing of the style and compilation of its layout plan
+        - rows -- rendering of the rows (includes "format" and "separators")
+        - format -- conversion of the cells into text / LaTeX
+        - separators -- queries to the table style for the separators
+        - join -- joining the lines into the final string
+
+    Counters:
+        - render_cache_hits / render_cache_misses -- outputs of get_pretty_print
+        - rows_rendered / row_cache_hits -- rows rendered or taken from the cache
+        - format_cache_hits / format_cache_misses -- cache of formatted numbers
+    """
+
+    def __init__(self):
+        self.times: Dict[str, float] = defaultdict(float)
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.counters: Dict[str, int] = defaultdict(int)
+
+    def reset(self):
+        self.times.clear()
+        self.calls.clear()
+        self.counters.clear()
+
+    def add(self, phase: str, duration: float, calls: int = 1):
+        self.times[phase] += duration
+        self.calls[phase] += calls
+
+    def count(self, counter: str, value: int = 1):
+        self.counters[counter] += value
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the body of the with statement under the given phase"""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, perf_counter() - start)
+
+    def _timed(self, phase: str, func):
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(phase, perf_counter() - start)
+
+        return wrapper
+
+    @contextmanager
+    def instrument(self, table, rendered_rows: int):
+        """Time the per-row work of a render of the table
+
+        The methods of the table and of its style are wrapped (on the instances)
+        for the duration of the with statement.
+
+        Args:
+            table (Table): Table that is rendered
+            rendered_rows (int): Number of rows requested from the renderer, used
+                to count how many came from the row cache
+        """
+        style = table._table_style
+        render_row = table._render_row
+        calls_before = self.calls["rows"]
+        cache_before = format_cache_info()
+
+        table._render_row = self._timed("rows", render_row)
+        table._row_texts = self._timed("format", table._row_texts)
+        for name in _STYLE_METHODS:
+            setattr(style, name, self._timed("separators", getattr(style, name)))
+        try:
+            yield self
+        finally:
+            for name in ("_render_row", "_row_texts"):
+                del table.__dict__[name]
+            for name in _STYLE_METHODS:
+                del style.__dict__[name]
+
+            rows = self.calls["rows"] - calls_before
+            self.count("rows_rendered", rows)
+            self.count("row_cache_hits", max(rendered_rows - rows, 0))
+            for before, after in zip(cache_before, format_cache_info()):
+                self.count("format_cache_hits", after.hits - before.hits)
+                self.count("format_cache_misses", after.misses - before.misses)
+
+    def report(self) -> str:
+        """Summary of the recorded phases and counters"""
+        lines = [f"{'phase':<18}{'calls':>10}{'time [s]':>14}"]
+        for phase, duration in sorted(self.times.items(), key=lambda x: -x[1]):
+            lines.append(f"{phase:<18}{self.calls[phase]:>10}{duration:>14.6f}")
+        for counter, value in sorted(self.counters.items()):
+            lines.append(f"{counter:<18}{value:>10}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return self.report()
@@ -0,0 +1,166 @@
+"""Chunked readers of CSV and NPY files, that produce columns for the Table storage"""
+
+import csv
+from itertools import chain, islice
+from typing import IO, Any, Iterable, Iterator, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+
+def require_numpy():
+    if np is None:
+        raise ImportError("numpy is needed to read .npy files")
+    return np
+
+
+# Types of the columns of a CSV file, from the narrowest to the widest
+_KINDS = (int, float, str)
+
+
+def column_kind(values: Iterable[str], kind: type = int) -> type:
+    """Narrowest of int, float and str (but not narrower than kind) that can hold
+    all the values"""
+    values = list(values)
+    for kind in _KINDS[_KINDS.index(kind) :]:
+        if kind is str:
+            return kind
+        try:
+            for value in values:
+                kind(value)
+            return kind
+        except ValueError:
+            pass
+
+
+def parse_column(values: List[str], kind: type = None) -> List[Any]:
+    """Convert a column of strings into integers or floats
+
+    Args:
+        values (List[str]): The column
+        kind (type, optional): int, float or str. Defaults to None, to use the
+            narrowest one that can hold all the values
+    """
+    if kind is None:
+        kind = column_kind(values)
+    if kind is str:
+        return values
+    return [kind(value) for value in values]
+
+
+def resolve_csv_header(reader, header, sample: str):
+    """Find the header of a CSV file
+
+    Args:
+        reader: csv.reader over the file, positioned at the first row
+        header: Names of the columns (the file has no header row), True to use the
+            first row of the file, or None to let csv.Sniffer decide
+        sample (str): Start of the file, given to the csv.Sniffer
+
+    Returns:
+        Tuple[List[str], List[str]]: The header and the first data row (or None if it
+        was not read yet)
+    """
+    if header is None:
+        try:
+            header = csv.Sniffer().has_header(sample)
+        except csv.Error:
+            header = False
+
+    if header is True:
+        return next(reader, []), None
+    if header is False:
+        first_row = next(reader, None)
+        if first_row is None:
+            return [], None
+        return [str(index) for index in range(len(first_row))], first_row
+    return list(header), None
+
+
+def read_csv_rows(
+    file: IO[str], header, **fmtparams
+) -> Tuple[List[str], Iterator[List[str]]]:
+    """Header and data rows of a CSV file, read from its start
+
+    Args:
+        file (IO[str]): The open file
+        header: See resolve_csv_header
+        **fmtparams: Passed to csv.reader
+
+    Returns:
+        Tuple[List[str], Iterator[List[str]]]: The header and an iterator over the
+        rows that follow it
+    """
+    sample = file.read(8192)
+    file.seek(0)
+    reader = csv.reader(file, **fmtparams)
+    header, first_row = resolve_csv_header(reader, header, sample)
+    return header, reader if first_row is None else chain([first_row], reader)
+
+
+def _check_rows(chunk: List[List[str]], ncols: int):
+    for row in chunk:
+        if len(row) != ncols:
+            raise ValueError(f"Expected a row with {ncols} entries, got {row}")
+
+
+def csv_column_kinds(
+    rows: Iterable[List[str]], chunksize: int, ncols: int
+) -> List[type]:
+    """Type (int, float or str) of each column, over all the rows
+
+    A column is only read as numbers if all of its entries are numbers, so the
+    type does not depend on how the rows are split into chunks.
+    """
+    rows = iter(rows)
+    kinds = [int] * ncols
+    while True:
+        chunk = list(islice(rows, chunksize))
+        if not chunk:
+            return kinds
+        _check_rows(chunk, ncols)
+        for col, values in enumerate(zip(*chunk)):
+            if kinds[col] is not str:
+                kinds[col] = column_kind(values, kinds[col])
+
+
+def iter_csv_columns(
+    rows: Iterable[List[str]], chunksize: int, ncols: int, kinds: List[type] = None
+) -> Iterator[List[List[Any]]]:
+    """Read the rows in chunks, each returned as a list of columns
+
+    Args:
+        rows (Iterable[List[str]]): The rows
+        chunksize (int): Number of rows in each chunk
+        ncols (int): Number of columns
+        kinds (List[type], optional): Type of each column, e.g. from
+            csv_column_kinds. Defaults to None, to keep the strings.
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunksize))
+        if not chunk:
+            return
+        _check_rows(chunk, ncols)
+        columns = [list(values) for values in zip(*chunk)]
+        if kinds is not None:
+            columns = [
+                parse_column(values, kind) for values, kind in zip(columns, kinds)
+            ]
+        yield columns
+
+
+def numpy_columns(data) -> List[Any]:
+    """Columns (views, not copies) of a 2-D or structured array"""
+    if data.dtype.names is not None:
+        return [data[name] for name in data.dtype.names]
+    return [data[:, col] for col in range(data.shape[1])]
+
+
+def iter_numpy_columns(data, chunksize: int) -> Iterator[List[Any]]:
+    """Read a 2-D or structured array in chunks of rows, each returned as a list of
+    columns (views of the array)"""
+    for start in range(0, len(data), chunksize):
+        yield numpy_columns(data[start : start + chunksize])
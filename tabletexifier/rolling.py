@@ -0,0 +1,139 @@
+"""Tables that only keep their last rows, with a bounded memory"""
+
+from functools import partial
+from typing import Any, Iterable, List
+
+from .Table import Table
+from .snapshot import restore, snapshot
+from .storage import RingStore
+
+
+class RollingTable(Table):
+    """Table that only keeps its last rows, e.g. to print the progress of a long
+    computation
+
+    Besides the header, the table holds at most capacity rows, in a ring buffer:
+    once it is full, each new row replaces the oldest one. The memory it uses, and
+    the cost of printing it, only depend on the capacity. The widths of the columns
+    are tracked as the rows come and go, so a column shrinks back once its longest
+    entry is dropped.
+
+    Rows can only be added at the end, and there are no multi-row or multi-column
+    cells. The table is built with RollingTable(header, capacity) or from_rows;
+    the other constructors of Table are not available. The row number of a cell
+    (Cell.row_number) is the order in which its row was added, not its current
+    position in the table.
+
+    Args:
+        header (Iterable[str]): Header of the table
+        capacity (int): Number of rows, besides the header, that are kept
+        table_style (str, optional): Style of the table. Defaults to "A&A".
+
+    Raises:
+        ValueError: If the capacity is not positive
+    """
+
+    def __init__(self, header: Iterable[str], capacity: int, table_style: str = "A&A"):
+        self._initial_capacity = capacity
+        super().__init__(header, table_style=table_style)
+
+    def _create_store(self, compact: bool) -> RingStore:
+        return RingStore(self.ncols, self._initial_capacity)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Iterable[Any]],
+        capacity: int,
+        header: Iterable[str] = None,
+        table_style: str = "A&A",
+    ) -> "RollingTable":
+        """Build a rolling table with the last capacity rows of a 2-D iterable
+
+        The rows are read one at a time, so only the rows that are kept are ever
+        held in memory.
+
+        Args:
+            rows (Iterable[Iterable[Any]]): Rows, in the order of the header
+            capacity (int): Number of rows, besides the header, that are kept
+            header (Iterable[str], optional): Header of the table. If None, the first
+                row is used as the header. Defaults to None.
+            table_style (str, optional): Style of the table. Defaults to "A&A".
+
+        Raises:
+            ValueError: If no header is given and there are no rows, or if the
+                capacity is not positive
+
+        Returns:
+            RollingTable: The new table
+        """
+        rows = iter(rows)
+        if header is None:
+            header = next(rows, None)
+            if header is None:
+                raise ValueError("Can't build a Table without a header")
+        table = cls(list(header), capacity, table_style=table_style)
+        table._extend_rows(rows)
+        return table
+
+    @property
+    def capacity(self) -> int:
+        """Number of rows, besides the header, that are kept"""
+        return self._store.capacity
+
+    @property
+    def dropped_rows(self) -> int:
+        """Number of rows that were replaced by newer ones"""
+        return self._store.dropped
+
+    def add_row(self, row, multirow=None, multicol=None):
+        """Add a row at the end of the table, replacing the oldest one if the table
+        is full"""
+        dropped = self._store.dropped
+        self._store.append_row(row)
+        if self._store.dropped != dropped:
+            # Every row moved up by one, so none of the rendered rows can be re-used
+            self._invalidate_render_cache()
+        else:
+            self._render_cache.clear()
+            self._version += 1
+        # The storage keeps the widths up to date, so they are cheap to get again
+        self._stale_widths.update(range(self.ncols))
+
+    def _extend_rows(self, rows: Iterable[Iterable[Any]]):
+        super()._extend_rows(rows)
+        self._row_cache.clear()
+
+    def _extend_columns(self, columns: List[List[Any]]):
+        super()._extend_columns(columns)
+        self._row_cache.clear()
+
+    def __reduce__(self):
+        return restore, (snapshot(self), partial(type(self), capacity=self.capacity))
+
+    def _unsupported(self, *args, **kwargs):
+        raise TypeError(
+            "Rolling tables can only add rows at the end, and have no multi-row or "
+            "multi-column cells"
+        )
+
+    def _unsupported_constructor(cls, *args, **kwargs):
+        raise TypeError(
+            f"Build a {cls.__name__} with {cls.__name__}(header, capacity) or with "
+            f"{cls.__name__}.from_rows"
+        )
+
+    from_columns = classmethod(_unsupported_constructor)
+    from_numpy = classmethod(_unsupported_constructor)
+    from_dataframe = classmethod(_unsupported_constructor)
+    from_csv = classmethod(_unsupported_constructor)
+    from_npy = classmethod(_unsupported_constructor)
+    concat = classmethod(_unsupported_constructor)
+    load = classmethod(_unsupported_constructor)
+
+    insert_rows = _unsupported
+    delete_rows = _unsupported
+    filter = _unsupported
+    sort_by = _unsupported
+    set_cell_as_multi_row = _unsupported
+    set_cell_as_multi_col = _unsupported
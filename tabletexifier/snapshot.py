@@ -0,0 +1,270 @@
+"""Flat snapshots of a Table, used to pickle it and to save it into a binary file
+
+A snapshot holds the contents of the table per column, plus only the cells that
+differ from the defaults (spans, blank cells, decimal places, design), so that its
+size grows linearly with the table and it never goes through the Cell objects of
+a compact table.
+
+Layout of the files written by save:
+
+    - the magic bytes b"TTXSNAP\\x01"
+    - length of the metadata, as an 8-byte little-endian unsigned integer
+    - metadata, as UTF-8 JSON (padded with spaces to a multiple of 8 bytes)
+    - the numeric columns, as raw little-endian float64 ("d") or int64 ("q")
+      buffers, each one starting on a multiple of 8 bytes
+
+The other columns (and the header) are part of the metadata. load can memory-map
+the file, in which case the numeric columns are only read once they are used.
+"""
+
+import json
+import mmap as _mmap
+import struct
+import sys
+from array import array
+from typing import Any, Dict
+
+from .formatting import ColumnFormat
+from .storage import (
+    ChunkedStore,
+    ColumnStore,
+    GridStore,
+    RingStore,
+    _from_buffer,
+    _is_buffer,
+)
+
+MAGIC = b"TTXSNAP\x01"
+_LENGTH = struct.Struct("<Q")
+_ALIGNMENT = 8
+
+# Numeric columns that are written as raw buffers
+_TYPECODES = {float: "d", int: "q"}
+
+
+def _is_compact(store) -> bool:
+    """Whether the cells are held by a ColumnStore, behind the chunks and views"""
+    if isinstance(store, ChunkedStore):
+        return _is_compact(store.chunks[0])
+    if isinstance(store, (ColumnStore, GridStore, RingStore)):
+        return isinstance(store, ColumnStore)
+    # Views of another storage
+    return _is_compact(store._store)
+
+
+def snapshot(table) -> Dict[str, Any]:
+    """Flat state of a table, from which restore builds it again
+
+    Args:
+        table (Table): The table
+
+    Returns:
+        Dict[str, Any]: The header, the columns (typed arrays for the columns of
+            numbers of a compact storage, lists otherwise), the per-column formats
+            and the cells that differ from the defaults
+    """
+    store = table._store
+    if isinstance(store, ColumnStore):
+        columns = [_own_column(values) for values in store._columns]
+    else:
+        columns = [store.get_values(col) for col in range(table.ncols)]
+
+    style = table._table_style
+    return {
+        "header": [cell.content for cell in store.get_row(0)],
+        "columns": columns,
+        "compact": _is_compact(store),
+        "table_style": table._table_style_name,
+        "decimal_places": list(store.decimal_places),
+        "column_formats": [_dump_format(fmt) for fmt in store.column_formats],
+        "cells": [[row, col, state] for row, col, state in store.cell_states()],
+        "table_properties": dict(style.table_properties),
+        "extra_hline": list(style.extra_hline),
+        "extra_vline": list(style.extra_vline),
+    }
+
+
+def _own_column(values):
+    """Column of a ColumnStore that can be pickled: the memoryviews of a loaded
+    file are copied into typed arrays"""
+    if values is None:
+        return []
+    if isinstance(values, memoryview):
+        return array(values.format, values.tobytes())
+    return values
+
+
+def restore(state: Dict[str, Any], cls):
+    """Build a table from its snapshot
+
+    Args:
+        state (Dict[str, Any]): The snapshot
+        cls (type): Class of the new table, e.g. Table
+
+    Returns:
+        Table: The new table
+    """
+    # compact is only given when it is set, for the classes without that option
+    options = {"compact": True} if state["compact"] else {}
+    table = cls(state["header"], table_style=state["table_style"], **options)
+    columns = state["columns"]
+    if columns and len(columns[0]):
+        table._extend_columns(columns)
+
+    store = table._store
+    store.decimal_places[:] = state["decimal_places"]
+    store.column_formats[:] = [_load_format(fmt) for fmt in state["column_formats"]]
+    for row, col, cell_state in state["cells"]:
+        store.set_cell_state(row, col, cell_state)
+        dimension = cell_state.get("dimension")
+        if dimension is not None and tuple(dimension) != (1, 1):
+            store.spans.add(row, col, *dimension)
+
+    style = table._table_style
+    style.table_properties = dict(state["table_properties"])
+    style.extra_hline = list(state["extra_hline"])
+    style.extra_vline = list(state["extra_vline"])
+    style._reset_layout()
+    table._stale_widths.update(range(table.ncols))
+    table._invalidate_render_cache()
+    return table
+
+
+def _dump_format(fmt: ColumnFormat):
+    if fmt is None:
+        return None
+    return {
+        "precision": fmt.precision,
+        "notation": fmt.notation,
+        "uncertainty": fmt.uncertainty,
+        "siunitx": fmt.siunitx,
+    }
+
+
+def _load_format(fmt: Dict[str, Any]) -> ColumnFormat:
+    return None if fmt is None else ColumnFormat(**fmt)
+
+
+def save(table, path):
+    """Write the snapshot of a table into a binary file
+
+    Args:
+        table (Table): The table
+        path: Path of the file
+
+    Raises:
+        TypeError: If the table holds contents other than numbers, strings,
+            booleans, None and tuples of those
+    """
+    state = snapshot(table)
+    buffers = []
+    size = 0
+    columns = state.pop("columns")
+    for col, values in enumerate(columns):
+        typed = _plain_column(values)
+        if not isinstance(typed, array):
+            columns[col] = _encode(typed)
+            continue
+        if sys.byteorder == "big":
+            typed = array(typed.typecode, typed)
+            typed.byteswap()
+        buffers.append(typed)
+        columns[col] = {"__buffer__": [typed.typecode, size, len(typed)]}
+        size += len(typed) * typed.itemsize
+
+    metadata = _encode(state)
+    metadata["columns"] = columns
+    metadata = json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+    metadata += b" " * (-len(metadata) % _ALIGNMENT)
+
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(_LENGTH.pack(len(metadata)))
+        file.write(metadata)
+        for typed in buffers:
+            typed.tofile(file)
+
+
+def load(path, cls, mmap: bool = True):
+    """Build a table from a file written by save
+
+    Args:
+        path: Path of the file
+        cls (type): Class of the new table, e.g. Table
+        mmap (bool, optional): Memory-map the file, so that the numeric columns of
+            a compact table are only read once they are used. Defaults to True.
+
+    Raises:
+        ValueError: If the file is not a snapshot of a table
+
+    Returns:
+        Table: The new table
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a snapshot of a table")
+        (length,) = _LENGTH.unpack(file.read(_LENGTH.size))
+        state = json.loads(file.read(length).decode("utf-8"), object_hook=_decode)
+
+        # The numeric columns are given by the location of their buffer
+        columns = state["columns"]
+        buffers = any(isinstance(values, dict) for values in columns)
+        data = None
+        if buffers and mmap and sys.byteorder == "little":
+            data = memoryview(_mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ))
+            data = data[len(MAGIC) + _LENGTH.size + length :]
+        elif buffers:
+            data = file.read()
+
+    for col, values in enumerate(columns):
+        if not isinstance(values, dict):
+            continue
+        typecode, offset, n_values = values["__buffer__"]
+        raw = data[offset : offset + n_values * array(typecode).itemsize]
+        if isinstance(raw, memoryview):
+            columns[col] = raw.cast(typecode)
+        else:
+            column = array(typecode)
+            column.frombytes(raw)
+            if sys.byteorder == "big":
+                column.byteswap()
+            columns[col] = column
+    return restore(state, cls)
+
+
+def _plain_column(values):
+    """Column as a float64 or int64 array, if it only holds numbers of one of those
+    types, or as a list"""
+    if _is_buffer(values):
+        values = _from_buffer(values)
+    if isinstance(values, array):
+        if values.typecode in "dq":
+            return values
+        values = values.tolist()
+    types = set(map(type, values))
+    typecode = _TYPECODES.get(types.pop()) if len(types) == 1 else None
+    if typecode is not None:
+        try:
+            return array(typecode, values)
+        except OverflowError:
+            pass
+    return list(values)
+
+
+def _encode(value):
+    """Convert a value into JSON, tagging the tuples so that they are restored"""
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    raise TypeError(f"Can not save a {type(value).__name__} into a snapshot")
+
+
+def _decode(obj: Dict[str, Any]):
+    if len(obj) == 1 and "__tuple__" in obj:
+        return tuple(obj["__tuple__"])
+    return obj
@@ -0,0 +1,171 @@
+"""Index of the cells that span over multiple rows and/or columns
+
+Each span is a rectangle of cells, owned by the cell in its upper-left corner (the
+origin). The index maps every cell of a span to that span, so that the renderers
+can ask, in constant time, whether a cell is covered by a span and which one.
+"""
+
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from .exceptions import OverlappingSpans
+
+
+class Span(NamedTuple):
+    row: int
+    col: int
+    nrows: int
+    ncols: int
+
+    def covers(self, row: int, col: int) -> bool:
+        return (
+            self.row <= row < self.row + self.nrows
+            and self.col <= col < self.col + self.ncols
+        )
+
+    def cells(self) -> Iterator[Tuple[int, int]]:
+        for row in range(self.row, self.row + self.nrows):
+            for col in range(self.col, self.col + self.ncols):
+                yield row, col
+
+
+class SpanIndex:
+    """Spans of a table, indexed by each of the cells they cover"""
+
+    def __init__(self):
+        # origin -> span
+        self._spans: Dict[Tuple[int, int], Span] = {}
+        # every cell of a span (including its origin) -> span
+        self._owners: Dict[Tuple[int, int], Span] = {}
+
+    def add(
+        self, row: int, col: int, nrows: int, ncols: int
+    ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """Add a span, or resize the span that starts on the same cell
+
+        Args:
+            row (int): Row of the origin of the span
+            col (int): Column of the origin of the span
+            nrows (int): Number of rows covered by the span
+            ncols (int): Number of columns covered by the span
+
+        Raises:
+            OverlappingSpans: If the span covers a cell of another span
+
+        Returns:
+            Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]: The cells that were
+            not yet covered by the span (without its origin), and the cells that
+            are no longer covered by it, once it is resized to fewer cells
+        """
+        if nrows < 1 or ncols < 1:
+            raise ValueError(
+                f"A span must cover at least one cell. Got {nrows}x{ncols}"
+            )
+        span = Span(row, col, nrows, ncols)
+        previous = self._spans.get((row, col))
+
+        for cell in span.cells():
+            owner = self._owners.get(cell)
+            if owner is not None and owner != previous:
+                raise OverlappingSpans(
+                    f"The span of {nrows}x{ncols} cells on {row=}, {col=} overlaps "
+                    f"the span of {owner.nrows}x{owner.ncols} cells on "
+                    f"row={owner.row}, col={owner.col}"
+                )
+
+        if previous is not None:
+            self._remove(previous)
+        self._spans[(row, col)] = span
+        for cell in span.cells():
+            self._owners[cell] = span
+        covered = [
+            cell
+            for cell in span.cells()
+            if cell != (row, col) and (previous is None or not previous.covers(*cell))
+        ]
+        released = []
+        if previous is not None:
+            released = [cell for cell in previous.cells() if not span.covers(*cell)]
+        return covered, released
+
+    def remap_rows(
+        self, mapping: List[int], stretch: bool = False
+    ) -> Tuple[List[Span], List[Tuple[int, int]]]:
+        """Find where the spans go once the rows of the table are moved. The index
+        itself is not changed, see reset.
+
+        A span follows its origin: it loses the rows that are removed, and is
+        dropped if its origin is removed. The remaining rows of a span must still
+        be consecutive, unless stretch is True (e.g. when rows are inserted in
+        the middle of a span), in which case the span grows over the gaps.
+
+        Args:
+            mapping (List[int]): New position of each row, or None if it is removed
+            stretch (bool, optional): Grow the spans over the gaps between their
+                rows. Defaults to False.
+
+        Raises:
+            ValueError: If the rows of a span are no longer consecutive
+
+        Returns:
+            Tuple[List[Span], List[Tuple[int, int]]]: The spans at their new
+            positions, and the (new positions of the) cells that were covered by
+            a span that was dropped
+        """
+        spans, released = [], []
+        for span in self._spans.values():
+            rows = [mapping[row] for row in range(span.row, span.row + span.nrows)]
+            kept = [row for row in rows if row is not None]
+            cols = range(span.col, span.col + span.ncols)
+            if rows[0] is None:
+                released.extend((row, col) for row in kept for col in cols)
+                continue
+
+            if stretch:
+                nrows = max(kept) - rows[0] + 1
+            elif kept == list(range(rows[0], rows[0] + len(kept))):
+                nrows = len(kept)
+            else:
+                raise ValueError(
+                    f"The rows of the span on row={span.row}, col={span.col} would "
+                    "no longer be consecutive"
+                )
+            spans.append(Span(rows[0], span.col, nrows, span.ncols))
+        return spans, released
+
+    def reset(self, spans: Iterable[Span]):
+        """Replace all spans of the index"""
+        self._spans.clear()
+        self._owners.clear()
+        for span in spans:
+            self.add(*span)
+
+    def _remove(self, span: Span):
+        del self._spans[(span.row, span.col)]
+        for cell in span.cells():
+            del self._owners[cell]
+
+    def owner(self, row: int, col: int) -> Span:
+        """Span that covers the cell, or None"""
+        return self._owners.get((row, col))
+
+    def is_covered(self, row: int, col: int) -> bool:
+        """Check if the cell is covered by a span that starts on some other cell"""
+        span = self._owners.get((row, col))
+        return span is not None and (span.row, span.col) != (row, col)
+
+    def continues_left(self, row: int, col: int) -> bool:
+        """Check if the cell belongs to the same span as the one on its left"""
+        span = self._owners.get((row, col))
+        return span is not None and span.col < col
+
+    def continues_above(self, row: int, col: int) -> bool:
+        """Check if the cell belongs to the same span as the one above it"""
+        span = self._owners.get((row, col))
+        return span is not None and span.row < row
+
+    def __iter__(self) -> Iterator[Span]:
+        return iter(self._spans.values())
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
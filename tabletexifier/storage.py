@@ -0,0 +1,1292 @@
+"""Storage back-ends for the cells of a Table
+
+Both storages expose the same interface, so that the Table (and its renderers)
+never have to know which one is in use:
+
+    - GridStore -- row-major grid with one Cell object per entry
+    - ColumnStore -- compact storage, with the contents of each column stored in a
+      typed array (or in a numpy array, which is referenced instead of copied) and
+      the Cells only created when someone asks for them
+    - ChunkedStore -- other storages (the chunks) joined along their rows or
+      columns, without copying their cells; see Table.concat
+    - RingStore -- ring buffer of Cell objects that only keeps the last rows; see
+      RollingTable
+    - MovedStore -- placeholder for the tables that were moved into another one
+
+The decimal places are kept per column, so that changing them never has to go
+through the cells; a cell only stores its own decimal places if they were set
+through Cell.set_decimal_places.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from functools import partial
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+from .Cell import _DEFAULT_DESIGN_PROPERTIES, Cell, CellView
+from .exceptions import CellNotFound, ColumnDoesNotExist, RowDoesNotExist
+from .spans import Span, SpanIndex
+from .formatting import ColumnFormat, format_column, is_numeric_column
+
+
+def _is_ndarray(values) -> bool:
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def _is_buffer(values) -> bool:
+    """Columns that are referenced instead of copied: numpy arrays, and memoryviews
+    (e.g. of a memory-mapped file, see snapshot.load)"""
+    return isinstance(values, memoryview) or _is_ndarray(values)
+
+
+def _from_buffer(values):
+    """Copy a referenced column into a typed array (or a list)"""
+    if isinstance(values, memoryview):
+        column = array(values.format)
+        column.frombytes(values.cast("B"))
+        return column
+    return _from_ndarray(values)
+
+
+def _from_ndarray(values):
+    """Copy a numpy column into a typed array (or a list for other dtypes)"""
+    kind, itemsize = values.dtype.kind, values.dtype.itemsize
+    if kind == "f":
+        column = array("d")
+        column.frombytes(values.astype(np.float64).tobytes())
+        return column
+    if kind == "i" or (kind == "u" and itemsize < 8):
+        column = array("q")
+        column.frombytes(values.astype(np.int64).tobytes())
+        return column
+    # tolist converts the numpy scalars into the python types
+    return values.tolist()
+
+
+def cell_state(cell: Cell) -> Dict[str, Any]:
+    """Everything of a cell that differs from the defaults (besides its content), in
+    the format of the per-cell state of ColumnStore"""
+    state = {}
+    if tuple(cell.dimension) != (1, 1):
+        state["dimension"] = tuple(cell.dimension)
+    if cell.is_blank:
+        state["is_blank"] = True
+    if cell._decimal_places is not None:
+        state["decimal_places"] = cell._decimal_places
+    if cell._design_properties is not None:
+        state["design"] = dict(cell._design_properties)
+    return state
+
+
+def cell_texts(cells: List[Cell], fmt: str) -> List[str]:
+    """Text or LaTeX representation of each cell"""
+    if fmt == "text":
+        return [cell.generate_text() for cell in cells]
+    return [cell.generate_LaTeX() for cell in cells]
+
+
+def iter_cell_states(store) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+    """(row, col, state) of the cells of a storage that differ from the defaults,
+    found by going through all of its cells"""
+    for row in range(store.nrows):
+        for col, cell in enumerate(store.get_row(row)):
+            state = cell_state(cell)
+            if state:
+                yield row, col, state
+
+
+class GridStore:
+    """Row-major grid of Cell objects: _rows[row][col]"""
+
+    def __init__(self, ncols: int):
+        self.ncols = ncols
+        self._rows: List[List[Cell]] = []
+        self.decimal_places: List[int] = [2] * ncols
+        self.column_formats: List[ColumnFormat] = [None] * ncols
+        self.spans = SpanIndex()
+        # Cells with decimal places of their own
+        self._decimal_overrides = set()
+        # Called with (row, col) whenever the representation of a cell changes
+        self.on_change = None
+        # (ChunkedStore, row shift, column shift), once this is one of its chunks
+        self.chunk_of = None
+
+    @property
+    def nrows(self) -> int:
+        return len(self._rows)
+
+    def append_row(self, values: Iterable[Any]):
+        values = list(values)
+        self._check_row(values)
+        row_number = len(self._rows)
+        self._rows.append(
+            [
+                Cell(content=val, origin=[row_number, index], store=self)
+                for index, val in enumerate(values)
+            ]
+        )
+
+    def extend_rows(self, rows: Iterable[Iterable[Any]]):
+        row_number = len(self._rows)
+        try:
+            self._rows.extend(
+                self._check_row(
+                    [
+                        Cell(content=val, origin=[row, index], store=self)
+                        for index, val in enumerate(values)
+                    ]
+                )
+                for row, values in enumerate(rows, start=row_number)
+            )
+        except ValueError:
+            # No row is added if one of them is invalid
+            del self._rows[row_number:]
+            raise
+
+    def _check_row(self, values: List[Any]) -> List[Any]:
+        if len(values) != self.ncols:
+            raise ValueError(
+                f"Expected a row with {self.ncols} entries, got {len(values)}"
+            )
+        return values
+
+    def extend_columns(self, columns: List[List[Any]]):
+        if len({len(values) for values in columns}) > 1:
+            raise ValueError("All columns must have the same number of entries")
+        self.extend_rows(zip(*columns))
+
+    def get_row(self, row: int) -> List[Cell]:
+        """Return the cells of one row. The returned list must not be changed"""
+        if not isinstance(row, int) or not 0 <= row < len(self._rows):
+            raise RowDoesNotExist(f"Row {row} does not exist")
+        return self._rows[row]
+
+    def row_texts(self, row: int, fmt: str) -> List[str]:
+        """Representation of the cells of a row"""
+        return cell_texts(self.get_row(row), fmt)
+
+    def get_column(self, col: int) -> List[Cell]:
+        if not isinstance(col, int) or not 0 <= col < self.ncols:
+            raise ColumnDoesNotExist(f"Column {col} does not exist")
+        return [row[col] for row in self._rows]
+
+    def get_cell(self, row: int, col: int) -> Cell:
+        try:
+            if row < 0 or col < 0:
+                raise IndexError
+            return self._rows[row][col]
+        except (IndexError, TypeError):
+            raise CellNotFound(f"Did not found a cell on {row=}, {col=}") from None
+
+    def neighbour(self, origin, row_offset: int, col_offset: int):
+        if self.chunk_of is not None:
+            return _chunk_neighbour(self.chunk_of, origin, row_offset, col_offset)
+        row, col = origin[0] + row_offset, origin[1] + col_offset
+        if 0 <= row < len(self._rows) and 0 <= col < len(self._rows[row]):
+            return self._rows[row][col]
+        return None
+
+    def cell_changed(self, row: int, col: int):
+        if self.on_change is not None:
+            self.on_change(row, col)
+
+    def set_blank(self, row: int, col: int, is_blank: bool = True):
+        # The cell notifies the change
+        self.get_cell(row, col).is_blank = is_blank
+
+    def update_size(self, row: int, col: int, nrows=None, ncols=None):
+        self.get_cell(row, col).update_size(nrows=nrows, ncols=ncols)
+
+    def get_values(self, col: int) -> List[Any]:
+        """Contents of one column, without the header"""
+        return [row[col].content for row in self._rows[1:]]
+
+    def insert_rows(self, index: int, rows: List[List[Any]]):
+        """Insert the rows before the row with the given index"""
+        self._rows[index:index] = [
+            [
+                Cell(content=val, origin=[row, col], store=self)
+                for col, val in enumerate(values)
+            ]
+            for row, values in enumerate(rows, start=index)
+        ]
+        self._update_origins(index + len(rows))
+
+    def take_rows(self, order: List[int]):
+        """Keep only the rows with the indexes in order, in that order"""
+        kept = set(order)
+        for row, cells in enumerate(self._rows):
+            if row not in kept:
+                self._decimal_overrides.difference_update(cells)
+        self._rows = [self._rows[row] for row in order]
+        self._update_origins(0)
+
+    def _update_origins(self, start: int):
+        # The neighbours are found through the position of the cells in the grid,
+        # so the row of each origin is all that has to change
+        for row in range(start, len(self._rows)):
+            for cell in self._rows[row]:
+                cell.origin[0] = row
+
+    def set_cell_decimal_places(self, row: int, col: int, value: int):
+        # The cell already holds the value, only keep track of it
+        self._decimal_overrides.add(self.get_cell(row, col))
+
+    def set_decimal_places(self, value: int, columns: Iterable[int]):
+        """Set the decimal places of the columns, also for the rows added later;
+        does not call on_change"""
+        columns = set(columns)
+        for col in columns:
+            self.decimal_places[col] = value
+        for cell in [c for c in self._decimal_overrides if c.origin[1] in columns]:
+            cell._decimal_places = None
+            self._decimal_overrides.discard(cell)
+
+    def column_width(self, col: int, header: bool = True) -> int:
+        """Length of the longest text representation in one column"""
+        rows = self._rows if header else self._rows[1:]
+        return max(
+            (len(row[col].generate_text()) for row in rows if col < len(row)),
+            default=0,
+        )
+
+    @classmethod
+    def join(cls, stores: List["GridStore"], axis: int) -> "GridStore":
+        """Storage with the cells of the stores, which are moved (not copied) into
+        it; see ChunkedStore.consolidate"""
+        if axis == 0:
+            ncols = stores[0].ncols
+            rows = list(stores[0]._rows)
+            for store in stores[1:]:
+                rows.extend(store._rows[1:])
+        else:
+            ncols = sum(store.ncols for store in stores)
+            rows = [
+                list(chain.from_iterable(cells))
+                for cells in zip(*(store._rows for store in stores))
+            ]
+
+        joined = cls(ncols)
+        joined._rows = rows
+        for row, cells in enumerate(rows):
+            for col, cell in enumerate(cells):
+                cell.origin = [row, col]
+                cell._store = joined
+        joined._decimal_overrides = {
+            cell
+            for store in stores
+            for cell in store._decimal_overrides
+            if cell._store is joined
+        }
+        return joined
+
+    def cell_states(self) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """(row, col, state) of the cells that differ from the defaults"""
+        return iter_cell_states(self)
+
+    def set_cell_state(self, row: int, col: int, state: Dict[str, Any]):
+        """Restore the state of a cell, as given by cell_states; does not call
+        on_change"""
+        cell = self.get_cell(row, col)
+        if "dimension" in state:
+            cell.dimension = list(state["dimension"])
+        cell._is_blank = state.get("is_blank", False)
+        if "decimal_places" in state:
+            cell._decimal_places = state["decimal_places"]
+            self._decimal_overrides.add(cell)
+        if "design" in state:
+            cell._design_properties = dict(state["design"])
+        cell._clear_cache()
+
+
+class ColumnStore:
+    """Compact, column-oriented storage.
+
+    The first row (the header) is kept as a plain list, so that the data columns can
+    be stored as typed arrays: a column starts as an array of floats ("d") or of
+    integers ("q"), depending on its first value, and falls back to a list once
+    some other type shows up. Everything besides the content (spans, blank cells,
+    design properties, decimal places) is only stored for the cells that deviate
+    from the defaults.
+
+    A numeric numpy array (or memoryview) given to extend_columns, while the column
+    is still empty, is referenced by the storage (zero-copy); it is only copied into
+    a typed array once more rows are added to that column. Changes made to the array
+    afterwards are not tracked by the table.
+    """
+
+    _TYPECODES = {float: "d", int: "q"}
+
+    def __init__(self, ncols: int):
+        self.ncols = ncols
+        self._nrows = 0
+        self._header: List[Any] = []
+        self._columns: List[Any] = [None] * ncols
+
+        # (row, col) -> {"dimension", "is_blank", "decimal_places", "design"}
+        self._state: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        # Text of the entries of each column (None until it is formatted), and the
+        # [decimal places, formats] of the columns they were formatted with
+        self._texts: List[List[str]] = [None] * ncols
+        self._texts_format = None
+
+        self.decimal_places: List[int] = [2] * ncols
+        self.column_formats: List[ColumnFormat] = [None] * ncols
+        self.spans = SpanIndex()
+
+        # Called with (row, col) whenever the representation of a cell changes
+        self.on_change = None
+        # (ChunkedStore, row shift, column shift), once this is one of its chunks
+        self.chunk_of = None
+
+    @property
+    def nrows(self) -> int:
+        return self._nrows
+
+    def _append_to_column(self, col: int, value):
+        self._texts[col] = None
+        column = self._columns[col]
+        if _is_buffer(column):
+            column = _from_buffer(column)
+            self._columns[col] = column
+        if column is None:
+            typecode = self._TYPECODES.get(type(value))
+            column = array(typecode) if typecode is not None else []
+            self._columns[col] = column
+
+        if isinstance(column, array):
+            if self._TYPECODES.get(type(value)) == column.typecode:
+                try:
+                    column.append(value)
+                    return
+                except OverflowError:
+                    pass
+            column = list(column)
+            self._columns[col] = column
+        column.append(value)
+
+    def set_content(self, row: int, col: int, value):
+        """Replace the content of a cell; the column falls back to a list if the
+        value does not fit in its typed array"""
+        if not 0 <= row < self._nrows or not 0 <= col < self.ncols:
+            raise CellNotFound(f"Did not found a cell on {row=}, {col=}")
+        if row == 0:
+            self._header[col] = value
+            self.cell_changed(row, col)
+            return
+
+        self._texts[col] = None
+        column = self._columns[col]
+        if _is_buffer(column):
+            column = _from_buffer(column)
+            self._columns[col] = column
+        if isinstance(column, array):
+            if self._TYPECODES.get(type(value)) == column.typecode:
+                try:
+                    column[row - 1] = value
+                    self.cell_changed(row, col)
+                    return
+                except OverflowError:
+                    pass
+            column = list(column)
+            self._columns[col] = column
+        column[row - 1] = value
+        self.cell_changed(row, col)
+
+    def append_row(self, values: Iterable[Any]):
+        values = list(values)
+        if len(values) != self.ncols:
+            raise ValueError(
+                f"Expected a row with {self.ncols} entries, got {len(values)}"
+            )
+
+        if self._nrows == 0:
+            self._header = values
+        else:
+            for col, val in enumerate(values):
+                self._append_to_column(col, val)
+        self._nrows += 1
+
+    def _extend_column(self, col: int, values: List[Any]):
+        self._texts[col] = None
+        column = self._columns[col]
+        if _is_buffer(values):
+            if column is None and is_numeric_column(values):
+                self._columns[col] = values
+                return
+            values = _from_buffer(values)
+        if _is_buffer(column):
+            column = _from_buffer(column)
+            self._columns[col] = column
+
+        if isinstance(values, array):
+            # e.g. from the readers, extended without going through python objects
+            typecode = values.typecode
+        else:
+            types = set(map(type, values))
+            typecode = self._TYPECODES.get(types.pop()) if len(types) == 1 else None
+
+        if column is None:
+            column = array(typecode) if typecode is not None else []
+            self._columns[col] = column
+
+        if isinstance(column, array):
+            if typecode == column.typecode:
+                try:
+                    column.extend(values)
+                    return
+                except OverflowError:
+                    pass
+            column = list(column)
+            self._columns[col] = column
+        column.extend(values)
+
+    def extend_columns(self, columns: List[List[Any]]):
+        """Add the data of entire columns at once. The header must already exist"""
+        if len(columns) != self.ncols:
+            raise ValueError(f"Expected {self.ncols} columns, got {len(columns)}")
+        lengths = {len(values) for values in columns}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same number of entries")
+        if self._nrows == 0:
+            raise ValueError("The header must be added before the columns")
+
+        for col, values in enumerate(columns):
+            self._extend_column(col, values)
+        self._nrows += lengths.pop() if lengths else 0
+
+    def extend_rows(self, rows: Iterable[Iterable[Any]]):
+        rows = iter(rows)
+        if self._nrows == 0:
+            header = next(rows, None)
+            if header is None:
+                return
+            self.append_row(header)
+
+        rows = [list(values) for values in rows]
+        for values in rows:
+            if len(values) != self.ncols:
+                raise ValueError(
+                    f"Expected a row with {self.ncols} entries, got {len(values)}"
+                )
+        if rows:
+            self.extend_columns([list(values) for values in zip(*rows)])
+
+    def get_values(self, col: int) -> List[Any]:
+        """Contents of one column, without the header"""
+        column = self._columns[col]
+        if column is None:
+            return []
+        if _is_buffer(column):
+            return column.tolist()
+        return list(column)
+
+    def insert_rows(self, index: int, rows: List[List[Any]]):
+        """Insert the rows before the row with the given index (after the header)"""
+        split = index - 1
+        self._texts = [None] * self.ncols
+        for col, values in enumerate(zip(*rows)):
+            column = self._columns[col]
+            if column is None:
+                parts = [list(values)]
+            else:
+                parts = [column[:split], list(values), column[split:]]
+            self._columns[col] = None
+            for part in parts:
+                if len(part):
+                    self._extend_column(col, part)
+
+        n_rows = len(rows)
+        self._nrows += n_rows
+        self._state = {
+            (row + n_rows if row >= index else row, col): state
+            for (row, col), state in self._state.items()
+        }
+
+    def take_rows(self, order: List[int]):
+        """Keep only the rows with the indexes in order, in that order. The header
+        must stay as the first row"""
+        data_rows = [row - 1 for row in order[1:]]
+        self._texts = [None] * self.ncols
+        for col, column in enumerate(self._columns):
+            if column is None:
+                continue
+            if _is_ndarray(column):
+                column = column[np.asarray(data_rows, dtype=np.intp)]
+            elif isinstance(column, memoryview):
+                column = array(column.format, [column[row] for row in data_rows])
+            elif isinstance(column, array):
+                column = array(column.typecode, [column[row] for row in data_rows])
+            else:
+                column = [column[row] for row in data_rows]
+            self._columns[col] = column
+
+        new_rows = {old: new for new, old in enumerate(order)}
+        self._nrows = len(order)
+        self._state = {
+            (new_rows[row], col): state
+            for (row, col), state in self._state.items()
+            if row in new_rows
+        }
+
+    def _content(self, row: int, col: int):
+        if row == 0:
+            return self._header[col]
+        column = self._columns[col]
+        if _is_ndarray(column):
+            return column[row - 1].item()
+        return column[row - 1]
+
+    def get_cell(self, row: int, col: int) -> CellView:
+        if (
+            not isinstance(row, int)
+            or not isinstance(col, int)
+            or not 0 <= row < self._nrows
+            or not 0 <= col < self.ncols
+        ):
+            raise CellNotFound(f"Did not found a cell on {row=}, {col=}")
+
+        cell = CellView(
+            content=self._content(row, col), origin=[row, col], store=self
+        )
+        state = self._state.get((row, col))
+        if state is not None:
+            if "dimension" in state:
+                cell.dimension = list(state["dimension"])
+            cell._is_blank = state.get("is_blank", False)
+            if "decimal_places" in state:
+                cell._decimal_places = state["decimal_places"]
+            if "design" in state:
+                cell._design_properties = dict(state["design"])
+        return cell
+
+    def get_row(self, row: int) -> List[CellView]:
+        if not isinstance(row, int) or not 0 <= row < self._nrows:
+            raise RowDoesNotExist(f"Row {row} does not exist")
+        return [self.get_cell(row, col) for col in range(self.ncols)]
+
+    def get_column(self, col: int) -> List[CellView]:
+        if not isinstance(col, int) or not 0 <= col < self.ncols:
+            raise ColumnDoesNotExist(f"Column {col} does not exist")
+        return [self.get_cell(row, col) for row in range(self._nrows)]
+
+    def row_texts(self, row: int, fmt: str) -> List[str]:
+        """Representation of the cells of a row. The text of the cells without
+        some state of their own is taken from their column, formatted in a single
+        batch; no cell is created for them"""
+        if fmt != "text" or row == 0:
+            return cell_texts(self.get_row(row), fmt)
+        if not isinstance(row, int) or not 0 <= row < self._nrows:
+            raise RowDoesNotExist(f"Row {row} does not exist")
+        self._check_texts_format()
+        columns = self._texts
+        if None in columns:
+            columns = [self._column_texts(col) for col in range(self.ncols)]
+        index, state = row - 1, self._state
+        if not state:
+            return [texts[index] for texts in columns]
+        return [
+            self.get_cell(row, col).generate_text()
+            if (row, col) in state
+            else texts[index]
+            for col, texts in enumerate(columns)
+        ]
+
+    def _check_texts_format(self):
+        """Drop the texts of the columns if their decimal places or formats changed
+        (those are lists that the table changes directly)"""
+        formats = [self.decimal_places, self.column_formats]
+        if self._texts_format != formats:
+            self._texts = [None] * self.ncols
+            self._texts_format = [list(values) for values in formats]
+
+    def _column_texts(self, col: int) -> List[str]:
+        """Text of the entries of a column (without the header), formatted in a
+        single batch; kept until the column, its decimal places or format change"""
+        self._check_texts_format()
+        texts = self._texts[col]
+        if texts is None:
+            column = self._columns[col]
+            texts = []
+            if column is not None:
+                texts = format_column(
+                    column, self.decimal_places[col], self.column_formats[col]
+                )
+            self._texts[col] = texts
+        return texts
+
+    def neighbour(self, origin, row_offset: int, col_offset: int):
+        if self.chunk_of is not None:
+            return _chunk_neighbour(self.chunk_of, origin, row_offset, col_offset)
+        row, col = origin[0] + row_offset, origin[1] + col_offset
+        if 0 <= row < self._nrows and 0 <= col < self.ncols:
+            return self.get_cell(row, col)
+        return None
+
+    def _cell_state(self, row: int, col: int) -> Dict[str, Any]:
+        if not 0 <= row < self._nrows or not 0 <= col < self.ncols:
+            raise CellNotFound(f"Did not found a cell on {row=}, {col=}")
+        return self._state.setdefault((row, col), {})
+
+    def cell_changed(self, row: int, col: int):
+        if self.on_change is not None:
+            self.on_change(row, col)
+
+    def set_blank(self, row: int, col: int, is_blank: bool = True):
+        self._cell_state(row, col)["is_blank"] = is_blank
+        self.cell_changed(row, col)
+
+    def update_size(self, row: int, col: int, nrows=None, ncols=None):
+        state = self._cell_state(row, col)
+        dimension = list(state.get("dimension", (1, 1)))
+        if nrows is not None:
+            dimension[0] = nrows
+        if ncols is not None:
+            dimension[1] = ncols
+        state["dimension"] = tuple(dimension)
+        self.cell_changed(row, col)
+
+    def set_cell_decimal_places(self, row: int, col: int, value: int):
+        # The cell notifies the change
+        self._cell_state(row, col)["decimal_places"] = value
+
+    def set_property(self, row: int, col: int, param, new_value):
+        state = self._cell_state(row, col)
+        design = state.setdefault("design", dict(_DEFAULT_DESIGN_PROPERTIES))
+        design[param] = new_value
+        self.cell_changed(row, col)
+
+    def set_decimal_places(self, value: int, columns: Iterable[int]):
+        """Set the decimal places of the columns, also for the rows added later;
+        does not call on_change"""
+        columns = set(columns)
+        for col in columns:
+            self.decimal_places[col] = value
+        for (_, col), state in self._state.items():
+            if col in columns:
+                state.pop("decimal_places", None)
+
+    def column_width(self, col: int, header: bool = True) -> int:
+        """Length of the longest text representation in one column
+
+        The data of the column is formatted in a single batch (with numpy, if it is
+        available); only the cells with some state of their own are formatted one
+        at a time.
+        """
+        width = len(self.get_cell(0, col).generate_text()) if header else 0
+        column = self._columns[col]
+        if column is None or len(column) == 0:
+            return width
+
+        lengths = [len(text) for text in self._column_texts(col)]
+        for row, state_col in self._state:
+            if state_col == col and row > 0:
+                lengths[row - 1] = len(self.get_cell(row, col).generate_text())
+        return max(width, max(lengths))
+
+    def cell_states(self) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """(row, col, state) of the cells that differ from the defaults"""
+        for (row, col), state in self._state.items():
+            if state:
+                yield row, col, dict(state)
+
+    def set_cell_state(self, row: int, col: int, state: Dict[str, Any]):
+        """Restore the state of a cell, as given by cell_states; does not call
+        on_change"""
+        state = dict(state)
+        if "dimension" in state:
+            state["dimension"] = tuple(state["dimension"])
+        if "design" in state:
+            state["design"] = dict(state["design"])
+        self._cell_state(row, col).update(state)
+
+    @classmethod
+    def join(cls, stores: List["ColumnStore"], axis: int) -> "ColumnStore":
+        """Storage with the contents of the stores; see ChunkedStore.consolidate"""
+        if axis == 0:
+            joined = cls(stores[0].ncols)
+            joined._header = list(stores[0]._header)
+            joined._nrows = 1
+            for index, store in enumerate(stores):
+                for col, column in enumerate(store._columns):
+                    if column is not None and len(column):
+                        joined._extend_column(col, column)
+                # Without the headers of the stores after the first one
+                shift = 0 if index == 0 else joined._nrows - 1
+                for (row, col), state in store._state.items():
+                    if index == 0 or row > 0:
+                        joined._state[(row + shift, col)] = state
+                joined._nrows += store._nrows - 1
+            return joined
+
+        joined = cls(sum(store.ncols for store in stores))
+        joined._nrows = stores[0]._nrows
+        shift = 0
+        for store in stores:
+            joined._header.extend(store._header)
+            joined._columns[shift : shift + store.ncols] = store._columns
+            for (row, col), state in store._state.items():
+                joined._state[(row, col + shift)] = state
+            shift += store.ncols
+        return joined
+
+
+class RingStore:
+    """Grid of Cell objects that keeps the header and at most capacity rows: once
+    it is full, each new row replaces the oldest one
+
+    The rows are kept in a ring buffer. The origin of a cell holds the sequence
+    number of its row (0 for the header, n for the n-th row that was added), so
+    nothing has to move when the oldest row is dropped. The text length of every
+    cell is counted per column, so that the width of a column follows the rows
+    that come and go without measuring all of them again.
+    """
+
+    def __init__(self, ncols: int, capacity: int):
+        if capacity < 1:
+            raise ValueError(f"The capacity must be at least one row. Got {capacity}")
+        self.ncols = ncols
+        self.capacity = capacity
+        self._header: List[Cell] = None
+        self._slots: List[List[Cell]] = [None] * capacity
+        # Text length of each cell in the slots
+        self._lengths: List[List[int]] = [None] * capacity
+        # Number of rows added after the header, including the dropped ones
+        self.appended = 0
+
+        self.decimal_places: List[int] = [2] * ncols
+        self.column_formats: List[ColumnFormat] = [None] * ncols
+        self.spans = SpanIndex()
+        # Cells with decimal places of their own
+        self._decimal_overrides = set()
+
+        # Number of cells (without the header) with each text length, per column,
+        # and the (decimal places, format) of the column when they were counted
+        self._length_counts = [Counter() for _ in range(ncols)]
+        self._counted_with = [(2, None)] * ncols
+
+        # Called with (row, col) whenever the representation of a cell changes
+        self.on_change = None
+        self.chunk_of = None
+
+    @property
+    def nrows(self) -> int:
+        if self._header is None:
+            return 0
+        return 1 + min(self.appended, self.capacity)
+
+    @property
+    def dropped(self) -> int:
+        """Number of rows that were replaced by newer ones"""
+        return max(self.appended - self.capacity, 0)
+
+    def _slot(self, sequence: int) -> int:
+        return (sequence - 1) % self.capacity
+
+    def _row(self, sequence: int) -> int:
+        """Current row of the row with a sequence number"""
+        return 0 if sequence == 0 else sequence - self.dropped
+
+    def _sequence(self, row: int) -> int:
+        return 0 if row == 0 else row + self.dropped
+
+    def _count(self, col: int, length: int, n: int):
+        counts = self._length_counts[col]
+        counts[length] += n
+        if not counts[length]:
+            del counts[length]
+
+    def append_row(self, values: Iterable[Any]):
+        values = list(values)
+        if len(values) != self.ncols:
+            raise ValueError(
+                f"Expected a row with {self.ncols} entries, got {len(values)}"
+            )
+        if self._header is None:
+            self._header = [
+                Cell(content=val, origin=[0, col], store=self)
+                for col, val in enumerate(values)
+            ]
+            return
+
+        self.appended += 1
+        sequence = self.appended
+        slot = self._slot(sequence)
+        dropped = self._slots[slot]
+        if dropped is not None:
+            self._decimal_overrides.difference_update(dropped)
+            for col, length in enumerate(self._lengths[slot]):
+                self._count(col, length, -1)
+            # The dropped cells must not change the row that takes their place
+            for cell in dropped:
+                cell._store = None
+
+        cells = [
+            Cell(content=val, origin=[sequence, col], store=self)
+            for col, val in enumerate(values)
+        ]
+        lengths = [len(cell.generate_text()) for cell in cells]
+        self._slots[slot] = cells
+        self._lengths[slot] = lengths
+        for col, length in enumerate(lengths):
+            self._count(col, length, 1)
+
+    def extend_rows(self, rows: Iterable[Iterable[Any]]):
+        for values in rows:
+            self.append_row(values)
+
+    def extend_columns(self, columns: List[List[Any]]):
+        if len({len(values) for values in columns}) > 1:
+            raise ValueError("All columns must have the same number of entries")
+        self.extend_rows(zip(*columns))
+
+    def _cells(self, sequence: int) -> List[Cell]:
+        if sequence == 0:
+            return self._header
+        return self._slots[self._slot(sequence)]
+
+    def get_row(self, row: int) -> List[Cell]:
+        """Return the cells of one row. The returned list must not be changed"""
+        if not isinstance(row, int) or not 0 <= row < self.nrows:
+            raise RowDoesNotExist(f"Row {row} does not exist")
+        return self._cells(self._sequence(row))
+
+    def row_texts(self, row: int, fmt: str) -> List[str]:
+        """Representation of the cells of a row"""
+        return cell_texts(self.get_row(row), fmt)
+
+    def get_column(self, col: int) -> List[Cell]:
+        if not isinstance(col, int) or not 0 <= col < self.ncols:
+            raise ColumnDoesNotExist(f"Column {col} does not exist")
+        return [self.get_row(row)[col] for row in range(self.nrows)]
+
+    def get_cell(self, row: int, col: int) -> Cell:
+        if (
+            not isinstance(row, int)
+            or not isinstance(col, int)
+            or not 0 <= row < self.nrows
+            or not 0 <= col < self.ncols
+        ):
+            raise CellNotFound(f"Did not found a cell on {row=}, {col=}")
+        return self.get_row(row)[col]
+
+    def neighbour(self, origin, row_offset: int, col_offset: int):
+        row, col = self._row(origin[0]) + row_offset, origin[1] + col_offset
+        if 0 <= row < self.nrows and 0 <= col < self.ncols:
+            return self.get_row(row)[col]
+        return None
+
+    def _measure(self, sequence: int, col: int):
+        """Count the text length of one cell again, after it changed"""
+        if sequence == 0:
+            return
+        slot = self._slot(sequence)
+        length = len(self._slots[slot][col].generate_text())
+        self._count(col, self._lengths[slot][col], -1)
+        self._count(col, length, 1)
+        self._lengths[slot][col] = length
+
+    def cell_changed(self, sequence: int, col: int):
+        self._measure(sequence, col)
+        if self.on_change is not None:
+            self.on_change(self._row(sequence), col)
+
+    def set_blank(self, row: int, col: int, is_blank: bool = True):
+        # The cell notifies the change
+        self.get_cell(row, col).is_blank = is_blank
+
+    def update_size(self, row: int, col: int, nrows=None, ncols=None):
+        self.get_cell(row, col).update_size(nrows=nrows, ncols=ncols)
+
+    def get_values(self, col: int) -> List[Any]:
+        """Contents of one column, without the header"""
+        return [self.get_row(row)[col].content for row in range(1, self.nrows)]
+
+    def set_cell_decimal_places(self, sequence: int, col: int, value: int):
+        # The cell already holds the value, only keep track of it
+        self._decimal_overrides.add(self._cells(sequence)[col])
+
+    def set_decimal_places(self, value: int, columns: Iterable[int]):
+        """Set the decimal places of the columns, also for the rows added later;
+        does not call on_change"""
+        columns = set(columns)
+        for col in columns:
+            self.decimal_places[col] = value
+        for cell in [c for c in self._decimal_overrides if c.origin[1] in columns]:
+            cell._decimal_places = None
+            self._decimal_overrides.discard(cell)
+
+    def column_width(self, col: int, header: bool = True) -> int:
+        """Length of the longest text representation in one column
+
+        Only counts the cells again if the decimal places or format of the column
+        changed since they were counted"""
+        counted_with = (self.decimal_places[col], self.column_formats[col])
+        if self._counted_with[col] != counted_with:
+            counts = self._length_counts[col]
+            counts.clear()
+            for row in range(1, self.nrows):
+                slot = self._slot(self._sequence(row))
+                length = len(self._slots[slot][col].generate_text())
+                self._lengths[slot][col] = length
+                counts[length] += 1
+            self._counted_with[col] = counted_with
+
+        width = max(self._length_counts[col], default=0)
+        if header and self._header is not None:
+            width = max(width, len(self._header[col].generate_text()))
+        return width
+
+    def cell_states(self) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """(row, col, state) of the cells that differ from the defaults"""
+        return iter_cell_states(self)
+
+    def set_cell_state(self, row: int, col: int, state: Dict[str, Any]):
+        """Restore the state of a cell, as given by cell_states; does not call
+        on_change"""
+        cell = self.get_cell(row, col)
+        if "dimension" in state:
+            cell.dimension = list(state["dimension"])
+        cell._is_blank = state.get("is_blank", False)
+        if "decimal_places" in state:
+            cell._decimal_places = state["decimal_places"]
+            self._decimal_overrides.add(cell)
+        if "design" in state:
+            cell._design_properties = dict(state["design"])
+        cell._clear_cache()
+        self._measure(self._sequence(row), col)
+
+
+class MovedStore:
+    """Storage left in a table whose cells were moved into another table (see
+    Table.concat): any use of it raises a TypeError, instead of silently changing
+    the cells that now belong to the other table"""
+
+    def __init__(self, message: str):
+        self.message = message
+
+    def __getattr__(self, name: str):
+        raise TypeError(self.message)
+
+
+def _chunk_neighbour(chunk_of, origin, row_offset: int, col_offset: int):
+    """Neighbour of a cell of a chunk, which may be in another chunk"""
+    store, row_shift, col_shift = chunk_of
+    origin = [origin[0] + row_shift, origin[1] + col_shift]
+    return store.neighbour(origin, row_offset, col_offset)
+
+
+class _Shifted:
+    """Entries of a list from a given offset, e.g. the decimal places of the columns
+    of a chunk, in the list of the ChunkedStore"""
+
+    def __init__(self, values: List[Any], offset: int, size: int):
+        self._values = values
+        self._offset = offset
+        self._size = size
+
+    def __getitem__(self, index: int):
+        return self._values[self._offset + index]
+
+    def __setitem__(self, index: int, value):
+        self._values[self._offset + index] = value
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        return iter(self._values[self._offset : self._offset + self._size])
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+
+class _ShiftedSpans:
+    """Spans of a ChunkedStore, seen from one of its chunks (in the coordinates of
+    the chunk); only owner is needed by the cells"""
+
+    def __init__(self, spans: SpanIndex, row_shift: int, col_shift: int):
+        self._spans = spans
+        self._row_shift = row_shift
+        self._col_shift = col_shift
+
+    def owner(self, row: int, col: int):
+        span = self._spans.owner(row + self._row_shift, col + self._col_shift)
+        if span is None:
+            return None
+        return Span(
+            span.row - self._row_shift,
+            span.col - self._col_shift,
+            span.nrows,
+            span.ncols,
+        )
+
+
+class ChunkedStore:
+    """Storages (the chunks) joined along their rows (axis=0) or their columns
+    (axis=1), without copying their cells.
+
+    The chunks are all GridStores or all ColumnStores. When joined along the rows,
+    the first row of the chunks after the first one (their header) is left out, and
+    new rows are added to the last chunk. The cells keep their origin in their
+    chunk, while the chunk translates everything that goes through the storage
+    (changes, neighbours, spans, decimal places and formats of the columns) into the
+    coordinates of the ChunkedStore. Only the spans and the decimal places and
+    formats of the columns of the ChunkedStore are used: those of the chunks are
+    replaced.
+
+    Reading is O(log(number of chunks)) per cell on top of the chunk. Inserting or
+    taking rows first joins the chunks into a single storage (see consolidate),
+    which is linear in the number of cells, as those operations already are.
+
+    Args:
+        chunks (List[Tuple[Any, List[Span]]]): The storages, each with its spans (in
+            the coordinates of that storage)
+        axis (int): 0 to join the rows of the chunks, 1 to join their columns
+    """
+
+    def __init__(self, chunks: List[Tuple[Any, List[Span]]], axis: int):
+        stores = [store for store, _ in chunks]
+        self.axis = axis
+        if axis == 0:
+            self.ncols = stores[0].ncols
+            self.decimal_places = list(stores[0].decimal_places)
+            self.column_formats = list(stores[0].column_formats)
+        else:
+            self.ncols = sum(store.ncols for store in stores)
+            self.decimal_places = [v for s in stores for v in s.decimal_places]
+            self.column_formats = [v for s in stores for v in s.column_formats]
+        self.spans = SpanIndex()
+        self.on_change = None
+
+        for index, (_, spans) in enumerate(chunks):
+            if axis == 0 and index > 0 and any(span.row == 0 for span in spans):
+                raise ValueError("Can't join a storage with a span over its header")
+        self._adopt(stores)
+        for index, (_, spans) in enumerate(chunks):
+            row, col = self._shifts(index, self._starts[index])
+            for span in spans:
+                self.spans.add(span.row + row, span.col + col, span.nrows, span.ncols)
+
+    def _shifts(self, index: int, start: int) -> Tuple[int, int]:
+        """Shift of the rows and columns of a chunk, into the coordinates of this
+        storage"""
+        if self.axis == 1:
+            return 0, start
+        return start - (0 if index == 0 else 1), 0
+
+    def _adopt(self, stores: List[Any]):
+        """Take the stores as the chunks, starting from the first row/column"""
+        self._chunks = stores
+        self._starts = []
+        start = 0
+        for index, store in enumerate(stores):
+            self._starts.append(start)
+            if self.axis == 0:
+                start += store.nrows - (0 if index == 0 else 1)
+            else:
+                start += store.ncols
+
+            row_shift, col_shift = self._shifts(index, self._starts[-1])
+            store.chunk_of = (self, row_shift, col_shift)
+            store.on_change = partial(self._chunk_changed, row_shift, col_shift)
+            store.spans = _ShiftedSpans(self.spans, row_shift, col_shift)
+            if self.axis == 0:
+                store.decimal_places = self.decimal_places
+                store.column_formats = self.column_formats
+            else:
+                store.decimal_places = _Shifted(
+                    self.decimal_places, col_shift, store.ncols
+                )
+                store.column_formats = _Shifted(
+                    self.column_formats, col_shift, store.ncols
+                )
+
+    @property
+    def chunks(self) -> List[Any]:
+        return list(self._chunks)
+
+    @property
+    def nrows(self) -> int:
+        if self.axis == 1:
+            return self._chunks[0].nrows
+        last = self._chunks[-1]
+        return self._starts[-1] + last.nrows - (0 if len(self._chunks) == 1 else 1)
+
+    def _chunk_changed(self, row_shift: int, col_shift: int, row: int, col: int):
+        self.cell_changed(row + row_shift, col + col_shift)
+
+    def _locate(self, row: int, col: int) -> Tuple[Any, int, int]:
+        """Chunk that holds a cell, and the position of the cell in it"""
+        if self.axis == 0:
+            index = bisect_right(self._starts, row) - 1 if row > 0 else 0
+        else:
+            index = bisect_right(self._starts, col) - 1
+        row_shift, col_shift = self._shifts(index, self._starts[index])
+        return self._chunks[index], row - row_shift, col - col_shift
+
+    def _split(self, values: Sequence[Any]) -> List[Sequence[Any]]:
+        """Split the entries of a row (or the columns) among the chunks, for axis=1"""
+        bounds = self._starts + [self.ncols]
+        return [values[start:stop] for start, stop in zip(bounds, bounds[1:])]
+
+    def append_row(self, values: Iterable[Any]):
+        if self.axis == 0:
+            self._chunks[-1].append_row(values)
+            return
+        values = list(values)
+        if len(values) != self.ncols:
+            raise ValueError(
+                f"Expected a row with {self.ncols} entries, got {len(values)}"
+            )
+        for store, part in zip(self._chunks, self._split(values)):
+            store.append_row(part)
+
+    def extend_rows(self, rows: Iterable[Iterable[Any]]):
+        if self.axis == 0:
+            self._chunks[-1].extend_rows(rows)
+            return
+        rows = [list(values) for values in rows]
+        for values in rows:
+            if len(values) != self.ncols:
+                raise ValueError(
+                    f"Expected a row with {self.ncols} entries, got {len(values)}"
+                )
+        parts = [self._split(values) for values in rows]
+        for index, store in enumerate(self._chunks):
+            store.extend_rows([values[index] for values in parts])
+
+    def extend_columns(self, columns: List[List[Any]]):
+        if self.axis == 0:
+            self._chunks[-1].extend_columns(columns)
+            return
+        if len(columns) != self.ncols:
+            raise ValueError(f"Expected {self.ncols} columns, got {len(columns)}")
+        if len({len(values) for values in columns}) > 1:
+            raise ValueError("All columns must have the same number of entries")
+        for store, part in zip(self._chunks, self._split(columns)):
+            store.extend_columns(list(part))
+
+    def get_row(self, row: int) -> List[Any]:
+        """Return the cells of one row. The returned list must not be changed"""
+        if not isinstance(row, int) or not 0 <= row < self.nrows:
+            raise RowDoesNotExist(f"Row {row} does not exist")
+        if self.axis == 0:
+            store, row, _ = self._locate(row, 0)
+            return store.get_row(row)
+        return [cell for store in self._chunks for cell in store.get_row(row)]
+
+    def row_texts(self, row: int, fmt: str) -> List[str]:
+        """Representation of the cells of a row, given by the chunks"""
+        if not isinstance(row, int) or not 0 <= row < self.nrows:
+            raise RowDoesNotExist(f"Row {row} does not exist")
+        if self.axis == 0:
+            store, row, _ = self._locate(row, 0)
+            return store.row_texts(row, fmt)
+        return [text for store in self._chunks for text in store.row_texts(row, fmt)]
+
+    def get_column(self, col: int) -> List[Any]:
+        if not isinstance(col, int) or not 0 <= col < self.ncols:
+            raise ColumnDoesNotExist(f"Column {col} does not exist")
+        if self.axis == 1:
+            store, _, col = self._locate(0, col)
+            return store.get_column(col)
+        cells = self._chunks[0].get_column(col)
+        for store in self._chunks[1:]:
+            cells.extend(store.get_column(col)[1:])
+        return cells
+
+    def get_cell(self, row: int, col: int):
+        if (
+            not isinstance(row, int)
+            or not isinstance(col, int)
+            or not 0 <= row < self.nrows
+            or not 0 <= col < self.ncols
+        ):
+            raise CellNotFound(f"Did not found a cell on {row=}, {col=}")
+        store, row, col = self._locate(row, col)
+        return store.get_cell(row, col)
+
+    def neighbour(self, origin, row_offset: int, col_offset: int):
+        row, col = origin[0] + row_offset, origin[1] + col_offset
+        if 0 <= row < self.nrows and 0 <= col < self.ncols:
+            return self.get_cell(row, col)
+        return None
+
+    def cell_changed(self, row: int, col: int):
+        if self.on_change is not None:
+            self.on_change(row, col)
+
+    def set_blank(self, row: int, col: int, is_blank: bool = True):
+        store, row, col = self._locate(row, col)
+        store.set_blank(row, col, is_blank=is_blank)
+
+    def update_size(self, row: int, col: int, nrows=None, ncols=None):
+        store, row, col = self._locate(row, col)
+        store.update_size(row, col, nrows=nrows, ncols=ncols)
+
+    def set_cell_decimal_places(self, row: int, col: int, value: int):
+        store, row, col = self._locate(row, col)
+        store.set_cell_decimal_places(row, col, value)
+
+    def set_decimal_places(self, value: int, columns: Iterable[int]):
+        """Set the decimal places of the columns, also for the rows added later;
+        does not call on_change"""
+        columns = set(columns)
+        for col in columns:
+            self.decimal_places[col] = value
+        for store, start in zip(self._chunks, self._starts):
+            if self.axis == 0:
+                store.set_decimal_places(value, columns)
+            else:
+                local = range(start, start + store.ncols)
+                store.set_decimal_places(
+                    value, [col - start for col in columns if col in local]
+                )
+
+    def column_width(self, col: int) -> int:
+        """Length of the longest text representation in one column"""
+        if self.axis == 1:
+            store, _, col = self._locate(0, col)
+            return store.column_width(col)
+        return max(
+            [self._chunks[0].column_width(col)]
+            + [store.column_width(col, header=False) for store in self._chunks[1:]]
+        )
+
+    def get_values(self, col: int) -> List[Any]:
+        """Contents of one column, without the header"""
+        if self.axis == 1:
+            store, _, col = self._locate(0, col)
+            return store.get_values(col)
+        return [value for store in self._chunks for value in store.get_values(col)]
+
+    def cell_states(self) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """(row, col, state) of the cells that differ from the defaults"""
+        return iter_cell_states(self)
+
+    def consolidate(self):
+        """Join the chunks into a single storage, of the same kind as the chunks.
+        Linear in the number of cells"""
+        if len(self._chunks) == 1:
+            return
+        joined = type(self._chunks[0]).join(self._chunks, self.axis)
+        self.axis = 0
+        self._adopt([joined])
+
+    def insert_rows(self, index: int, rows: List[List[Any]]):
+        """Insert the rows before the row with the given index"""
+        self.consolidate()
+        self._chunks[0].insert_rows(index, rows)
+
+    def take_rows(self, order: List[int]):
+        """Keep only the rows with the indexes in order, in that order"""
+        self.consolidate()
+        self._chunks[0].take_rows(order)
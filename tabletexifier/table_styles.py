@@ -1,8 +1,14 @@
+from collections import Counter
 from operator import add
-from typing import Tuple
+from typing import Callable, Dict, FrozenSet, Tuple
+
+from .spans import SpanIndex
 
 
 class Style:
+    # Written right after the start of the tabular environment
+    TeX_top_rule = ""
+
     def __init__(self, vline_locs=None, hline_locs=None, header=None):
         self.vline_locs = vline_locs if vline_locs is not None else []
         self.hline_locs = hline_locs if hline_locs is not None else []
@@ -15,11 +21,64 @@ class Style:
         self.extra_vline = []
         self.extra_hline = []
 
+        # Cells that span multiple rows/columns; shared with the storage of the Table
+        self.spans = SpanIndex()
+
+        # Layout plan, compiled from the line positions on the first query after
+        # they change, so that each per-cell query is a constant time lookup
+        self._hline_counts: Dict[int, int] = None
+        self._vline_set: FrozenSet[int] = None
+        self._LaTeX_row_ends: Dict[int, str] = {}
+
     def add_vline(self, loc):
         self.extra_vline.append(loc)
+        self._reset_layout()
 
     def add_hline(self, loc):
         self.extra_hline.append(loc)
+        self._reset_layout()
+
+    def move_hlines(self, new_position: Callable[[int], int]):
+        """Move the horizontal lines added with add_hline, e.g. once rows are
+        inserted or removed from the table
+
+        Args:
+            new_position (Callable[[int], int]): New location of a line, given its
+                current location
+        """
+        self.extra_hline = [new_position(loc) for loc in self.extra_hline]
+        self._reset_layout()
+
+    def _reset_layout(self):
+        self._hline_counts = None
+        self._vline_set = None
+
+    def compile_layout(self):
+        """Compile the position of the lines into the layout plan used to render the
+        table: number of horizontal lines above each row and set of columns with a
+        vertical line on their left"""
+        self._hline_counts = dict(Counter(self.get_hline_positions()))
+        self._vline_set = frozenset(self.get_vline_positions())
+
+    @property
+    def hline_counts(self) -> Dict[int, int]:
+        if self._hline_counts is None:
+            self.compile_layout()
+        return self._hline_counts
+
+    @property
+    def vline_set(self) -> FrozenSet[int]:
+        if self._vline_set is None:
+            self.compile_layout()
+        return self._vline_set
+
+    def _get_LaTeX_row_end(self, n_hlines: int) -> str:
+        try:
+            return self._LaTeX_row_ends[n_hlines]
+        except KeyError:
+            out = r"\\" + r" \hline" * n_hlines
+            self._LaTeX_row_ends[n_hlines] = out
+            return out
 
     def set_LaTeX_property(self, prop, value):
         self.table_properties[prop] = value
@@ -27,6 +86,7 @@ class Style:
     def set_size(self, rows, cols):
         self.ncols = cols
         self.nrows = rows
+        self._reset_layout()
 
     def get_hline_positions(self):
         return (*self.hline_locs, *self.extra_hline)
@@ -37,26 +97,20 @@ class Style:
     def get_col_separation(self, row_number, col_number, cell, fmt):
         if fmt == "text":
             out = " "
-            if col_number in self.get_vline_positions():
-                if (
-                    cell.is_blank
-                    and cell.previous_col is not None
-                    and cell.previous_col.is_multicol
-                ):
+            if col_number in self.vline_set:
+                # No line inside a cell that spans multiple columns
+                if self.spans.continues_left(row_number, col_number):
                     out = " "
                 else:
                     out = "|"
 
         elif fmt == "LaTeX":
             if col_number == self.ncols:
-                out = r"\\"
-                if row_number + 1 in self.get_hline_positions():
-                    counts = self.get_hline_positions().count(row_number + 1)
-                    for _ in range(counts):
-                        out += r" \hline"
-
-            elif col_number != 0 and not (
-                cell.is_blank and cell.previous_col.is_multicol
+                n_hlines = self.hline_counts.get(row_number + 1, 0)
+                out = self._get_LaTeX_row_end(n_hlines)
+
+            elif col_number != 0 and not self.spans.continues_left(
+                row_number, col_number
             ):
                 out = "&"
             else:
@@ -64,24 +118,18 @@ class Style:
         return out
 
     def check_if_duplicate_row(self, row_number) -> Tuple[bool, int]:
-        res = row_number in self.get_hline_positions()
-        n = self.get_hline_positions().count(row_number)
-        return res, n
+        n = self.hline_counts.get(row_number, 0)
+        return n > 0, n
 
     def get_row_separation(self, row_number, col_number, col_size, cell, fmt):
         out = ""
         if fmt == "text":
-            if row_number in self.get_hline_positions():
+            if row_number in self.hline_counts:
                 new_row = ""
-                if col_number in self.get_vline_positions():
+                if col_number in self.vline_set:
                     new_row += "+"
-                    if (
-                        cell.is_blank
-                        and cell.previous_row is not None
-                        and cell.previous_row.is_multirow
-                        and row_number
-                        != self.nrows  # Ensures that things don't break on the last row
-                    ):
+                    # No line inside a cell that spans multiple rows
+                    if self.spans.continues_above(row_number, col_number):
                         new_row += " " * col_size
                     else:
                         new_row += "-" * (col_size)
@@ -101,26 +149,77 @@ class Style:
     def _build_header_vlines(self, v_fmt, alignment):
         return list(map(add, v_fmt, alignment)) + [v_fmt[-1]]
 
-    def get_TeX_header(self) -> str:
+    def _get_TeX_column_spec(self) -> str:
         cols = ""
-
         for index in range(self.ncols):
-            if index in self.get_vline_positions():
+            if index in self.vline_set:
                 cols += "|"
             cols += self.table_properties["column_alignement"]
-
-        base_header = [
-            r"\begin{table}[H]",
-            r"\caption{" + self.table_properties["caption"] + "}",
-            r"\label{" + self.table_properties["label"] + "}",
+        return cols
+
+    def _get_continued_caption(self) -> str:
+        caption = self.table_properties["caption"]
+        return f"{caption} (continued)" if caption else ""
+
+    def get_TeX_header(self, continued: bool = False) -> str:
+        """Start of the table and tabular environments
+
+        Args:
+            continued (bool, optional): Header of the continuation of a split table,
+                with a "continued" caption and no label. Defaults to False.
+        """
+        base_header = [r"\begin{table}[H]"]
+        if continued:
+            base_header.append(r"\caption{" + self._get_continued_caption() + "}")
+        else:
+            base_header.append(r"\caption{" + self.table_properties["caption"] + "}")
+            base_header.append(r"\label{" + self.table_properties["label"] + "}")
+        base_header += [
             r"\centering",
-            r"\begin{tabular}{" + cols + "}",
+            r"\begin{tabular}{" + self._get_TeX_column_spec() + "}",
         ]
-        return "\n".join(base_header)
+        return "\n".join(base_header) + self.TeX_top_rule
 
     def get_TeX_footer(self) -> str:
         return r"\end{tabular}" + "\n" + r"\end{table}"
 
+    def get_TeX_page_rules(self) -> str:
+        """Horizontal lines that close each part of a table split across pages (or
+        tables): the lines at the bottom of the table that are not already drawn
+        after every row"""
+        counts = self.hline_counts
+        bottom = counts.get(self.nrows, 0)
+        interior = min((counts.get(row, 0) for row in range(2, self.nrows)), default=0)
+        return " ".join([r"\hline"] * max(bottom - interior, 0))
+
+    def get_longtable_header(self, header_row: str) -> str:
+        """Start of a longtable environment, with the header row repeated on the
+        top of every page
+
+        Args:
+            header_row (str): LaTeX line of the header of the table
+        """
+        top_rule = [self.TeX_top_rule] if self.TeX_top_rule else []
+        lines = [
+            r"\begin{longtable}{" + self._get_TeX_column_spec() + "}",
+            r"\caption{" + self.table_properties["caption"] + "}",
+            r"\label{" + self.table_properties["label"] + r"}\\",
+            *top_rule,
+            header_row,
+            r"\endfirsthead",
+        ]
+        if self.table_properties["caption"]:
+            lines.append(r"\caption[]{" + self._get_continued_caption() + r"}\\")
+        lines += [*top_rule, header_row, r"\endhead"]
+
+        page_rules = self.get_TeX_page_rules()
+        if page_rules:
+            lines += [page_rules, r"\endfoot", r"\endlastfoot"]
+        return "\n".join(lines)
+
+    def get_longtable_footer(self) -> str:
+        return r"\end{longtable}"
+
 
 class Tlines(Style):
     def __init__(self):
@@ -135,15 +234,12 @@ class Alines(Style):
 
 
 class AA(Style):
+    TeX_top_rule = r"\hline \hline"
+
     def set_size(self, rows, cols):
         super().set_size(rows, cols)
         self.hline_locs = (0, 0, 1, rows)
 
-    def get_TeX_header(self) -> str:
-        head = super().get_TeX_header()
-        head += "\hline \hline"
-        return head
-
 
 class MNRAS(Style):
     def __init__(self):
@@ -0,0 +1,358 @@
+"""Views of a subset of the rows and columns of a Table, sharing its storage"""
+
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from .Cell import Cell
+from .Table import Table
+from .exceptions import CellNotFound, ColumnDoesNotExist, RowDoesNotExist
+from .snapshot import restore, snapshot
+from .storage import cell_texts, iter_cell_states
+
+
+class StoreView:
+    """Storage interface over some rows and columns of another storage
+
+    Nothing is copied: each query is mapped onto the parent storage, and the cells
+    that are returned are the cells of the parent.
+
+    Args:
+        store: The parent storage
+        rows (Sequence[int], optional): Rows of the parent (without the header, which
+            is always the first row of the view). Defaults to None, for all rows.
+        cols (Sequence[int], optional): Columns of the parent. Defaults to None, for
+            all columns.
+    """
+
+    def __init__(self, store, rows: Sequence[int] = None, cols: Sequence[int] = None):
+        self._store = store
+        self._rows = rows
+        self._cols = cols
+        self.spans = SpanView(self)
+
+    @property
+    def nrows(self) -> int:
+        if self._rows is None:
+            return self._store.nrows
+        return 1 + len(self._rows)
+
+    @property
+    def ncols(self) -> int:
+        if self._cols is None:
+            return self._store.ncols
+        return len(self._cols)
+
+    def parent_row(self, row: int) -> int:
+        if self._rows is None or row == 0:
+            return row
+        return self._rows[row - 1]
+
+    def parent_col(self, col: int) -> int:
+        if self._cols is None:
+            return col
+        return self._cols[col]
+
+    def _select(self, values: List[Any]) -> List[Any]:
+        if self._cols is None:
+            return values
+        return [values[col] for col in self._cols]
+
+    @property
+    def decimal_places(self) -> List[int]:
+        return self._select(self._store.decimal_places)
+
+    @property
+    def column_formats(self) -> List[Any]:
+        return self._select(self._store.column_formats)
+
+    def get_cell(self, row: int, col: int) -> Cell:
+        if (
+            not isinstance(row, int)
+            or not isinstance(col, int)
+            or not 0 <= row < self.nrows
+            or not 0 <= col < self.ncols
+        ):
+            raise CellNotFound(f"Did not found a cell on {row=}, {col=}")
+        return self._store.get_cell(self.parent_row(row), self.parent_col(col))
+
+    def get_row(self, row: int) -> List[Cell]:
+        if not isinstance(row, int) or not 0 <= row < self.nrows:
+            raise RowDoesNotExist(f"Row {row} does not exist")
+        if self._cols is None:
+            return self._store.get_row(self.parent_row(row))
+        # Only the cells of the view are requested from the (compact) storage
+        row = self.parent_row(row)
+        return [self._store.get_cell(row, col) for col in self._cols]
+
+    def row_texts(self, row: int, fmt: str) -> List[str]:
+        """Representation of the cells of a row. Without a selection of rows, the
+        parent can format the rows from its (cached) columns; otherwise only the
+        cells of the view are formatted"""
+        if self._rows is not None:
+            return cell_texts(self.get_row(row), fmt)
+        if not isinstance(row, int) or not 0 <= row < self.nrows:
+            raise RowDoesNotExist(f"Row {row} does not exist")
+        return self._select(self._store.row_texts(row, fmt))
+
+    def get_column(self, col: int) -> List[Cell]:
+        if not isinstance(col, int) or not 0 <= col < self.ncols:
+            raise ColumnDoesNotExist(f"Column {col} does not exist")
+        return [self.get_cell(row, col) for row in range(self.nrows)]
+
+    def get_values(self, col: int) -> List[Any]:
+        values = self._store.get_values(self.parent_col(col))
+        if self._rows is None:
+            return values
+        return [values[row - 1] for row in self._rows]
+
+    def cell_states(self) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """(row, col, state) of the cells that differ from the defaults"""
+        return iter_cell_states(self)
+
+    def column_width(self, col: int) -> int:
+        if self._rows is None:
+            return self._store.column_width(self.parent_col(col))
+        return max(
+            len(self.get_cell(row, col).generate_text()) for row in range(self.nrows)
+        )
+
+
+class SpanView:
+    """Span queries of a StoreView, in the coordinates of the view
+
+    The spans are those of the parent storage; TableView checks that each span is
+    either entirely in the view, with its rows and columns still next to each
+    other, or not in it at all.
+    """
+
+    def __init__(self, store: StoreView):
+        self._view = store
+
+    def owner(self, row: int, col: int):
+        view = self._view
+        if not 0 <= row < view.nrows or not 0 <= col < view.ncols:
+            return None
+        return view._store.spans.owner(view.parent_row(row), view.parent_col(col))
+
+    def is_covered(self, row: int, col: int) -> bool:
+        return self.continues_left(row, col) or self.continues_above(row, col)
+
+    def continues_left(self, row: int, col: int) -> bool:
+        span = self.owner(row, col)
+        return col > 0 and span is not None and span == self.owner(row, col - 1)
+
+    def continues_above(self, row: int, col: int) -> bool:
+        span = self.owner(row, col)
+        return row > 0 and span is not None and span == self.owner(row - 1, col)
+
+    def __iter__(self):
+        return iter(self._view._store.spans)
+
+    def __len__(self) -> int:
+        return len(self._view._store.spans)
+
+
+def _move_lines(
+    locations: List[int], mapping: Sequence[int], header: bool = False
+) -> List[int]:
+    """Positions of lines in a view with increasing rows (or columns) of the parent:
+    the number of rows of the view above each line, counting the header (always the
+    first row of the view) if header is True. Lines are dropped if the view changes
+    the order of the rows. Takes O(log n) per line when the mapping is a range"""
+    if not locations or not _increasing(mapping):
+        return []
+    if not header:
+        return [bisect_left(mapping, loc) for loc in locations]
+    return [0 if loc <= 0 else 1 + bisect_left(mapping, loc) for loc in locations]
+
+
+def _increasing(values: Sequence[int]) -> bool:
+    if isinstance(values, range):
+        return values.step > 0 or len(values) < 2
+    return all(a < b for a, b in zip(values, values[1:]))
+
+
+class TableView(Table):
+    """Read-only view of some rows and columns of a Table, see Table.view
+
+    The view shares the storage of its parent, so creating it does not copy any
+    cell, and it renders through the same text and LaTeX paths. Changes to the
+    parent show up in the view on the next render. The view has a style of its
+    own (copied from the parent when it is created), so the lines, caption and
+    label can be changed without touching the parent.
+    """
+
+    def __init__(
+        self,
+        parent: Table,
+        rows=None,
+        cols: Iterable[int] = None,
+        table_style: str = None,
+    ):
+        if isinstance(parent, TableView):
+            # Views of views map directly onto the original table
+            rows, cols = parent._compose(rows, cols)
+            parent = parent._parent
+        self._parent = parent
+        self._parent_version = parent._version
+
+        rows = _resolve_rows(rows, parent.nrows)
+        if cols is not None:
+            cols = list(cols)
+            for col in cols:
+                if not isinstance(col, int) or not 0 <= col < parent.ncols:
+                    raise ColumnDoesNotExist(f"Column {col} does not exist")
+        self._init_state(
+            StoreView(parent._store, rows, cols),
+            table_style or parent._table_style_name,
+        )
+        self._check_spans()
+        self._copy_style(parent._table_style)
+
+    def _compose(self, rows, cols):
+        store = self._store
+        if rows is not None:
+            rows = [store.parent_row(row) for row in _resolve_rows(rows, self.nrows)]
+        elif store._rows is not None:
+            rows = list(store._rows)
+        if cols is not None:
+            cols = [store.parent_col(col) for col in cols]
+        else:
+            cols = store._cols
+        return rows, cols
+
+    def _check_spans(self):
+        """Each span of the parent must be entirely in the view, with its rows and
+        columns still next to each other, or not be in the view at all"""
+        store = self._store
+        spans = store._store.spans
+        if not len(spans):
+            return
+        rows = cols = None
+        if store._rows is not None:
+            data_rows = _indexer(store._rows, offset=1)
+
+            def rows(row: int) -> int:
+                return 0 if row == 0 else data_rows(row)
+
+        if store._cols is not None:
+            cols = _indexer(store._cols)
+
+        for span in spans:
+            row_positions = _positions(span.row, span.nrows, rows)
+            col_positions = _positions(span.col, span.ncols, cols)
+            if row_positions == [None] * span.nrows:
+                continue
+            if col_positions == [None] * span.ncols:
+                continue
+            if not _consecutive(row_positions) or not _consecutive(col_positions):
+                raise ValueError(
+                    f"The span on row={span.row}, col={span.col} is not entirely "
+                    "in the view"
+                )
+
+    def _copy_style(self, style):
+        new = self._table_style
+        new.table_properties = dict(style.table_properties)
+        store = self._store
+        rows = store._rows
+        cols = store._cols
+        new.extra_hline = (
+            list(style.extra_hline)
+            if rows is None
+            else _move_lines(style.extra_hline, rows, header=True)
+        )
+        new.extra_vline = (
+            list(style.extra_vline)
+            if cols is None
+            else _move_lines(style.extra_vline, cols)
+        )
+
+    def _sync(self):
+        """Drop the cached outputs if the parent changed since the last render"""
+        if self._parent._version != self._parent_version:
+            self._parent_version = self._parent._version
+            self._stale_widths.update(range(self.ncols))
+            self._invalidate_render_cache()
+
+    @property
+    def parent(self) -> Table:
+        return self._parent
+
+    def get_pretty_print(self, ignore_rows, fmt="text", workers: int = None) -> str:
+        self._sync()
+        return super().get_pretty_print(ignore_rows, fmt=fmt, workers=workers)
+
+    def iter_lines(self, *args, **kwargs):
+        self._sync()
+        return super().iter_lines(*args, **kwargs)
+
+    def get_column_widths(self) -> List[int]:
+        self._sync()
+        return super().get_column_widths()
+
+    def __reduce__(self):
+        # A pickled view becomes a Table with a copy of its rows and columns
+        self._sync()
+        return restore, (snapshot(self), Table)
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "Views can't change the contents of their table; change the parent instead"
+        )
+
+    add_row = _read_only
+    insert_rows = _read_only
+    delete_rows = _read_only
+    filter = _read_only
+    sort_by = _read_only
+    set_cell_as_multi_row = _read_only
+    set_cell_as_multi_col = _read_only
+    set_decimal_places = _read_only
+    set_column_format = _read_only
+    _extend_rows = _read_only
+    _extend_columns = _read_only
+
+
+def _indexer(values: Sequence[int], offset: int = 0) -> Callable[[int], int]:
+    """Function that gives the position of a value in the sequence (plus the
+    offset), or None if it is not in it; constant time, without a dict, for a
+    range"""
+    if isinstance(values, range):
+
+        def index(value: int) -> int:
+            return values.index(value) + offset if value in values else None
+
+        return index
+    return {value: index for index, value in enumerate(values, start=offset)}.get
+
+
+def _positions(start: int, size: int, index: Callable[[int], int]) -> List[int]:
+    if index is None:
+        return list(range(start, start + size))
+    return [index(value) for value in range(start, start + size)]
+
+
+def _consecutive(positions: List[int]) -> bool:
+    if None in positions:
+        return False
+    return positions == list(range(positions[0], positions[0] + len(positions)))
+
+
+def _resolve_rows(rows, nrows: int):
+    """Rows of the parent (without the header) selected by a slice or an iterable"""
+    if rows is None:
+        return None
+    if isinstance(rows, slice):
+        rows = range(*rows.indices(nrows))
+        # The header is always the first row of the view
+        if rows and rows[0] == 0:
+            rows = rows[1:]
+        elif rows and rows[-1] == 0:
+            rows = rows[:-1]
+        return rows
+    rows = [row for row in rows if row != 0]
+    for row in rows:
+        if not isinstance(row, int) or not 0 < row < nrows:
+            raise RowDoesNotExist(f"Row {row} does not exist")
+    return rows
@@ -0,0 +1,70 @@
+"""Writers that keep a text file in sync with a growing Table"""
+
+from typing import List
+
+
+class TableWriter:
+    """Append-only writer for the text representation of a Table
+
+    Each flush only writes the rows that were added since the previous one. The
+    column widths can't change once the first rows are written: they are either
+    given when the writer is created, or frozen on the first flush. Entries that
+    are larger than their column shift the remainder of their line.
+    """
+
+    def __init__(self, table, path, mode: str = "w", widths: List[int] = None):
+        self._table = table
+        self._file = open(path, mode=mode)
+        self._text_sizes = (
+            None if widths is None else table.compute_max_text_size_of_cols(widths)
+        )
+        # Number of rows of the table that were already written
+        self.written_rows = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def flush(self) -> int:
+        """Write the rows added to the table since the last flush
+
+        Raises:
+            ValueError: If the writer is already closed
+
+        Returns:
+            int: Number of rows that were written
+        """
+        if self.closed:
+            raise ValueError("Can't flush a closed TableWriter")
+
+        table = self._table
+        if self._text_sizes is None:
+            self._text_sizes = table.compute_max_text_size_of_cols()
+
+        first_row = self.written_rows
+        table._table_style.set_size(rows=table.nrows, cols=table.ncols)
+        for row_index in range(first_row, table.nrows):
+            for line in table._render_row(row_index, self._text_sizes, "text"):
+                if line:
+                    self._file.write(f"{line}\n")
+        self.written_rows = table.nrows
+        self._file.flush()
+        return self.written_rows - first_row
+
+    def close(self):
+        """Write the pending rows and the end of the table, and close the file"""
+        if self.closed:
+            return
+        self.flush()
+        table = self._table
+        table._table_style.set_size(rows=table.nrows, cols=table.ncols)
+        line = table._render_closing_line(self._text_sizes, "text")
+        if line:
+            self._file.write(f"{line}\n")
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
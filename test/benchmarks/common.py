@@ -0,0 +1,76 @@
+"""Shared helpers of the benchmark suite
+
+The benchmarks only run when TABLETEXIFIER_BENCHMARKS=1, and the size of the largest
+table is set by TABLETEXIFIER_BENCH_MAX_CELLS (10^4 cells by default).
+"""
+
+import math
+import os
+import time
+
+import pytest
+from tabletexifier import Table
+
+RUN_BENCHMARKS = os.environ.get("TABLETEXIFIER_BENCHMARKS", "0") == "1"
+MAX_CELLS = int(os.environ.get("TABLETEXIFIER_BENCH_MAX_CELLS", 10**4))
+# Largest scaling exponent that is accepted; 1 means linear in the number of cells
+MAX_EXPONENT = float(os.environ.get("TABLETEXIFIER_BENCH_MAX_EXPONENT", 1.3))
+
+N_COLS = 10
+STYLES = ["A&A", "A", "T", "MNRAS", "NoLines"]
+
+requires_benchmarks = pytest.mark.skipif(
+    not RUN_BENCHMARKS, reason="Set TABLETEXIFIER_BENCHMARKS=1 to run the benchmarks"
+)
+
+
+def cell_counts(min_cells=10, max_cells=MAX_CELLS):
+    """Table sizes (number of cells), in powers of ten"""
+    counts = []
+    n_cells = min_cells
+    while n_cells <= max_cells:
+        counts.append(n_cells)
+        n_cells *= 10
+    return counts
+
+
+def make_rows(n_cells):
+    """Rows of N_COLS entries, mixing text, integers and floats"""
+    n_rows = max(1, n_cells // N_COLS)
+    return [
+        [f"row{index}", index] + [index * 0.25 + col for col in range(N_COLS - 2)]
+        for index in range(n_rows)
+    ]
+
+
+def make_header():
+    return [f"col{col}" for col in range(N_COLS)]
+
+
+def build_table(n_cells, table_style="A&A", compact=False):
+    return Table.from_rows(
+        make_rows(n_cells),
+        header=make_header(),
+        table_style=table_style,
+        compact=compact,
+    )
+
+
+def best_time(func, repeats=3):
+    """Best wall time of a few calls of func"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def scaling_exponent(sizes, times):
+    """Slope of the least-squares fit of log(time) against log(size)"""
+    x = [math.log(size) for size in sizes]
+    y = [math.log(max(duration, 1e-9)) for duration in times]
+    x_mean, y_mean = sum(x) / len(x), sum(y) / len(y)
+    numerator = sum((a - x_mean) * (b - y_mean) for a, b in zip(x, y))
+    denominator = sum((a - x_mean) ** 2 for a in x)
+    return numerator / denominator
@@ -0,0 +1,108 @@
+"""pytest-benchmark timings of the construction, rendering and export of Tables
+
+Save a baseline with --benchmark-autosave and compare against it with
+--benchmark-compare --benchmark-compare-fail=mean:10%.
+"""
+
+import pytest
+from tabletexifier import RollingTable, Table
+
+from .common import (
+    STYLES,
+    build_table,
+    cell_counts,
+    make_header,
+    make_rows,
+    requires_benchmarks,
+)
+
+pytest.importorskip("pytest_benchmark")
+pytestmark = requires_benchmarks
+
+
+def _uncached(table):
+    """pedantic setup that drops the render cache before every round"""
+
+    def setup():
+        table._invalidate_render_cache()
+
+    return setup
+
+
+@pytest.mark.parametrize("n_cells", cell_counts())
+def test_add_row(benchmark, n_cells):
+    rows = make_rows(n_cells)
+    header = make_header()
+
+    def build():
+        table = Table(header)
+        for row in rows:
+            table.add_row(row)
+
+    benchmark.extra_info["cells"] = n_cells
+    benchmark(build)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("n_cells", cell_counts())
+def test_from_rows(benchmark, n_cells, compact):
+    rows = make_rows(n_cells)
+    header = make_header()
+
+    benchmark.extra_info["cells"] = n_cells
+    benchmark(Table.from_rows, rows, header=header, compact=compact)
+
+
+@pytest.mark.parametrize("table_style", STYLES)
+@pytest.mark.parametrize("n_cells", cell_counts())
+def test_str(benchmark, n_cells, table_style):
+    table = build_table(n_cells, table_style=table_style)
+
+    benchmark.extra_info["cells"] = n_cells
+    benchmark.pedantic(str, args=(table,), setup=_uncached(table), rounds=5)
+
+
+@pytest.mark.parametrize("table_style", STYLES)
+@pytest.mark.parametrize("n_cells", cell_counts())
+def test_build_latex(benchmark, n_cells, table_style):
+    table = build_table(n_cells, table_style=table_style)
+
+    benchmark.extra_info["cells"] = n_cells
+    benchmark.pedantic(table.build_latex, setup=_uncached(table), rounds=5)
+
+
+@pytest.mark.parametrize("n_cells", cell_counts())
+def test_write_to_file(benchmark, tmp_path, n_cells):
+    table = build_table(n_cells)
+    path = tmp_path / "table.txt"
+
+    benchmark.extra_info["cells"] = n_cells
+    benchmark(table.write_to_file, path, mode="w", write_LaTeX=True)
+
+
+@pytest.mark.parametrize("n_cells", cell_counts())
+def test_export(benchmark, tmp_path, n_cells):
+    table = build_table(n_cells)
+    targets = {
+        fmt: tmp_path / f"table.{fmt}"
+        for fmt in ("text", "LaTeX", "markdown", "html", "csv")
+    }
+
+    benchmark.extra_info["cells"] = n_cells
+    benchmark(table.export, targets)
+
+
+@pytest.mark.parametrize("n_cells", cell_counts())
+def test_rolling_str(benchmark, n_cells):
+    """Add a row and print the table, which only holds the last 50 rows"""
+    rows = make_rows(n_cells)
+    header = make_header()
+
+    def build():
+        table = RollingTable(header, capacity=50)
+        for row in rows:
+            table.add_row(row)
+            str(table)
+
+    benchmark.extra_info["cells"] = n_cells
+    benchmark(build)
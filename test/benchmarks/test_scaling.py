@@ -0,0 +1,94 @@
+"""Check that the cost of the main operations grows linearly with the table size
+
+Each operation is timed for tables from 10^3 cells up to TABLETEXIFIER_BENCH_MAX_CELLS
+and the test fails if the fitted scaling exponent is above MAX_EXPONENT.
+"""
+
+import pytest
+from tabletexifier import Table
+
+from .common import (
+    MAX_EXPONENT,
+    STYLES,
+    best_time,
+    build_table,
+    cell_counts,
+    make_header,
+    make_rows,
+    requires_benchmarks,
+    scaling_exponent,
+)
+
+pytestmark = requires_benchmarks
+
+# Small tables are dominated by constant overheads
+SIZES = cell_counts(min_cells=10**3)
+
+
+def _add_rows(n_cells):
+    rows = make_rows(n_cells)
+    header = make_header()
+
+    def build():
+        table = Table(header)
+        for row in rows:
+            table.add_row(row)
+
+    return build
+
+
+def _render(n_cells, table_style, method):
+    table = build_table(n_cells, table_style=table_style)
+
+    def render():
+        table._invalidate_render_cache()
+        method(table)
+
+    return render
+
+
+def _check_exponent(name, make_operation, record_property):
+    if len(SIZES) < 2:
+        pytest.skip("TABLETEXIFIER_BENCH_MAX_CELLS is too small to fit an exponent")
+    times = [best_time(make_operation(n_cells)) for n_cells in SIZES]
+    exponent = scaling_exponent(SIZES, times)
+
+    record_property(f"{name}_scaling_exponent", exponent)
+    assert exponent <= MAX_EXPONENT, (
+        f"{name} scales as n^{exponent:.2f} (times: {times})"
+    )
+
+
+def test_add_row_scaling(record_property):
+    _check_exponent("add_row", _add_rows, record_property)
+
+
+@pytest.mark.parametrize("table_style", STYLES)
+def test_str_scaling(record_property, table_style):
+    _check_exponent(
+        f"str[{table_style}]",
+        lambda n_cells: _render(n_cells, table_style, str),
+        record_property,
+    )
+
+
+@pytest.mark.parametrize("table_style", STYLES)
+def test_build_latex_scaling(record_property, table_style):
+    _check_exponent(
+        f"build_latex[{table_style}]",
+        lambda n_cells: _render(n_cells, table_style, Table.build_latex),
+        record_property,
+    )
+
+
+def test_write_to_file_scaling(record_property, tmp_path):
+    path = tmp_path / "table.txt"
+    _check_exponent(
+        "write_to_file",
+        lambda n_cells: _render(
+            n_cells,
+            "A&A",
+            lambda table: table.write_to_file(path, mode="w", write_LaTeX=True),
+        ),
+        record_property,
+    )
@@ -0,0 +1,86 @@
+import io
+
+import pytest
+from tabletexifier import Table
+from tabletexifier.backends import CSVBackend, LaTeXBackend, TextBackend, export
+
+
+def build_table(table_style="A"):
+    x = Table(["Name", "a|b", "c"], table_style=table_style)
+    for index in range(3):
+        x.add_row([f"<r{index}>", index, index * 1.5])
+    x.set_cell_as_multi_col(1, 1, 1)
+    x.set_cell_as_multi_row(2, 0, 1)
+    x.add_table_caption("Results & more")
+    return x
+
+
+def render(table, *backends):
+    outputs = [io.StringIO() for _ in backends]
+    export(table, zip(backends, outputs))
+    return [output.getvalue() for output in outputs]
+
+
+@pytest.mark.parametrize("table_style", ["A", "A&A", "MNRAS", "T", "NoLines"])
+@pytest.mark.parametrize("mode", ["table", "longtable", "split"])
+def test_text_and_latex_match_the_renderers(table_style, mode):
+    x = build_table(table_style)
+    for index in range(3, 8):
+        x.add_row([f"r{index}", index, 1.0])
+    text, skipped, latex = render(
+        x,
+        TextBackend(),
+        TextBackend(ignore_rows=1),
+        LaTeXBackend(mode=mode, chunk_rows=3),
+    )
+    assert text == str(x) + "\n"
+    assert skipped == "\n".join(x.iter_lines(ignore_rows=1)) + "\n"
+    assert latex == "\n".join(x.iter_latex(mode=mode, chunk_rows=3)) + "\n"
+
+
+def test_markdown_html_and_csv():
+    markdown, page, table, raw = render(
+        build_table(), "markdown", "html", "csv", CSVBackend(raw=True)
+    )
+    assert markdown.splitlines() == [
+        r"| Name | a\|b | c |",
+        "|:---:|:---:|:---:|",
+        "| <r0> | 0.00 |  |",
+        "| <r1> | 1.00 | 1.50 |",
+        "|  | 2.00 | 3.00 |",
+    ]
+    assert "<caption>Results &amp; more</caption>" in page
+    assert '<td colspan="2">0.00</td></tr>' in page
+    assert '<tr><td rowspan="2">&lt;r1&gt;</td><td>1.00</td>' in page
+    assert "<tr><td>2.00</td><td>3.00</td></tr>" in page
+    assert table.splitlines() == [
+        "Name,a|b,c",
+        "<r0>,0.00,",
+        "<r1>,1.00,1.50",
+        ",2.00,3.00",
+    ]
+    assert raw.splitlines()[1:] == ["<r0>,0,", "<r1>,1,1.5", ",2,3.0"]
+
+
+def test_table_export(tmp_path):
+    x = build_table()
+    x.export({"markdown": tmp_path / "x.md", "csv": tmp_path / "x.csv"})
+    assert (tmp_path / "x.md").read_text().startswith("| Name |")
+    assert (tmp_path / "x.csv").read_text().startswith("Name,")
+
+    with pytest.raises(ValueError):
+        x.export({"docx": tmp_path / "x.docx"})
+    assert not (tmp_path / "x.docx").exists()
+    with pytest.raises(ValueError):
+        LaTeXBackend(mode="book")
+
+
+@pytest.mark.parametrize("mode", ["w", "a"])
+def test_single_pass_write_to_file(tmp_path, mode):
+    x = build_table()
+    single, separate = tmp_path / "single.txt", tmp_path / "separate.txt"
+    x.write_to_file(single, mode=mode, write_LaTeX=True, latex_mode="longtable")
+    x.write_to_file(separate, mode=mode, write_LaTeX=False)
+    with open(separate, "a") as file:
+        file.write("\n" + "\n".join(x.iter_latex(mode="longtable")))
+    assert single.read_text() == separate.read_text()
@@ -0,0 +1,59 @@
+from array import array
+
+import pytest
+from tabletexifier.formatting import (
+    ColumnFormat,
+    format_column,
+    format_LaTeX_number,
+    format_text,
+)
+
+
+def test_batched_formatting_matches_single_values():
+    values = [1.0, -0.5, 1e10, float("nan"), 2.675]
+    expected = [format_text(value, 2) for value in values]
+
+    assert format_column(array("d", values), 2) == expected
+    assert format_column(array("q", [1, 20]), 1) == ["1.0", "20.0"]
+    assert format_column(["a", 1, None], 0) == ["a", "1", "None"]
+
+
+def test_repeated_values_share_strings():
+    assert format_text(3.14159, 2) is format_text(3.14159, 2)
+    assert format_text(1, 2) == format_text(1.0, 2) == "1.00"
+    assert format_text(-0.0, 1) == "-0.0"
+    assert format_text(0.0, 1) == "0.0"
+    assert format_text(float("nan"), 3) == "nan"
+    assert format_text(float("nan"), 3) is format_text(-float("nan"), 0)
+    assert format_LaTeX_number(float("nan"), 2) is format_text(float("nan"), 1)
+
+
+def test_column_format():
+    scientific = ColumnFormat(precision=2, notation="scientific")
+    assert scientific.text(12345.678, 5) == "1.23e+04"
+    assert scientific.LaTeX(12345.678, 5) == r"$1.23 \times 10^{4}$"
+    assert scientific.LaTeX("name", 5) == "name"
+    assert scientific.format_column(array("d", [12345.678, 1e-4]), 5) == [
+        "1.23e+04",
+        "1.00e-04",
+    ]
+
+    # Without a precision of its own, it follows the decimal places of the column
+    errors = ColumnFormat(uncertainty=True)
+    assert errors.text((1.2345, 0.0123), 2) == "1.23 ± 0.01"
+    assert errors.text((1.2345, 0.0123), 3) == "1.234 ± 0.012"
+    assert errors.LaTeX((1.2345, 0.0123), 2) == r"$1.23 \pm 0.01$"
+    assert errors.format_column([(1.0, 0.5), "x"], 1) == ["1.0 ± 0.5", "x"]
+
+    siunitx = ColumnFormat(
+        precision=1, notation="scientific", uncertainty=True, siunitx=True
+    )
+    assert siunitx.text((1234.0, 56.0), 0) == "(1.2 ± 0.1)e+03"
+    assert siunitx.LaTeX((1234.0, 56.0), 0) == r"\num{1.2 +- 0.1 e3}"
+    assert ColumnFormat(siunitx=True).LaTeX(3, 1) == r"\num{3.0}"
+
+    # Compiled once per number of decimal places
+    assert errors.compile(2) is errors.compile(2)
+
+    with pytest.raises(ValueError):
+        ColumnFormat(notation="engineering")
@@ -0,0 +1,80 @@
+import csv
+
+import pytest
+from tabletexifier import LazyTable, Table
+
+HEADER = ["Name", "b", "c"]
+ROWS = [[f"row{index}", index, index * 1.5] for index in range(50)]
+
+
+def expected(rows, widths=None):
+    x = Table.from_rows(rows, header=HEADER)
+    return "\n".join(x.iter_lines(widths=widths))
+
+
+@pytest.mark.parametrize(
+    "source, n_rows",
+    [
+        (ROWS, None),
+        (lambda index: ROWS[index], len(ROWS)),
+        (tuple(map(tuple, ROWS)), None),
+    ],
+)
+def test_windows(source, n_rows):
+    x = LazyTable(HEADER, source, n_rows=n_rows)
+    widths = [5, 5, 5]
+
+    assert x.n_rows == 50
+    assert x.widths == widths
+    assert x.head(3) == expected(ROWS[:3], widths)
+    assert x.tail(2) == expected(ROWS[-2:], widths)
+    assert x.page(10, 15) == expected(ROWS[10:15], widths)
+
+
+def test_latex_uses_the_widths():
+    x = LazyTable(HEADER, ROWS)
+    full = Table.from_rows(ROWS, header=HEADER)
+    assert x.head(len(ROWS), fmt="LaTeX") == full.build_latex()
+
+    # The window is aligned with the widths of the sample, as in the text output
+    window = Table.from_rows(ROWS[:2], header=HEADER)
+    assert x.head(2, fmt="LaTeX") == window.build_latex(widths=[5, 5, 5])
+    assert x.head(2, fmt="LaTeX") != window.build_latex()
+
+
+def test_one_shot_iterator_and_declared_widths():
+    x = LazyTable(HEADER, iter(ROWS), sample_rows=5)
+    assert x.widths == [4, 4, 4]
+    assert x.tail(3) == expected(ROWS[-3:], [5, 5, 5])
+
+    x = LazyTable(HEADER, iter(ROWS), widths=[10, 10, 10])
+    assert x.page(2, 4) == expected(ROWS[2:4], [10, 10, 10])
+
+
+def test_generator_source():
+    x = LazyTable(HEADER, (row for row in ROWS), sample_rows=5)
+    for _ in range(2):
+        assert x.head(2) == expected(ROWS[:2], [4, 4, 4])
+        assert x.page(3, 5) == expected(ROWS[3:5], [4, 4, 4])
+
+    # The rest of the generator is read once
+    assert x.page(10, 12) == expected(ROWS[10:12], [5, 5, 5])
+    with pytest.raises(ValueError, match="already read"):
+        x.tail(2)
+    assert x.head(5) == expected(ROWS[:5], [4, 4, 4])
+
+    # A generator that fits in the sample can be rendered again
+    x = LazyTable(HEADER, (row for row in ROWS[:3]))
+    assert x.tail(2) == x.tail(2) == expected(ROWS[1:3])
+
+
+def test_csv_source(tmp_path):
+    path = tmp_path / "data.csv"
+    with open(path, "w", newline="") as file:
+        csv.writer(file).writerows([HEADER] + ROWS)
+
+    x = LazyTable.from_csv(path)
+    assert x.header == HEADER
+    assert x.head(1) == x.head(1)
+    assert "row49" in x.tail(1)
+    assert "row0" not in x.tail(1)
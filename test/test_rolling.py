@@ -0,0 +1,94 @@
+import pickle
+
+import pytest
+from tabletexifier import RollingTable, Table
+
+HEADER = ["step", "loss", "note"]
+
+
+def make_row(index):
+    return [index, 10.0 ** (6 - index), "x" * (index % 4)]
+
+
+def expected(start, stop, **kwargs):
+    return Table.from_rows([make_row(i) for i in range(start, stop)], HEADER, **kwargs)
+
+
+@pytest.mark.parametrize("table_style", ["A&A", "A", "T", "MNRAS", "NoLines"])
+def test_keeps_the_last_rows(table_style):
+    table = RollingTable(HEADER, capacity=3, table_style=table_style)
+    for index in range(2):
+        table.add_row(make_row(index))
+    assert str(table) == str(expected(0, 2, table_style=table_style))
+    assert table.dropped_rows == 0
+
+    for index in range(2, 8):
+        table.add_row(make_row(index))
+    copy = expected(5, 8, table_style=table_style)
+    assert table.nrows == 4
+    assert table.dropped_rows == 5
+    assert str(table) == str(copy)
+    assert table.build_latex() == copy.build_latex()
+    assert table.get_line(1)[0].content == 5
+
+
+def test_from_rows():
+    rows = (make_row(index) for index in range(10))
+    table = RollingTable.from_rows(rows, capacity=3, header=HEADER, table_style="A")
+    assert str(table) == str(expected(7, 10, table_style="A"))
+    assert table.dropped_rows == 7
+
+    table = RollingTable.from_rows([HEADER, make_row(0)], 2)
+    assert str(table) == str(expected(0, 1))
+    with pytest.raises(ValueError):
+        RollingTable.from_rows([], 2)
+
+    with pytest.raises(TypeError, match="from_rows"):
+        RollingTable.from_columns({"a": [1, 2]})
+    with pytest.raises(TypeError, match="from_rows"):
+        RollingTable.from_csv("data.csv")
+
+
+def test_widths_follow_the_rows():
+    table = RollingTable(HEADER, capacity=2)
+    for index in range(3):
+        table.add_row(make_row(index))
+    # The widest entries (of the first rows) were dropped
+    assert table.get_column_widths() == [4, 9, 4]
+
+    table.set_decimal_places(0, columns=[1])
+    assert table.get_column_widths() == [4, 6, 4]
+    table.get_cell_with_pos(2, 1).set_decimal_places(4)
+    assert table.get_column_widths() == [4, 10, 4]
+
+    table.add_row(make_row(3))
+    table.add_row(make_row(4))
+    assert table.get_column_widths() == [4, 4, 4]
+
+
+def test_pickle():
+    table = RollingTable(HEADER, capacity=3, table_style="A")
+    for index in range(5):
+        table.add_row(make_row(index))
+    loaded = pickle.loads(pickle.dumps(table))
+
+    assert type(loaded) is RollingTable
+    assert loaded.capacity == 3
+    assert str(loaded) == str(table)
+    loaded.add_row(make_row(5))
+    assert str(loaded) == str(expected(3, 6, table_style="A"))
+
+
+def test_unsupported():
+    table = RollingTable(HEADER, capacity=3)
+    table.add_row(make_row(0))
+    with pytest.raises(TypeError):
+        table.sort_by(0)
+    with pytest.raises(TypeError):
+        table.set_cell_as_multi_col(1, 0, 1)
+    with pytest.raises(TypeError):
+        Table.concat([table, expected(0, 2)])
+    with pytest.raises(ValueError):
+        RollingTable(HEADER, capacity=0)
+    with pytest.raises(ValueError):
+        table.add_row([1, 2])
@@ -0,0 +1,87 @@
+import pickle
+
+import pytest
+from tabletexifier import ColumnFormat, Table
+
+
+def build_table(**kwargs):
+    table = Table(["a", "b", "c"], **kwargs)
+    for i in range(6):
+        table.add_row([i * 1.5, i, f"x{i}"])
+    table.add_row([(1.0, 0.1), 3, None])
+    table.set_cell_as_multi_col(2, 0, 1)
+    table.set_cell_as_multi_row(3, 2, 1)
+    table.set_decimal_places(3, columns=[0])
+    table.set_column_format(ColumnFormat(notation="scientific"), columns=[1])
+    table.get_cell_with_pos(5, 0).set_decimal_places(1)
+    table.add_hline(3)
+    table.add_vline(2)
+    table.add_table_caption("Caption")
+    return table
+
+
+def render(table):
+    return str(table) + table.build_latex()
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_pickle(compact):
+    table = build_table(table_style="A", compact=compact)
+    loaded = pickle.loads(pickle.dumps(table))
+
+    assert type(loaded._store) is type(table._store)
+    assert render(loaded) == render(table)
+    assert loaded.get_cell_with_pos(2, 0).dimension == [1, 2]
+    assert loaded.get_cell_with_pos(7, 0).content == (1.0, 0.1)
+
+
+def test_pickled_view_is_a_table():
+    table = build_table()
+    view = table.view(rows=[4, 5], cols=[0, 1])
+    loaded = pickle.loads(pickle.dumps(view))
+
+    assert type(loaded) is Table
+    assert render(loaded) == render(view)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("mmap", [False, True])
+def test_save_and_load(tmp_path, compact, mmap):
+    table = build_table(table_style="T", compact=compact)
+    table.save(tmp_path / "table.ttx")
+    loaded = Table.load(tmp_path / "table.ttx", mmap=mmap)
+
+    assert type(loaded._store) is type(table._store)
+    assert render(loaded) == render(table)
+
+    # The loaded table can still be changed
+    loaded.add_row([1.0, 2, "x"])
+    loaded.delete_rows([1])
+    assert loaded.nrows == table.nrows
+    assert loaded.get_cell_with_pos(1, 0).dimension == [1, 2]
+
+
+def test_load_maps_the_numeric_columns(tmp_path):
+    table = Table(["a", "b"], compact=True)
+    table._extend_columns([[float(i) for i in range(100)], list(range(100))])
+    table.save(tmp_path / "table.ttx")
+    loaded = Table.load(tmp_path / "table.ttx")
+
+    assert all(isinstance(c, memoryview) for c in loaded._store._columns)
+    assert str(loaded) == str(table)
+    # Pickling copies the mapped columns
+    assert str(pickle.loads(pickle.dumps(loaded))) == str(table)
+
+    loaded = Table.load(tmp_path / "table.ttx", mmap=False)
+    assert not any(isinstance(c, memoryview) for c in loaded._store._columns)
+
+
+def test_save_errors(tmp_path):
+    table = Table(["a"])
+    table.add_row([object()])
+    with pytest.raises(TypeError):
+        table.save(tmp_path / "table.ttx")
+
+    (tmp_path / "other").write_bytes(b"not a table")
+    with pytest.raises(ValueError):
+        Table.load(tmp_path / "other")
@@ -0,0 +1,35 @@
+import pytest
+from tabletexifier.exceptions import OverlappingSpans
+from tabletexifier.spans import Span, SpanIndex
+
+
+def test_span_queries():
+    spans = SpanIndex()
+    covered, released = spans.add(1, 1, 2, 3)
+    assert covered == [(1, 2), (1, 3), (2, 1), (2, 2), (2, 3)]
+    assert released == []
+
+    assert spans.owner(2, 3) == Span(1, 1, 2, 3)
+    assert spans.owner(0, 0) is None
+    assert not spans.is_covered(1, 1)
+    assert spans.is_covered(2, 1)
+    assert spans.continues_left(1, 2) and not spans.continues_left(1, 1)
+    assert spans.continues_above(2, 2) and not spans.continues_above(1, 2)
+    assert len(spans) == 1
+
+
+def test_spans_are_validated():
+    spans = SpanIndex()
+    spans.add(1, 1, 2, 1)
+    with pytest.raises(OverlappingSpans):
+        spans.add(2, 0, 1, 2)
+    with pytest.raises(OverlappingSpans):
+        spans.add(2, 1, 1, 1)
+    with pytest.raises(ValueError):
+        spans.add(0, 0, 0, 1)
+
+    # Spans starting on the same cell are resized
+    assert spans.add(1, 1, 2, 2) == ([(1, 2), (2, 2)], [])
+    assert list(spans) == [Span(1, 1, 2, 2)]
+    assert spans.add(1, 1, 1, 1) == ([], [(1, 2), (2, 1), (2, 2)])
+    assert spans.owner(2, 1) is None
@@ -0,0 +1,834 @@
+import pytest
+from tabletexifier import ColumnFormat, Table
+from tabletexifier.exceptions import (
+    CellNotFound,
+    ColumnDoesNotExist,
+    OverlappingSpans,
+    RowDoesNotExist,
+)
+
+
+def build_table(nrows=3, table_style="A&A"):
+    x = Table(["Name", "b", "c"], table_style=table_style)
+    for index in range(nrows):
+        x.add_row([f"row{index}", index, index * 1.5])
+    return x
+
+
+def test_positional_access():
+    x = build_table()
+
+    assert [c.content for c in x.get_line(2)] == ["row1", 1, 1.5]
+    assert [c.content for c in x.get_column(0)] == ["Name", "row0", "row1", "row2"]
+    assert x.get_cell_with_pos(3, 2).content == 3.0
+    assert x.get_cell_with_pos(3, 2).origin == [3, 2]
+
+    with pytest.raises(RowDoesNotExist):
+        x.get_line(4)
+    with pytest.raises(ColumnDoesNotExist):
+        x.get_column(3)
+    with pytest.raises(CellNotFound):
+        x.get_cell_with_pos(0, -1)
+
+
+def test_cell_links():
+    x = build_table()
+    cell = x.get_cell_with_pos(1, 1)
+
+    assert cell.next_row is x.get_cell_with_pos(2, 1)
+    assert cell.previous_row is x.get_cell_with_pos(0, 1)
+    assert cell.next_col is x.get_cell_with_pos(1, 2)
+    assert cell.previous_col is x.get_cell_with_pos(1, 0)
+    assert x.get_cell_with_pos(3, 2).next_row is None
+
+
+@pytest.mark.parametrize("table_style", ["A&A", "A", "T", "MNRAS", "NoLines"])
+def test_compact_matches_grid(table_style):
+    tables = []
+    for compact in (False, True):
+        x = Table(["Name", "b", "c"], table_style=table_style, compact=compact)
+        x.add_row(["first", 1, 2.5])
+        x.add_row(["second", 10**30, float("nan")])
+        x.add_row(["third", "text", 3.14159])
+        x.set_cell_as_multi_row(1, 1, 1)
+        x.set_cell_as_multi_col(3, 0, 1)
+        x.set_decimal_places(3)
+        x.add_row(["fourth", 4, 4.0])
+        tables.append(x)
+
+    grid, compact = tables
+    assert str(grid) == str(compact)
+    assert grid.build_latex() == compact.build_latex()
+
+
+def test_compact_rows_are_rendered_from_their_columns(monkeypatch):
+    grid, compact = (
+        Table.from_rows(
+            [[f"r{index}", index, index * 1.5] for index in range(4)],
+            header=["a", "b", "c"],
+            table_style="A",
+            compact=compact,
+        )
+        for compact in (False, True)
+    )
+    created = []
+    get_cell = compact._store.get_cell
+    monkeypatch.setattr(
+        compact._store,
+        "get_cell",
+        lambda row, col: created.append((row, col)) or get_cell(row, col),
+    )
+    assert str(compact) == str(grid)
+    # Only the cells of the header go through a Cell
+    assert {row for row, _ in created} == {0}
+
+    for x in (grid, compact):
+        str(x)
+        x.get_cell_with_pos(2, 2).content = 12.125
+        x.get_cell_with_pos(3, 1).set_decimal_places(0)
+        x.set_decimal_places(1, columns=[2])
+        x.set_column_format(ColumnFormat(notation="scientific"), columns=[1])
+        x.set_cell_as_multi_row(1, 0, 1)
+        x.insert_rows(2, [["new", 7, 7.5]])
+    assert str(compact) == str(grid)
+    assert (2, 2) in created
+
+    for x in (grid, compact):
+        x.add_vline(1)
+        x.delete_rows([1])
+    assert str(compact) == str(grid)
+
+
+def test_compact_cells_write_back():
+    x = Table(["Name", "b"], compact=True)
+    x.add_row(["first", 1.5])
+
+    cell = x.get_cell_with_pos(1, 1)
+    cell.set_decimal_places(0)
+    cell.set_property("color", "red")
+
+    new_view = x.get_cell_with_pos(1, 1)
+    assert new_view is not cell
+    assert new_view.generate_text() == "2"
+    assert new_view.get_property("color") == "red"
+    assert new_view.previous_col.content == "first"
+    assert x.get_cell_with_pos(0, 1).get_property("color") is None
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_cell_changes_are_notified_once(compact, monkeypatch):
+    x = Table(["Name", "b"], compact=compact)
+    x.add_row(["first", 1.5])
+    changes = []
+    monkeypatch.setattr(x, "_cell_changed", lambda row, col: changes.append((row, col)))
+    x._store.on_change = x._cell_changed
+
+    cell = x.get_cell_with_pos(1, 1)
+    cell.update_size(ncols=1)
+    cell.set_property("color", "red")
+    cell.content = 2.5
+    assert changes == [(1, 1)] * 3
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_cell_assignments_are_kept(compact):
+    x = Table(["Name", "b"], compact=compact)
+    x.add_row(["first", 1.5])
+    x.add_row(["second", 2.5])
+    str(x)
+
+    x.get_cell_with_pos(1, 1).content = 10.25
+    x.get_cell_with_pos(2, 1).content = "n/a"
+    x.get_cell_with_pos(0, 0).content = "Names"
+    x.get_cell_with_pos(2, 0).is_blank = True
+
+    assert [c.content for c in x.get_column(1)] == ["b", 10.25, "n/a"]
+    assert x.get_cell_with_pos(0, 0).content == "Names"
+    assert x.get_cell_with_pos(2, 0).is_blank
+    assert x.get_column_widths() == [5, 5]
+    assert "10.25" in str(x) and "second" not in str(x)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_spans(compact):
+    x = Table(["a", "b", "c", "d"], table_style="A", compact=compact)
+    for index in range(4):
+        x.add_row([f"r{index}", index, index, index])
+    x.set_cell_as_multi_col(1, 1, 1)
+    x.set_cell_as_multi_row(2, 0, 2)
+
+    lines = str(x).split("\n")
+    assert lines[3] == "| r0 | 0.00        | 0.00 |"
+    assert lines[6] == lines[8] == "+    +------+------+------+"
+    latex = x.build_latex().split("\n")
+    assert latex[7] == r" r0 &\multicolumn{2}{c}{0}      &  0   \\ \hline"
+    assert latex[10] == r"    &  3   &  3   &  3   \\ \hline"
+
+    # Both over rows and columns
+    x.set_cell_as_multi_col(2, 0, 1)
+    assert x.get_cell_with_pos(4, 1).is_blank
+    assert str(x).split("\n")[7] == "|           | 2.00 | 2.00 |"
+    latex = x.build_latex().split("\n")
+    assert latex[8].startswith(r"\multicolumn{2}{c}{\multirow{3}{*}{r1}}      &  1")
+    assert latex[9] == r"\multicolumn{2}{c}{}      &  2   &  2   \\ \hline"
+
+    with pytest.raises(OverlappingSpans):
+        x.set_cell_as_multi_row(1, 2, 1)
+    with pytest.raises(CellNotFound):
+        x.set_cell_as_multi_row(4, 3, 1)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_shrinking_a_span(compact):
+    x, expected = (
+        Table.from_rows(
+            [[f"r{index}", index] for index in range(4)],
+            header=["a", "b"],
+            table_style="A",
+            compact=compact,
+        )
+        for _ in range(2)
+    )
+    x.set_cell_as_multi_row(1, 0, 2)
+    x.set_cell_as_multi_row(1, 0, 1)
+    expected.set_cell_as_multi_row(1, 0, 1)
+
+    assert not x.get_cell_with_pos(3, 0).is_blank
+    assert x.get_cell_with_pos(2, 0).is_blank
+    assert str(x) == str(expected)
+    assert x.build_latex() == expected.build_latex()
+
+
+def contents(table, col=0):
+    return [cell.content for cell in table.get_column(col)]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_insert_and_delete_rows(compact):
+    x = build_table(nrows=4)
+    x.set_cell_as_multi_row(2, 0, 1)
+    x.add_hline(3)
+
+    x.insert_rows(3, [["new0", 10, 1.0], ["new1", 11, 2.0]])
+    assert contents(x) == ["Name", "row0", "row1", "new0", "new1", "row2", "row3"]
+    # The span grows over the new rows, and the line stays below the same row
+    assert x.get_cell_with_pos(2, 0).dimension == [4, 1]
+    assert [x.get_cell_with_pos(row, 0).is_blank for row in (3, 4, 5)] == [True] * 3
+    assert x._table_style.extra_hline == [3]
+
+    x.delete_rows([1, 4])
+    assert contents(x) == ["Name", "row1", "new0", "row2", "row3"]
+    assert x.get_cell_with_pos(1, 0).dimension == [3, 1]
+    assert x._table_style.extra_hline == [2]
+    assert x.get_column_widths() == [4, 5, 4]
+
+    # Removing the first row of a span removes the span
+    x.delete_rows([1])
+    assert not x.get_cell_with_pos(1, 0).is_blank
+    assert len(x._store.spans) == 0
+    expected = Table.from_rows(
+        [["Name", "b", "c"], ["new0", 10, 1.0], ["row2", 2, 3.0], ["row3", 3, 4.5]],
+        compact=compact,
+    )
+    expected.add_hline(1)
+    assert str(x) == str(expected)
+
+    with pytest.raises(ValueError):
+        x.delete_rows([0])
+    with pytest.raises(RowDoesNotExist):
+        x.delete_rows([4])
+    with pytest.raises(RowDoesNotExist):
+        x.insert_rows(0, [["a", 1, 2]])
+    with pytest.raises(ValueError):
+        x.insert_rows(1, [["a", 1]])
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_rows_must_match_the_header(compact):
+    x = Table(["a", "b"], compact=compact)
+    x.add_row([1, 2])
+    for row in ([1], [1, 2, 3]):
+        with pytest.raises(ValueError, match="Expected a row with 2 entries"):
+            x.add_row(row)
+    with pytest.raises(ValueError, match="Expected a row with 2 entries"):
+        x._extend_rows([[3, 4], [5]])
+    assert x.nrows == 2
+    assert str(x) == str(Table.from_rows([[1, 2]], header=["a", "b"]))
+
+    with pytest.raises(ValueError, match="Expected a row with 2 entries"):
+        Table.from_rows([["a", "b"], [1, 2], [3]], compact=compact)
+    with pytest.raises(ValueError):
+        Table.from_columns({"a": [1, 2], "b": [3]}, compact=compact)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_sort_and_filter(compact):
+    x = Table(["Name", "b"], compact=compact)
+    for name, value in [("c", 2.5), ("a", 1.0), ("d", -1.0), ("b", 1.0)]:
+        x.add_row([name, value])
+    x.set_cell_as_multi_col(1, 0, 1)
+    x.add_hline(2)
+
+    x.sort_by(1)
+    assert contents(x) == ["Name", "d", "a", "b", "c"]
+    assert x.get_cell_with_pos(4, 1).is_blank
+    assert x.get_cell_with_pos(4, 0).next_col.is_blank
+    assert x._table_style.extra_hline == [2]
+    x.sort_by(0, key=str.upper, reverse=True)
+    assert contents(x) == ["Name", "d", "c", "b", "a"]
+
+    x.filter(lambda row: row[1] >= 1)
+    assert contents(x) == ["Name", "c", "b", "a"]
+    assert contents(x, 1) == ["b", 2.5, 1.0, 1.0]
+    assert x._table_style.extra_hline == [1]
+    assert x.get_cell_with_pos(1, 0).dimension == [1, 2]
+
+    x.set_cell_as_multi_row(2, 0, 1)
+    with pytest.raises(ValueError):
+        x.sort_by(0)
+    assert contents(x) == ["Name", "c", "b", "a"]
+
+
+def build_chunk(start, nrows, compact=False):
+    return Table.from_rows(
+        [[f"row{index}", index, index * 1.5] for index in range(start, start + nrows)],
+        header=["Name", "b", "c"],
+        table_style="A",
+        compact=compact,
+    )
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_concat_rows(compact):
+    chunks = [build_chunk(0, 2, compact), build_chunk(2, 3, compact)]
+    nested = [build_chunk(5, 1, compact), build_chunk(6, 2, compact)]
+    chunks.append(Table.concat(nested))
+    chunks[0].add_hline(3)
+    chunks[1].add_hline(1)
+    chunks[1].add_hline(2)
+    chunks[2].set_cell_as_multi_row(1, 0, 1)
+    x = Table.concat(chunks)
+
+    expected = build_chunk(0, 8, compact)
+    # The lines at the boundary of the first two tables are merged
+    expected.add_hline(3)
+    expected.add_hline(4)
+    expected.set_cell_as_multi_row(6, 0, 1)
+    assert x._table_style.extra_hline == [3, 4]
+    assert contents(x) == contents(expected)
+    assert str(x) == str(expected)
+    assert x.build_latex() == expected.build_latex()
+    assert x.get_cell_with_pos(2, 1).next_row.content == 2
+
+    # Editing the joined table
+    for table in (x, expected):
+        table.add_row(["row8", 8, 12.0])
+        table.set_decimal_places(1, columns=[2])
+        table.set_cell_as_multi_col(3, 1, 1)
+        table.delete_rows([1, 4])
+    assert str(x) == str(expected)
+    assert x.build_latex() == expected.build_latex()
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_concat_columns(compact):
+    left, right = build_chunk(0, 3, compact), build_chunk(3, 3, compact)
+    right.add_vline(1)
+    right.set_decimal_places(0, columns=[2])
+    x = Table.concat([left, right], axis=1)
+
+    expected = Table.from_rows(
+        [
+            [f"row{i}", i, i * 1.5, f"row{i + 3}", i + 3, (i + 3) * 1.5]
+            for i in range(3)
+        ],
+        header=["Name", "b", "c"] * 2,
+        table_style="A",
+        compact=compact,
+    )
+    expected.add_vline(4)
+    expected.set_decimal_places(0, columns=[5])
+    assert x.ncols == 6
+    assert str(x) == str(expected)
+    assert x.get_cell_with_pos(1, 2).next_col.content == "row3"
+
+    for table in (x, expected):
+        table.add_row(["a", 1, 2, "b", 3, 4])
+        table.set_cell_as_multi_col(1, 2, 1)
+        table.insert_rows(2, [["c", 5, 6, "d", 7, 8]])
+    assert str(x) == str(expected)
+    assert x.build_latex() == expected.build_latex()
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_cell_positions_after_concat(compact):
+    rows = Table.concat([build_chunk(0, 2, compact), build_chunk(2, 2, compact)])
+    for row in range(rows.nrows):
+        for col in range(rows.ncols):
+            cell = rows.get_cell_with_pos(row, col)
+            assert (cell.row_number, cell.col_number) == (row, col)
+
+    cols = Table.concat(
+        [build_chunk(0, 2, compact), build_chunk(2, 2, compact)], axis=1
+    )
+    for row in range(cols.nrows):
+        for col in range(cols.ncols):
+            cell = cols.get_cell_with_pos(row, col)
+            assert (cell.row_number, cell.col_number) == (row, col)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_tables_are_moved_by_concat(compact):
+    first, second = build_chunk(0, 2, compact), build_chunk(2, 2, compact)
+    x = Table.concat([first, second])
+    before = str(x)
+
+    for use in (
+        lambda: first.add_row(["row9", 9, 9.0]),
+        lambda: second.set_decimal_places(0),
+        lambda: str(first),
+        lambda: first.nrows,
+        lambda: Table.concat([first]),
+    ):
+        with pytest.raises(TypeError):
+            use()
+    assert str(x) == before
+    assert x.nrows == 5
+
+
+def test_invalid_concat():
+    with pytest.raises(ValueError):
+        Table.concat([])
+    with pytest.raises(ValueError):
+        Table.concat([build_chunk(0, 1), build_chunk(0, 2)], axis=1)
+    with pytest.raises(ValueError):
+        Table.concat([build_chunk(0, 1), build_chunk(0, 1, compact=True)])
+    x = build_chunk(0, 1)
+    with pytest.raises(ValueError):
+        Table.concat([x, x])
+    with pytest.raises(TypeError):
+        Table.concat([x.view(cols=[0])])
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_bulk_constructors(compact):
+    expected = build_table()
+
+    rows = [["Name", "b", "c"]] + [[f"row{i}", i, i * 1.5] for i in range(3)]
+    from_rows = Table.from_rows(rows, compact=compact)
+    from_columns = Table.from_columns(
+        {"Name": ["row0", "row1", "row2"], "b": [0, 1, 2], "c": [0.0, 1.5, 3.0]},
+        compact=compact,
+    )
+
+    for x in (from_rows, from_columns):
+        assert x.N_lines == 4
+        assert str(x) == str(expected)
+        assert x.get_cell_with_pos(3, 0).next_col.content == 2
+
+    with pytest.raises(ValueError):
+        Table.from_columns({"a": [1, 2], "b": [1]}, compact=compact)
+
+
+def test_from_numpy():
+    np = pytest.importorskip("numpy")
+
+    data = np.arange(6, dtype=float).reshape(3, 2)
+    x = Table.from_numpy(data, header=["a", "b"])
+    assert [c.content for c in x.get_column(1)] == ["b", 1.0, 3.0, 5.0]
+    assert type(x.get_cell_with_pos(1, 0).content) is float
+
+    structured = np.array([("first", 1.5)], dtype=[("name", "U10"), ("value", "f8")])
+    x = Table.from_numpy(structured, compact=True)
+    assert [c.content for c in x.get_line(0)] == ["name", "value"]
+    assert [c.content for c in x.get_line(1)] == ["first", 1.5]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_from_dataframe(compact):
+    pd = pytest.importorskip("pandas")
+
+    dataframe = pd.DataFrame(
+        {"name": ["a", "b"], "count": [1, 2], "flux": [1.5, 2.5], 3: [True, False]},
+        index=pd.Index([10, 20], name="id"),
+    )
+    x = Table.from_dataframe(dataframe, compact=compact)
+    assert [c.content for c in x.get_line(0)] == ["name", "count", "flux", "3"]
+    assert [c.content for c in x.get_line(1)] == ["a", 1, 1.5, True]
+    assert [type(c.content) for c in x.get_line(2)] == [str, int, float, bool]
+
+    x = Table.from_dataframe(dataframe, index=True, compact=compact)
+    assert [c.content for c in x.get_line(0)] == ["id", "name", "count", "flux", "3"]
+    assert [c.content for c in x.get_column(0)] == ["id", 10, 20]
+
+    unnamed = Table.from_dataframe(dataframe.reset_index(drop=True), index=True)
+    assert unnamed.get_cell_with_pos(0, 0).content == ""
+    assert [c.content for c in unnamed.get_column(0)][1:] == [0, 1]
+
+
+def test_from_numpy_references_the_array():
+    np = pytest.importorskip("numpy")
+
+    data = np.arange(8).reshape(4, 2) * np.array([1.5, 1])
+    x = Table.from_numpy(data, header=["a", "b"], compact=True)
+    assert np.shares_memory(x._store._columns[0], data)
+    assert type(x.get_cell_with_pos(1, 1).content) is float
+    assert str(x) == str(Table.from_numpy(data, header=["a", "b"]))
+
+    # The column is only copied once it grows
+    x.add_row([1.25, 7])
+    assert not np.shares_memory(x._store._columns[0], data)
+    assert [c.content for c in x.get_column(0)][-2:] == [9.0, 1.25]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_decimal_places_per_column(compact):
+    x = Table(["a", "b"], compact=compact)
+    x.add_row([1.0, 2.0])
+    x.get_cell_with_pos(1, 0).set_decimal_places(4)
+    x.get_cell_with_pos(1, 1).set_decimal_places(4)
+
+    x.set_decimal_places(1, columns=[1])
+    x.add_row([3.0, 4.0])
+    assert [c.generate_text() for c in x.get_line(1)] == ["1.0000", "2.0"]
+    # Also applied to the rows added afterwards
+    assert [c.generate_text() for c in x.get_line(2)] == ["3.00", "4.0"]
+
+    x.set_decimal_places(0)
+    x.add_row([5.0, 6.0])
+    assert [c.get_content("LaTeX") for c in x.get_line(3)] == ["5.0", "6.0"]
+    assert [c.generate_text() for c in x.get_column(0)][1:] == ["1", "3", "5"]
+    assert x.get_column_widths() == [1, 1]
+
+    with pytest.raises(ColumnDoesNotExist):
+        x.set_decimal_places(1, columns=[2])
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_column_formats(compact):
+    x = Table(["Name", "flux", "v"], compact=compact)
+    x.add_row(["a", 12345.678, (1.2345, 0.0123)])
+    x.set_column_format(ColumnFormat(precision=1, notation="scientific"), [1])
+    x.set_column_format(ColumnFormat(uncertainty=True), columns=[2])
+    x.add_row(["b", 0.5, (2.0, 0.5)])
+
+    texts = [c.generate_text() for c in x.get_line(2)]
+    assert texts == ["b", "5.0e-01", "2.00 ± 0.50"]
+    assert x.get_column_widths() == [4, 7, 11]
+    assert r"&$1.2 \times 10^{4}$&$1.23 \pm 0.01$\\" in x.build_latex()
+
+    x.set_decimal_places(1, columns=[2])
+    assert x.get_cell_with_pos(1, 2).generate_text() == "1.2 ± 0.0"
+    x.set_column_format(None)
+    assert x.get_cell_with_pos(2, 1).generate_text() == "0.50"
+    with pytest.raises(ColumnDoesNotExist):
+        x.set_column_format(ColumnFormat(), columns=[3])
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_from_csv(tmp_path, compact):
+    expected = build_table()
+    body = "".join(f"row{i},{i},{i * 1.5}\n" for i in range(3))
+
+    path = tmp_path / "with_header.csv"
+    path.write_text("Name,b,c\n" + body)
+    for header in (None, True):
+        x = Table.from_csv(path, header=header, chunksize=2, compact=compact)
+        assert str(x) == str(expected)
+        assert x.get_cell_with_pos(3, 1).content == 2
+        assert type(x.get_cell_with_pos(3, 2).content) is float
+
+    path = tmp_path / "without_header.csv"
+    path.write_text(body)
+    x = Table.from_csv(path, header=["Name", "b", "c"], compact=compact)
+    assert str(x) == str(expected)
+    x = Table.from_csv(path, header=False, parse_numbers=False, compact=compact)
+    assert [c.content for c in x.get_line(0)] == ["0", "1", "2"]
+    assert [c.content for c in x.get_line(1)] == ["row0", "0", "0.0"]
+
+    path.write_text(body + "row3,3\n")
+    with pytest.raises(ValueError):
+        Table.from_csv(path, header=["Name", "b", "c"], compact=compact)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_from_csv_types_do_not_depend_on_the_chunks(tmp_path, compact):
+    path = tmp_path / "data.csv"
+    path.write_text("name,val,x\n" + "".join(f"r{i},{i},{i}\n" for i in range(4)))
+    with open(path, "a") as file:
+        file.write("r4,n/a,4.5\n")
+
+    outputs = []
+    for chunksize in (2, 100):
+        x = Table.from_csv(path, header=True, chunksize=chunksize, compact=compact)
+        assert [c.content for c in x.get_column(1)[1:]] == ["0", "1", "2", "3", "n/a"]
+        assert [c.content for c in x.get_column(2)[1:]] == [0.0, 1.0, 2.0, 3.0, 4.5]
+        outputs.append(str(x) + x.build_latex())
+    assert outputs[0] == outputs[1]
+
+
+def test_from_npy(tmp_path):
+    np = pytest.importorskip("numpy")
+
+    path = tmp_path / "data.npy"
+    np.save(path, np.arange(6, dtype=float).reshape(3, 2))
+    x = Table.from_npy(path, header=["a", "b"], chunksize=2)
+    assert [c.content for c in x.get_column(1)] == ["b", 1.0, 3.0, 5.0]
+    with pytest.raises(ValueError):
+        Table.from_npy(path)
+
+    structured = np.array(
+        [("first", 1.5, 2), ("second", 2.5, 3)],
+        dtype=[("name", "U10"), ("value", "f8"), ("count", "i4")],
+    )
+    np.save(path, structured)
+    for mmap in (True, False):
+        x = Table.from_npy(path, mmap=mmap)
+        assert [c.content for c in x.get_line(0)] == ["name", "value", "count"]
+        assert [c.content for c in x.get_line(2)] == ["second", 2.5, 3]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_column_widths(compact):
+    x = Table(["Name", "b"], compact=compact)
+    assert x.get_column_widths() == [4, 1]
+
+    x.add_row(["first", 123.456])
+    assert x.get_column_widths() == [5, 6]
+
+    x.set_decimal_places(0)
+    assert x.get_column_widths() == [5, 3]
+
+    x.add_row(["second", 1.5])
+    x.get_cell_with_pos(2, 1).set_decimal_places(5)
+    assert x.get_column_widths() == [6, 7]
+
+    x.set_cell_as_multi_row(1, 0, 1)
+    assert x.get_column_widths() == [5, 7]
+    assert x.compute_max_text_size_of_cols() == [8, 10]
+
+
+def test_iter_lines_and_file_streaming(tmp_path):
+    x = build_table(table_style="A")
+
+    assert "\n".join(x.iter_lines()) == str(x)
+    assert "\n".join(x.iter_lines(fmt="LaTeX", ignore_rows=1)) == x.get_pretty_print(
+        1, fmt="LaTeX"
+    )
+    assert "\n".join(x.iter_latex()) == x.build_latex()
+    with pytest.raises(ValueError):
+        x.iter_lines(fmt="HTML")
+
+    path = tmp_path / "output.txt"
+    x.write_to_file(path, mode="w", write_LaTeX=True)
+    assert path.read_text() == str(x) + "\n\n" + x.build_latex()
+
+
+@pytest.mark.parametrize("table_style", ["A&A", "A", "T", "MNRAS", "NoLines"])
+def test_longtable_and_split_latex(tmp_path, table_style):
+    x = build_table(nrows=5, table_style=table_style)
+    x.add_table_caption("Caption")
+    x.add_table_label("tab:label")
+    rows = x.get_pretty_print(0, fmt="LaTeX").split("\n")
+
+    longtable = x.build_latex(mode="longtable").split("\n")
+    assert longtable[1].startswith(r"\begin{longtable}")
+    assert longtable[-1] == r"\end{longtable}"
+    assert longtable.count(rows[0]) == 2
+    assert longtable[-6:-1] == rows[1:]
+
+    split = x.build_latex(mode="split", chunk_rows=2)
+    tables = split.split(r"\end{table}")[:-1]
+    assert len(tables) == 3
+    assert split.count(r"\label{tab:label}") == 1
+    assert split.count("Caption (continued)") == 2
+    for index, table in enumerate(tables):
+        assert rows[0] in table
+        assert all(row in table for row in rows[1 + 2 * index : 3 + 2 * index])
+
+    # A single chunk is the same as the default output
+    assert x.build_latex(mode="split", chunk_rows=5) == x.build_latex()
+
+    path = tmp_path / "output.tex"
+    x.write_to_file(
+        path,
+        mode="w",
+        write_table=False,
+        write_LaTeX=True,
+        latex_mode="split",
+        chunk_rows=2,
+    )
+    assert path.read_text() == split
+
+    with pytest.raises(ValueError):
+        x.iter_latex(mode="tabularx")
+    with pytest.raises(ValueError):
+        x.iter_latex(mode="split", chunk_rows=0)
+
+
+@pytest.mark.parametrize("table_style", ["A&A", "MNRAS", "NoLines"])
+def test_plain_rows_match_general_renderer(monkeypatch, table_style):
+    x = build_table(nrows=4, table_style=table_style)
+    x.add_row(["a much longer name", 10**6, ""])
+    x.set_cell_as_multi_row(1, 1, 1)
+    x.set_cell_as_multi_col(3, 0, 1)
+    x.add_hline(2)
+    outputs = [str(x), "\n".join(x.iter_lines(widths=[1, 1, 1]))]
+
+    # A vertical line out of the table sends every row through the general renderer
+    from tabletexifier.table_styles import Style
+
+    monkeypatch.setattr(Style, "vline_set", frozenset({10}))
+    x._invalidate_render_cache()
+    assert [str(x), "\n".join(x.iter_lines(widths=[1, 1, 1]))] == outputs
+
+
+def test_latex_of_a_table_never_rendered():
+    x = Table(["a", "b"], table_style="A")
+    x.add_row([1, 2])
+    latex = "\n".join(x.iter_latex())
+    assert r"\begin{tabular}{|c|c}" in latex
+    assert latex == x.build_latex()
+
+
+@pytest.mark.parametrize("table_style", ["A&A", "A", "T", "MNRAS", "NoLines"])
+def test_incremental_writer(tmp_path, table_style):
+    x = Table(["Name", "b", "c"], table_style=table_style)
+    path = tmp_path / "output.txt"
+
+    with x.open_writer(path, widths=[4, 4, 4]) as writer:
+        assert writer.flush() == 1
+        for index in range(4):
+            x.add_row([f"row{index}", index, index * 1.5])
+            assert writer.flush() == 1
+        x.add_row(["row4", 4, 6.0])
+        x.add_row(["row5", 5, 7.5])
+        assert writer.flush() == 2
+        assert writer.flush() == 0
+
+    assert writer.closed
+    assert path.read_text() == str(x) + "\n"
+
+
+@pytest.mark.parametrize("table_style", ["A&A", "A", "T", "MNRAS", "NoLines"])
+@pytest.mark.parametrize("compact", [False, True])
+def test_render_cache_is_invalidated(table_style, compact):
+    x = Table(["Name", "b", "c"], table_style=table_style, compact=compact)
+
+    def check():
+        for fmt in ("text", "LaTeX"):
+            for ignore_rows in (0, 1):
+                expected = "\n".join(x.iter_lines(fmt=fmt, ignore_rows=ignore_rows))
+                assert x.get_pretty_print(ignore_rows, fmt=fmt) == expected
+
+    check()
+    for index in range(3):
+        x.add_row([f"row{index}", index, index * 1.5])
+        check()
+    x.add_row(["a much longer name", 1, 2])
+    check()
+    x.set_cell_as_multi_row(1, 1, 1)
+    check()
+    x.add_row(["last", 3, 4])
+    check()
+    x.set_cell_as_multi_col(4, 0, 1)
+    check()
+    x.add_hline(2)
+    x.add_vline(1)
+    check()
+    x.set_decimal_places(4)
+    check()
+    x.get_cell_with_pos(2, 2).set_decimal_places(0)
+    check()
+    x.update_table_style("A")
+    check()
+
+
+def test_render_cache_reuses_rows(monkeypatch):
+    x = build_table(nrows=10, table_style="A")
+    str(x)
+
+    rendered = []
+    render_row = x._render_row
+
+    def counting_render_row(row_index, *args):
+        rendered.append(row_index)
+        return render_row(row_index, *args)
+
+    monkeypatch.setattr(x, "_render_row", counting_render_row)
+    assert str(x) == str(x)
+    assert rendered == []
+
+    x.add_row(["r10", 1, 1.5])
+    output = str(x)
+    assert rendered == [11]
+    assert output == "\n".join(x.iter_lines())
+
+
+def test_cell_text_is_cached_until_changed():
+    x = build_table()
+    cell = x.get_cell_with_pos(2, 2)
+
+    assert cell.generate_text() is cell.generate_text()
+    assert cell.generate_LaTeX() == "1.5"
+
+    cell.content = 2.25
+    assert cell.generate_text() == "2.25"
+    assert str(x) == "\n".join(x.iter_lines())
+
+    cell.set_decimal_places(1)
+    assert cell.generate_text() == "2.2"
+    assert cell.generate_LaTeX() == "2.2"
+
+    cell.is_blank = True
+    assert cell.generate_text() == ""
+    assert str(x) == "\n".join(x.iter_lines())
+
+
+@pytest.mark.parametrize("table_style", ["A&A", "A"])
+def test_parallel_rendering(tmp_path, table_style):
+    x = build_table(nrows=50, table_style=table_style)
+    x.set_cell_as_multi_row(3, 1, 2)
+    x.set_cell_as_multi_col(20, 0, 1)
+
+    for fmt in ("text", "LaTeX"):
+        expected = "\n".join(x.iter_lines(fmt=fmt, ignore_rows=1))
+        assert "\n".join(x.iter_lines(fmt=fmt, ignore_rows=1, workers=2)) == expected
+    expected = x.build_latex()
+    x._invalidate_render_cache()
+    assert x.build_latex(workers=3) == expected
+
+    serial, parallel = tmp_path / "serial.txt", tmp_path / "parallel.txt"
+    x.write_to_file(serial, mode="w", write_LaTeX=True)
+    x.write_to_file(parallel, mode="w", write_LaTeX=True, workers=2)
+    assert serial.read_text() == parallel.read_text()
+
+
+def test_render_stats():
+    x = build_table(nrows=5, table_style="A")
+    assert x.render_stats is None
+
+    stats = x.enable_render_stats()
+    x.build_latex()
+    str(x)
+    str(x)
+    x.add_row(["r5", 5, 7.5])
+    str(x)
+
+    assert stats.calls["build_latex"] == 1
+    assert stats.calls["get_pretty_print"] == 4
+    assert stats.counters["render_cache_hits"] == 1
+    assert stats.counters["render_cache_misses"] == 3
+    assert stats.counters["rows_rendered"] == 6 + 6 + 1
+    assert stats.counters["row_cache_hits"] == 6
+    assert stats.calls["format"] == stats.calls["rows"] == 13
+    assert stats.calls["separators"] > 0
+    assert "join" in stats.report()
+
+    # The instrumentation is removed once each render is done
+    assert "_render_row" not in vars(x)
+    assert "get_col_separation" not in vars(x._table_style)
+
+    x.disable_render_stats()
+    str(x)
+    assert x.render_stats is None
@@ -1,3 +1,5 @@
+from tabletexifier.table_styles import AA, Alines
+
 
 def test_all_lines():
     assert 1 == 1
@@ -9,3 +11,40 @@ def test_T_lines():
 
 def test_MNRAS_lines():
     assert 1 == 1
+
+
+def test_layout_plan():
+    style = AA()
+    style.set_size(rows=5, cols=3)
+    assert style.hline_counts == {0: 2, 1: 1, 5: 1}
+    assert style.check_if_duplicate_row(0) == (True, 2)
+    assert style.check_if_duplicate_row(2) == (False, 0)
+
+    style.add_hline(2)
+    style.add_vline(1)
+    assert style.check_if_duplicate_row(2) == (True, 1)
+    assert style.vline_set == {1}
+
+    style.set_size(rows=7, cols=3)
+    assert style.hline_counts == {0: 2, 1: 1, 2: 1, 7: 1}
+
+
+def test_all_lines_layout_follows_size():
+    style = Alines()
+    style.set_size(rows=3, cols=2)
+    assert style.vline_set == {0, 1, 2}
+    style.set_size(rows=10, cols=4)
+    assert set(style.hline_counts) == set(range(11))
+    assert style.vline_set == set(range(5))
+
+
+def test_page_rules():
+    style = AA()
+    style.set_size(rows=5, cols=3)
+    assert style.get_TeX_page_rules() == r"\hline"
+    assert r"\label" not in style.get_TeX_header(continued=True)
+
+    # Every row already ends with a line
+    style = Alines()
+    style.set_size(rows=5, cols=3)
+    assert style.get_TeX_page_rules() == ""
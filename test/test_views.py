@@ -0,0 +1,127 @@
+import pytest
+from tabletexifier import Table
+from tabletexifier.exceptions import ColumnDoesNotExist, RowDoesNotExist
+
+
+def build_table(**kwargs):
+    table = Table(["a", "b", "c"], **kwargs)
+    for i in range(6):
+        table.add_row([i, i * 1.5, f"x{i}"])
+    return table
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_view_renders_like_a_copy(compact):
+    table = build_table(table_style="A", compact=compact)
+    view = table.view(rows=slice(2, 5), cols=[2, 0])
+
+    copy = Table(["c", "a"], table_style="A")
+    for i in range(1, 4):
+        copy.add_row([f"x{i}", i])
+    assert view.nrows == 4 and view.ncols == 2
+    assert str(view) == str(copy)
+    assert view.build_latex() == copy.build_latex()
+
+    # The cells are shared with the table, not copied (the compact storage
+    # creates its cells when they are requested)
+    if not compact:
+        assert view.get_cell_with_pos(1, 1) is table.get_cell_with_pos(2, 0)
+    assert [cell.generate_text() for cell in view.get_line(0)] == ["c", "a"]
+
+
+def test_view_follows_the_table():
+    table = build_table()
+    view = table.view(cols=[0])
+    before = str(view)
+
+    table.add_row([6, 9.0, "x6"])
+    assert view.nrows == 8
+    assert str(view) != before
+    table.set_decimal_places(0)
+    assert "0.00" not in str(view)
+
+    # Lines added to the view do not change the table
+    view.add_hline(3)
+    assert 3 not in table._table_style.extra_hline
+
+
+def test_view_lines_and_spans():
+    table = build_table(table_style="A")
+    table.add_hline(4)
+    table.set_cell_as_multi_col(2, 0, 1)
+    table.add_table_caption("Results")
+
+    view = table.view(rows=[1, 2, 4], cols=[0, 1])
+    assert view._table_style.extra_hline == [3]
+    latex = view.build_latex()
+    assert r"\caption{Results}" in latex
+    assert r"\multicolumn{2}{c}{1}" in latex
+
+    # Spans must be entirely in the view (or not at all)
+    assert table.view(rows=[1, 3]).nrows == 3
+    with pytest.raises(ValueError):
+        table.view(cols=[1, 2])
+    with pytest.raises(ValueError):
+        table.view(cols=[1, 0])
+
+
+def test_views_of_row_ranges():
+    table = build_table(table_style="A")
+    table.add_hline(0)
+    table.add_hline(4)
+    table.add_hline(6)
+    table.set_cell_as_multi_row(3, 1, 2)
+
+    for rows in ((slice(2, 6), [2, 3, 4, 5]), (slice(1, 7, 5), [1, 6])):
+        ranged, listed = (table.view(rows=selection) for selection in rows)
+        assert isinstance(ranged._store._rows, range)
+        style = ranged._table_style
+        assert style.extra_hline == listed._table_style.extra_hline
+        assert str(ranged) == str(listed)
+        assert ranged.build_latex() == listed.build_latex()
+
+    # Reversed rows drop the lines, and spans must still be in the view
+    assert table.view(rows=slice(2, 0, -1))._table_style.extra_hline == []
+    with pytest.raises(ValueError):
+        table.view(rows=slice(4, 6))
+    with pytest.raises(ValueError):
+        table.view(rows=slice(4, 2, -1))
+
+
+def test_views_of_views():
+    table = build_table()
+    view = table.view(rows=slice(1, 6, 2)).view(rows=[2, 3], cols=[2])
+    assert view.parent is table
+    assert [cell.generate_text() for cell in view.get_column(0)] == ["c", "x2", "x4"]
+
+
+def test_ignore_cols():
+    table = build_table()
+    table.add_table_label("tab:results")
+    assert table.build_latex(ignore_cols=[1]) == table.view(cols=[0, 2]).build_latex()
+    assert "tab:results" in table.build_latex(ignore_cols=[1])
+    with pytest.raises(ColumnDoesNotExist):
+        table.build_latex(ignore_cols=[3])
+
+
+def test_invalid_views():
+    table = build_table()
+    with pytest.raises(RowDoesNotExist):
+        table.view(rows=[7])
+    with pytest.raises(ColumnDoesNotExist):
+        table.view(cols=[3])
+
+    view = table.view(rows=slice(1, 3))
+    for method, args in (
+        (view.add_row, ([1, 2, 3],)),
+        (view.set_decimal_places, (1,)),
+        (view.sort_by, (0,)),
+    ):
+        with pytest.raises(TypeError):
+            method(*args)
+
+
+def test_view_has_the_state_of_a_table():
+    table = build_table()
+    view = table.view(rows=[1, 2])
+    assert set(vars(table)) <= set(vars(view))